@@ -10,6 +10,24 @@ from openai import OpenAI
 from tools import TOOLS, TOOL_FUNCTIONS
 from mcp_client import mcp_manager, get_mcp_tools, execute_mcp_tool
 
+# Tools that can't work through MCP because they require background_tasks or other FastAPI-specific parameters
+PROBLEMATIC_MCP_TOOLS = [
+    "agent-memory-server_search_long_term_memory",  # Requires background_tasks
+]
+
+
+def usable_mcp_tools(mcp_tools: List[Dict[str, Any]], log: bool = False) -> List[Dict[str, Any]]:
+    """Filter out MCP tools that are known to be broken."""
+    filtered_tools = []
+    for tool in mcp_tools:
+        tool_name = tool.get("function", {}).get("name", "")
+        if any(problematic in tool_name for problematic in PROBLEMATIC_MCP_TOOLS):
+            if log:
+                print(f"Filtering out problematic tool: {tool_name}")
+            continue
+        filtered_tools.append(tool)
+    return filtered_tools
+
 
 class ChatMessage:
     def __init__(self, role: str, content: str, tool_calls: Optional[List] = None, tool_call_id: Optional[str] = None):
@@ -91,14 +109,17 @@ Tool usage guidance:
   - `redis-dating_create_person`: Create a new person record (name required, all other fields optional)
   - `redis-dating_update_person`: Update existing person (name required, other fields optional for partial updates)
   - `redis-dating_get_person`: Get person by name
-  - `redis-dating_list_people`: List all people (optional filters: status, active_only)
+  - `redis-dating_get_people`: Get several people at once (`names` array; one result per name)
+  - `redis-dating_update_people`: Update several people at once (`updates` array of update_person arguments; one result per item)
+  - `redis-dating_list_people`: List all people (optional filters: status, active_only; optional `fields` to return only some fields, `limit`/`cursor` to page)
   - `redis-dating_search_people`: Search people by name (fuzzy matching)
   - `redis-dating_get_statistics`: Get dating statistics (counts, common meeting places, etc.)
   - `redis-dating_delete_person`: Delete a person record
 - **Low-Level Operations** (for advanced use):
   - `redis-dating_HSET`: Direct Redis HSET operation
   - `redis-dating_HGETALL`: Direct Redis HGETALL operation
-  - `redis-dating_KEYS`: Direct Redis KEYS operation
+  - `redis-dating_SCAN`: Page through keys matching a pattern (pass back `next_cursor` until `complete` is true)
+  - `redis-dating_KEYS`: One bounded page of keys matching a pattern (alias for SCAN from the start)
 - **Memory Integration - CRITICAL RULES**:
   - **When storing NEW INFORMATION about a person** (detected from statements, not questions):
     1. First, get or create the person record using `redis-dating_get_person` or `redis-dating_create_person`
@@ -176,25 +197,9 @@ General behavior:
         """Get all available tools (local + MCP)."""
         all_tools = TOOLS.copy()
 
-        # Get MCP tools
+        # Get MCP tools (served from the manager's tool catalogs)
         try:
-            mcp_tools = await get_mcp_tools()
-            
-            # Filter out problematic tools that require FastAPI dependencies
-            # These tools can't work through MCP because they require background_tasks or other FastAPI-specific parameters
-            problematic_tools = [
-                "agent-memory-server_search_long_term_memory",  # Requires background_tasks
-            ]
-            
-            filtered_tools = []
-            for tool in mcp_tools:
-                tool_name = tool.get("function", {}).get("name", "")
-                # Skip tools that are known to be broken
-                if any(problematic in tool_name for problematic in problematic_tools):
-                    print(f"Filtering out problematic tool: {tool_name}")
-                    continue
-                filtered_tools.append(tool)
-            
+            filtered_tools = usable_mcp_tools(await get_mcp_tools(), log=True)
             all_tools.extend(filtered_tools)
             self.mcp_tools_cache = filtered_tools
         except Exception as e:
@@ -445,10 +450,9 @@ General behavior:
         """Get list of available tool names."""
         tools = list(TOOL_FUNCTIONS.keys())
 
-        # Add MCP tools if available
-        if self.mcp_tools_cache:
-            for tool in self.mcp_tools_cache:
-                tools.append(tool["function"]["name"])
+        # Add MCP tools from the catalogs of connected servers
+        for tool in usable_mcp_tools(mcp_manager.cached_tools()):
+            tools.append(tool["function"]["name"])
 
         return tools
 
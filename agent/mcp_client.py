@@ -6,37 +6,143 @@ Model Context Protocol (MCP) servers running as external processes.
 """
 
 import asyncio
+import contextlib
+import contextvars
 import json
 import os
 import subprocess
 import sys
+import time
 from typing import Dict, List, Any, Optional, Union
 import logging
 
 # Try to import MCP - if not available, provide graceful degradation
 try:
+    import anyio
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.stdio import stdio_client
+    from mcp.shared.exceptions import McpError
+    from mcp.types import (
+        CancelledNotification, CancelledNotificationParams, ClientNotification, JSONRPCRequest,
+        ServerNotification, ToolListChangedNotification
+    )
+    try:
+        from mcp.types import CONNECTION_CLOSED
+    except ImportError:
+        # Older SDKs don't fail pending requests with an error of their own when the connection closes
+        CONNECTION_CLOSED = None
     MCP_AVAILABLE = True
 except ImportError:
     MCP_AVAILABLE = False
+    anyio = None
+    McpError = None
     ClientSession = None
     StdioServerParameters = None
     stdio_client = None
+    CancelledNotification = None
+    CancelledNotificationParams = None
+    ClientNotification = None
+    JSONRPCRequest = None
+    CONNECTION_CLOSED = None
+    ServerNotification = None
+    ToolListChangedNotification = None
     print("Warning: MCP not available. Install with: pip install mcp")
 
 logger = logging.getLogger(__name__)
 
+# Seconds a server's tool catalog is served from memory before list_tools is called again.
+# Catalogs are also refreshed on reconnect and when the server sends tools/list_changed.
+TOOL_CATALOG_TTL = float(os.getenv("MCP_TOOL_CATALOG_TTL", "300"))
+# Seconds tool discovery waits for a server (including its first connect) before reporting it
+# degraded and moving on; the connect or list_tools carries on in the background.
+# Overridden per server by "discovery_timeout" in mcp_servers.json.
+DISCOVERY_TIMEOUT = float(os.getenv("MCP_DISCOVERY_TIMEOUT", "5"))
+# Seconds a tool call may take (including any connect and queueing) when mcp_servers.json
+# gives the server no "timeout"; "tool_timeouts" there sets deadlines for single tools.
+CALL_TIMEOUT = float(os.getenv("MCP_CALL_TIMEOUT", "30"))
+# Consecutive failed or timed-out calls that open a server's circuit breaker, and the seconds
+# its calls then fail fast before one trial call is let through.
+BREAKER_FAILURES = int(os.getenv("MCP_BREAKER_FAILURES", "5"))
+BREAKER_COOLDOWN = float(os.getenv("MCP_BREAKER_COOLDOWN", "30"))
+# Seconds between the supervisor's health pings of every session (0 turns the supervisor off),
+# and how long a ping may take before its session is treated as lost.
+HEALTH_INTERVAL = float(os.getenv("MCP_HEALTH_INTERVAL", "15"))
+PING_TIMEOUT = float(os.getenv("MCP_PING_TIMEOUT", "5"))
+# Seconds before the supervisor retries restoring a server, doubling per failed attempt up to the max.
+RECONNECT_BACKOFF = float(os.getenv("MCP_RECONNECT_BACKOFF", "1"))
+RECONNECT_BACKOFF_MAX = float(os.getenv("MCP_RECONNECT_BACKOFF_MAX", "60"))
+
+# The tool call being sent from the current task, so RequestIdRecorder can note the id its request goes out with
+outgoing_call: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar("mcp_outgoing_call", default=None)
+
+
+def is_connection_lost(error: BaseException) -> bool:
+    """Whether an error from a session means its server process or pipe is gone."""
+    if isinstance(error, (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)):
+        return True
+    return isinstance(error, McpError) and error.error.code == CONNECTION_CLOSED
+
+
+class RequestIdRecorder:
+    """
+    A session's write stream, noting the JSON-RPC id of the first request each tool call sends.
+
+    Sends happen in the calling task, so the call is found through outgoing_call.
+    """
+
+    def __init__(self, stream: Any):
+        self.stream = stream
+
+    async def send(self, message: Any):
+        call = outgoing_call.get()
+        if call is not None and call.get("request_id") is None and isinstance(message.message.root, JSONRPCRequest):
+            call["request_id"] = message.message.root.id
+        await self.stream.send(message)
+
+    async def aclose(self):
+        await self.stream.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
 class MCPClientManager:
     """Manager for MCP server connections and tool execution."""
 
     def __init__(self):
         self.servers: Dict[str, Dict[str, Any]] = {}
-        self.sessions: Dict[str, Any] = {}
-        self.stdio_contexts: Dict[str, Any] = {}
+        # Per-server session pool, one server process per member:
+        # {"session", "stdio_context", "in_flight", "calls", "healthy"}
+        self.pools: Dict[str, List[Dict[str, Any]]] = {}
+        # Calls waiting for a pool slot, and the condition they wait on
+        self.queued: Dict[str, int] = {}
+        self.pool_conditions: Dict[str, asyncio.Condition] = {}
+        # Warm standby sessions per server, initialized but given no calls until one in the pool is lost
+        self.standbys: Dict[str, List[Dict[str, Any]]] = {}
+        # Servers the supervisor failed to restore: {"failures", "next_attempt", "last_error"}
+        self.repairs: Dict[str, Dict[str, Any]] = {}
+        self.supervisor_task: Optional[asyncio.Task] = None
+        self.supervisor_wakeup: Optional[asyncio.Event] = None
+        # Per-server tool catalog: {"tools": OpenAI function definitions, "idempotent": names of tools
+        # the server marks safe to repeat, "fetched_at": monotonic time}
+        self.tool_catalogs: Dict[str, Dict[str, Any]] = {}
+        # Monotonic time of each server's last tools/list_changed notification
+        self.tools_changed_at: Dict[str, float] = {}
+        # In-flight connects, so concurrent callers share one server process
+        self.pending_connects: Dict[str, asyncio.Future] = {}
+        # Outcome of each server's last discovery: {"status": "ok" | "degraded" | "failed", "error", "checked_at"}
+        self.discovery_status: Dict[str, Dict[str, Any]] = {}
+        # Per-server circuit breaker: {"state": "closed" | "open" | "half_open", "failures", "opened_at", "last_error"}
+        self.breakers: Dict[str, Dict[str, Any]] = {}
 
     def add_server(self, name: str, server_path: str, args: List[str] = None,
-                   env: Dict[str, str] = None, python_path: str = None, command: str = None):
+                   env: Dict[str, str] = None, python_path: str = None, command: str = None,
+                   discovery_timeout: float = None, pool_size: int = None, max_in_flight: int = None,
+                   timeout: float = None, tool_timeouts: Dict[str, float] = None, standby: int = None,
+                   cancel_on_timeout: bool = None):
         """
         Add an MCP server configuration.
 
@@ -47,6 +153,13 @@ class MCPClientManager:
             env: Environment variables for the server
             python_path: Python executable path (defaults to sys.executable) - deprecated, use command instead
             command: Command to run (e.g., 'python', 'node') - defaults to sys.executable
+            discovery_timeout: Seconds tool discovery waits for this server (defaults to DISCOVERY_TIMEOUT)
+            pool_size: Number of server processes to spawn (defaults to 1)
+            max_in_flight: Concurrent calls per process before callers queue (defaults to unlimited)
+            timeout: Seconds a tool call may take (defaults to CALL_TIMEOUT)
+            tool_timeouts: Seconds allowed for particular tools, by tool name
+            standby: Number of warm standby processes to keep (defaults to 0)
+            cancel_on_timeout: Send notifications/cancelled for calls past their deadline (defaults to False)
         """
         if not MCP_AVAILABLE:
             logger.warning(f"Cannot add server {name}: MCP not available")
@@ -65,6 +178,13 @@ class MCPClientManager:
             'args': args or [],
             'env': env or {},
             'command': exec_path,
+            'discovery_timeout': discovery_timeout,
+            'pool_size': max(1, int(pool_size or 1)),
+            'max_in_flight': max(0, int(max_in_flight or 0)),
+            'timeout': timeout,
+            'tool_timeouts': tool_timeouts or {},
+            'standby': max(0, int(standby or 0)),
+            'cancel_on_timeout': bool(cancel_on_timeout),
             'connected': False
         }
 
@@ -72,12 +192,23 @@ class MCPClientManager:
         """
         Connect to an MCP server by spawning the server process.
 
+        Concurrent calls for the same server share one connect, which carries
+        on even if a caller stops waiting for it.
+
         Args:
             name: Server identifier
 
         Returns:
             bool: True if connection successful
         """
+        pending = self.pending_connects.get(name)
+        if pending is None:
+            pending = asyncio.ensure_future(self._connect_server(name))
+            self.pending_connects[name] = pending
+            pending.add_done_callback(lambda _: self.pending_connects.pop(name, None))
+        return await asyncio.shield(pending)
+
+    async def _connect_server(self, name: str) -> bool:
         if not MCP_AVAILABLE:
             logger.error(f"Cannot connect to server {name}: MCP not available")
             return False
@@ -95,35 +226,34 @@ class MCPClientManager:
             return False
 
         try:
-            # Prepare server parameters to spawn the process
-            exec_command = server_config.get('command', sys.executable)
-            command = [exec_command, server_path] + server_config['args']
-            env = {**os.environ, **server_config['env']}
-            
-            logger.info(f"Starting MCP server: {' '.join(command)}")
-            
-            # Create stdio server parameters
-            server_params = StdioServerParameters(
-                command=command[0],  # Executable (python, node, etc.)
-                args=command[1:],     # Script path and args
-                env=env
+            server_params = self._server_params(name)
+            logger.info(f"Starting MCP server: {server_params.command} {' '.join(server_params.args)}")
+
+            # Spawn the pool's and standby processes side by side; the pool is usable if any of them started
+            size = server_config['pool_size']
+            results = await asyncio.gather(
+                *(self._open_session(name, server_params) for _ in range(size + server_config['standby'])),
+                return_exceptions=True
             )
-
-            # Create stdio client - this spawns the server process
-            stdio_context = stdio_client(server_params)
-            read_stream, write_stream = await stdio_context.__aenter__()
-            
-            # Create and enter the session context
-            session = ClientSession(read_stream, write_stream)
-            await session.__aenter__()
-
-            # Initialize the server connection
-            await session.initialize()
-
-            # Store both session and stdio context for cleanup
-            self.sessions[name] = session
-            self.stdio_contexts[name] = stdio_context
+            members = [result for result in results if isinstance(result, dict)]
+            failures = [result for result in results if not isinstance(result, dict)]
+            if not members:
+                raise failures[0]
+            if failures:
+                logger.warning(f"Started {len(members)} of {len(results)} sessions for server {name}: {failures[0]}")
+
+            # Swap in the new pool and standbys, then retire the old ones (after a reconnect)
+            old_members = self.pools.get(name, []) + self.standbys.get(name, [])
+            self.pools[name] = members[:size]
+            self.standbys[name] = members[size:]
             self.servers[name]['connected'] = True
+            await self._notify_pool(name, everyone=True)
+            for member in old_members:
+                await self._close_session(member)
+
+            # A new process may serve different tools, so fill the catalog afresh
+            self.tool_catalogs.pop(name, None)
+            await self.get_server_tools(name)
 
             logger.info(f"Successfully connected to MCP server: {name}")
             return True
@@ -134,39 +264,300 @@ class MCPClientManager:
             logger.debug(f"Full traceback: {traceback.format_exc()}")
             return False
 
-    async def disconnect_server(self, name: str):
-        """Disconnect from an MCP server and cleanup resources."""
-        import asyncio
+    def _server_params(self, name: str) -> Any:
+        """Parameters for spawning one of the server's processes."""
+        server_config = self.servers[name]
+        exec_command = server_config.get('command', sys.executable)
+        command = [exec_command, server_config['path']] + server_config['args']
+        env = {**os.environ, **server_config['env']}
+        return StdioServerParameters(
+            command=command[0],  # Executable (python, node, etc.)
+            args=command[1:],     # Script path and args
+            env=env
+        )
+
+    async def _open_session(self, name: str, server_params: Any) -> Dict[str, Any]:
+        """Spawn one server process and initialize a session on it, returning a pool member."""
+        # Create stdio client - this spawns the server process
+        member = {"session": None, "stdio_context": stdio_client(server_params),
+                  "in_flight": 0, "calls": 0, "healthy": True}
+        try:
+            read_stream, write_stream = await member["stdio_context"].__aenter__()
+
+            # Create and enter the session context
+            member["session"] = ClientSession(
+                read_stream, RequestIdRecorder(write_stream), message_handler=self._notification_handler(name)
+            )
+            await member["session"].__aenter__()
+
+            # Initialize the server connection
+            await member["session"].initialize()
+        except BaseException:
+            await self._close_session(member)
+            raise
+        return member
+
+    async def _close_session(self, member: Dict[str, Any]) -> List[str]:
+        """Close a pool member's session and stdio context, returning any errors."""
         errors = []
-        
-        # Close session
-        if name in self.sessions:
+        member["healthy"] = False
+        for label, context in (("session", member["session"]), ("stdio context", member["stdio_context"])):
+            if context is None:
+                continue
             try:
-                session = self.sessions[name]
-                await session.__aexit__(None, None, None)
-                del self.sessions[name]
+                await context.__aexit__(None, None, None)
             except (asyncio.CancelledError, RuntimeError) as e:
                 # Ignore cancellation errors during shutdown
                 if "cancel scope" not in str(e).lower():
-                    errors.append(f"Error closing session: {e}")
+                    errors.append(f"Error closing {label}: {e}")
             except Exception as e:
-                errors.append(f"Error closing session: {e}")
-                
-        # Close stdio context
-        if name in self.stdio_contexts:
+                errors.append(f"Error closing {label}: {e}")
+        return errors
+
+    def has_session(self, name: str) -> bool:
+        """Whether the server has a healthy session to take calls."""
+        return any(member["healthy"] for member in self.pools.get(name, []))
+
+    async def _notify_pool(self, name: str, everyone: bool = False):
+        """Wake calls queued on the server's pool (all of them when the pool itself changed)."""
+        condition = self.pool_conditions.get(name)
+        if condition is None:
+            return
+        async with condition:
+            if everyone:
+                condition.notify_all()
+            else:
+                condition.notify()
+
+    @contextlib.asynccontextmanager
+    async def pooled_session(self, name: str):
+        """
+        Hold a slot on the least-busy healthy session of the server's pool.
+
+        Callers queue while every session is at the server's max_in_flight.
+        A session whose process or pipe turns out to be gone is marked
+        unhealthy and gets no further calls.
+        """
+        limit = self.servers[name].get('max_in_flight', 0)
+        condition = self.pool_conditions.setdefault(name, asyncio.Condition())
+        member = None
+        async with condition:
+            self.queued[name] = self.queued.get(name, 0) + 1
             try:
-                stdio_context = self.stdio_contexts[name]
-                await stdio_context.__aexit__(None, None, None)
-                del self.stdio_contexts[name]
-            except (asyncio.CancelledError, RuntimeError) as e:
-                # Ignore cancellation errors during shutdown
-                if "cancel scope" not in str(e).lower():
-                    errors.append(f"Error closing stdio context: {e}")
-            except Exception as e:
-                errors.append(f"Error closing stdio context: {e}")
+                while True:
+                    healthy = [m for m in self.pools.get(name, []) if m["healthy"]]
+                    if not healthy:
+                        break
+                    candidate = min(healthy, key=lambda m: (m["in_flight"], m["calls"]))
+                    if not limit or candidate["in_flight"] < limit:
+                        member = candidate
+                        break
+                    await condition.wait()
+            finally:
+                self.queued[name] -= 1
+        if member is None:
+            raise ConnectionError(f"No healthy session for server {name}")
+
+        member["in_flight"] += 1
+        member["calls"] += 1
+        try:
+            yield member["session"]
+        except Exception as e:
+            if is_connection_lost(e):
+                self._mark_lost(name, member, e)
+            raise
+        finally:
+            member["in_flight"] -= 1
+            await self._notify_pool(name, everyone=not member["healthy"])
+
+    def _mark_lost(self, name: str, member: Dict[str, Any], error: BaseException):
+        """Take a session whose process or pipe is gone out of rotation, failing over to a warm standby."""
+        if not member["healthy"]:
+            return
+        member["healthy"] = False
+        logger.warning(f"Lost a session of server {name}: {error!r}")
+        pool = self.pools.get(name, [])
+        standbys = self.standbys.get(name, [])
+        if member in pool and standbys:
+            pool.append(standbys.pop(0))
+            logger.info(f"Promoted a warm standby session of server {name}")
+        if not self.has_session(name):
+            self.servers[name]['connected'] = False
+        # Let the supervisor replace it now rather than at its next round
+        if self.supervisor_wakeup is not None:
+            self.supervisor_wakeup.set()
+
+    def _repair_stats(self, name: str) -> Optional[Dict[str, Any]]:
+        """The supervisor's failed attempts to restore the server, if any."""
+        repair = self.repairs.get(name)
+        if repair is None:
+            return None
+        return {
+            "failures": repair["failures"],
+            "last_error": repair["last_error"],
+            "retry_in": max(0.0, repair["next_attempt"] - time.monotonic())
+        }
+
+    def start_supervisor(self):
+        """
+        Start the background supervisor (unless MCP_HEALTH_INTERVAL is 0).
+
+        Every HEALTH_INTERVAL seconds, and as soon as a session is lost, it
+        pings each connected server's sessions, retires the lost ones and
+        spawns replacements and warm standbys, backing off while that fails.
+        """
+        if HEALTH_INTERVAL <= 0 or (self.supervisor_task and not self.supervisor_task.done()):
+            return
+        self.supervisor_wakeup = asyncio.Event()
+        self.supervisor_task = asyncio.ensure_future(self._supervise())
+
+    async def stop_supervisor(self):
+        """Stop the background supervisor."""
+        task, self.supervisor_task = self.supervisor_task, None
+        self.supervisor_wakeup = None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _supervise(self):
+        while True:
+            # Sleep until the next round, a due retry or a lost session, whichever comes first
+            now = time.monotonic()
+            wait = min([HEALTH_INTERVAL] + [repair["next_attempt"] - now for repair in self.repairs.values()])
+            try:
+                await asyncio.wait_for(self.supervisor_wakeup.wait(), timeout=max(0.0, wait))
+            except asyncio.TimeoutError:
+                pass
+            self.supervisor_wakeup.clear()
+
+            names = list(self.pools)
+            results = await asyncio.gather(*(self.check_server(name) for name in names), return_exceptions=True)
+            for name, result in zip(names, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error supervising server {name}: {result}")
+
+    async def _ping(self, name: str, member: Dict[str, Any]):
+        try:
+            await asyncio.wait_for(member["session"].send_ping(), PING_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._mark_lost(name, member, TimeoutError(f"no ping response within {PING_TIMEOUT}s"))
+        except Exception as e:
+            self._mark_lost(name, member, e)
+
+    async def check_server(self, name: str):
+        """Ping the server's sessions, replace lost ones and top up its warm standbys."""
+        if name not in self.pools:
+            return
+        await asyncio.gather(*(
+            self._ping(name, member)
+            for member in self.pools[name] + self.standbys.get(name, []) if member["healthy"]
+        ))
+        if name not in self.pools:
+            # Disconnected meanwhile
+            return
+
+        # Retire lost sessions once their last calls have failed; they are closed after
+        # the replacements are up, as a hung process can take seconds to terminate
+        pool, standbys = self.pools[name], self.standbys.setdefault(name, [])
+        retired = [member for member in pool if not member["healthy"] and not member["in_flight"]]
+        retired += [member for member in standbys if not member["healthy"]]
+        pool[:] = [member for member in pool if member["healthy"] or member["in_flight"]]
+        standbys[:] = [member for member in standbys if member["healthy"]]
+        try:
+            await self._restore_server(name)
+        finally:
+            for member in retired:
+                await self._close_session(member)
+
+    async def _restore_server(self, name: str):
+        """Spawn the sessions the server's pool and standbys are short of, backing off while that fails."""
+        config, pool, standbys = self.servers[name], self.pools[name], self.standbys[name]
+        healthy = sum(1 for member in pool if member["healthy"])
+        missing = config['pool_size'] - healthy + config['standby'] - len(standbys)
+        repair = self.repairs.get(name)
+        if missing <= 0:
+            self.repairs.pop(name, None)
+            return
+        if repair and time.monotonic() < repair["next_attempt"]:
+            return
+
+        if not healthy:
+            # Nothing left to serve calls: respawn the whole pool, sharing any connect a call already started
+            error = None if await self.connect_server(name) else "connect failed"
+        else:
+            server_params = self._server_params(name)
+            results = await asyncio.gather(
+                *(self._open_session(name, server_params) for _ in range(missing)),
+                return_exceptions=True
+            )
+            error = next((str(result) or repr(result) for result in results if not isinstance(result, dict)), None)
+            for member in results:
+                if isinstance(member, dict):
+                    await self._place_session(name, member)
+            await self._notify_pool(name, everyone=True)
+
+        if name not in self.pools:
+            # Disconnected meanwhile
+            return
+        if error is None:
+            if repair:
+                logger.info(f"Restored server {name} after {repair['failures']} failed attempts")
+            self.repairs.pop(name, None)
+        else:
+            failures = (repair or {}).get("failures", 0) + 1
+            delay = min(RECONNECT_BACKOFF * 2 ** (failures - 1), RECONNECT_BACKOFF_MAX)
+            self.repairs[name] = {"failures": failures, "next_attempt": time.monotonic() + delay, "last_error": error}
+            logger.warning(f"Could not restore server {name} (attempt {failures}), retrying in {delay:.0f}s: {error}")
+
+    async def _place_session(self, name: str, member: Dict[str, Any]):
+        """Put a freshly spawned session where it is needed: the pool, then the standbys, else close it."""
+        config = self.servers.get(name)
+        pool, standbys = self.pools.get(name), self.standbys.get(name)
+        if config is None or pool is None or standbys is None:
+            await self._close_session(member)
+        elif sum(1 for m in pool if m["healthy"]) < config['pool_size']:
+            pool.append(member)
+            config['connected'] = True
+        elif len(standbys) < config['standby']:
+            standbys.append(member)
+        else:
+            await self._close_session(member)
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-server pool size, health, in-flight calls, queue depth, standbys and reconnect backoff."""
+        return {
+            name: {
+                "size": len(members),
+                "healthy": sum(1 for member in members if member["healthy"]),
+                "in_flight": sum(member["in_flight"] for member in members),
+                "queued": self.queued.get(name, 0),
+                "standby": sum(1 for member in self.standbys.get(name, []) if member["healthy"]),
+                "reconnect": self._repair_stats(name),
+                "sessions": [
+                    {key: member[key] for key in ("healthy", "in_flight", "calls")}
+                    for member in members
+                ]
+            }
+            for name, members in self.pools.items()
+        }
+
+    async def disconnect_server(self, name: str):
+        """Disconnect from an MCP server and cleanup resources."""
+        errors = []
+        
+        # Close every session in the pool, and the standbys
+        for member in self.pools.pop(name, []) + self.standbys.pop(name, []):
+            errors.extend(await self._close_session(member))
+        self.repairs.pop(name, None)
+        await self._notify_pool(name, everyone=True)
         
         if name in self.servers:
             self.servers[name]['connected'] = False
+        self.tool_catalogs.pop(name, None)
             
         if errors:
             error_msg = f"Errors disconnecting from server {name}: {'; '.join(errors)}"
@@ -174,90 +565,221 @@ class MCPClientManager:
         else:
             logger.info(f"Successfully disconnected from MCP server: {name}")
 
-    async def get_server_tools(self, name: str) -> List[Dict[str, Any]]:
+    def _notification_handler(self, name: str):
+        """Session message handler that drops the server's tool catalog on tools/list_changed."""
+        async def handle(message):
+            if isinstance(message, ServerNotification) and isinstance(message.root, ToolListChangedNotification):
+                logger.info(f"Tool list changed on server {name}")
+                # Refetched lazily: list_tools can't be awaited from the session's receive loop
+                self.tools_changed_at[name] = time.monotonic()
+                self.tool_catalogs.pop(name, None)
+        return handle
+
+    def cached_tools(self) -> List[Dict[str, Any]]:
+        """All tools in the current catalogs, without contacting any server."""
+        return [tool for catalog in self.tool_catalogs.values() for tool in catalog["tools"]]
+
+    async def get_server_tools(self, name: str, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get available tools from an MCP server.
 
+        Served from the server's tool catalog while it is younger than
+        TOOL_CATALOG_TTL; otherwise (or with refresh) list_tools is called.
+
         Args:
             name: Server identifier
+            refresh: Bypass the catalog
 
         Returns:
             List of tool definitions
         """
-        if name not in self.sessions:
+        try:
+            return await self.fetch_tools(name, refresh)
+        except Exception as e:
+            logger.error(f"Error getting tools from server {name}: {e}")
+            return []
+
+    async def fetch_tools(self, name: str, refresh: bool = False) -> List[Dict[str, Any]]:
+        """get_server_tools, raising on connect or list_tools failures instead of returning []."""
+        catalog = self.tool_catalogs.get(name)
+        if catalog and not refresh and self.has_session(name) and time.monotonic() - catalog["fetched_at"] < TOOL_CATALOG_TTL:
+            return list(catalog["tools"])
+
+        if not self.has_session(name):
+            # Connecting fills the catalog
             if not await self.connect_server(name):
-                return []
+                raise ConnectionError(f"Could not connect to server {name}")
+            if name in self.tool_catalogs:
+                return list(self.tool_catalogs[name]["tools"])
 
-        try:
-            session = self.sessions[name]
+        fetched_at = time.monotonic()
+        async with self.pooled_session(name) as session:
             tools_response = await session.list_tools()
 
-            # Convert MCP tools to OpenAI function format
-            openai_tools = []
-            for tool in tools_response.tools:
-                openai_tool = {
-                    "type": "function",
-                    "function": {
-                        "name": f"{name}_{tool.name}",  # Prefix with server name
-                        "description": tool.description,
-                        "parameters": tool.inputSchema or {
-                            "type": "object",
-                            "properties": {}
-                        }
+        # Convert MCP tools to OpenAI function format
+        openai_tools = []
+        idempotent = set()
+        for tool in tools_response.tools:
+            if tool.annotations and (tool.annotations.readOnlyHint or tool.annotations.idempotentHint):
+                idempotent.add(tool.name)
+            openai_tool = {
+                "type": "function",
+                "function": {
+                    "name": f"{name}_{tool.name}",  # Prefix with server name
+                    "description": tool.description,
+                    "parameters": tool.inputSchema or {
+                        "type": "object",
+                        "properties": {}
                     }
                 }
-                openai_tools.append(openai_tool)
+            }
+            openai_tools.append(openai_tool)
 
-            return openai_tools
+        # Not cached if the list changed while it was being fetched
+        if self.tools_changed_at.get(name, float("-inf")) < fetched_at:
+            self.tool_catalogs[name] = {"tools": openai_tools, "idempotent": idempotent, "fetched_at": fetched_at}
+        return list(openai_tools)
 
-        except Exception as e:
-            logger.error(f"Error getting tools from server {name}: {e}")
-            return []
+    async def discover_tools(self, name: str, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get a server's tools within its discovery deadline, connecting it first if needed.
+
+        A server that misses the deadline is reported degraded with the tools
+        of its last catalog (if any) while the connect or list_tools goes on
+        in the background, so the next discovery usually finds it ready.
+
+        Returns:
+            {"status": "ok" | "degraded" | "failed", "tools": [...], "error": ... (unless ok)}
+        """
+        timeout = (self.servers.get(name) or {}).get('discovery_timeout') or DISCOVERY_TIMEOUT
+        fetch = asyncio.ensure_future(self.fetch_tools(name, refresh))
+        done, _ = await asyncio.wait({fetch}, timeout=timeout)
+        if fetch in done and fetch.exception() is None:
+            status = {"status": "ok"}
+            tools = fetch.result()
+        elif fetch in done:
+            status = {"status": "failed", "error": str(fetch.exception())}
+            tools = []
+        else:
+            def log_failure(task):
+                # Retrieve the background outcome so a failure is logged, not left unobserved
+                if not task.cancelled() and task.exception() is not None:
+                    logger.error(f"Error getting tools from server {name}: {task.exception()}")
+
+            fetch.add_done_callback(log_failure)
+            status = {"status": "degraded", "error": f"No tools within {timeout}s"}
+            catalog = self.tool_catalogs.get(name)
+            tools = list(catalog["tools"]) if catalog else []
+        if status["status"] != "ok":
+            logger.warning(f"MCP server {name} {status['status']}: {status['error']}")
+        self.discovery_status[name] = {**status, "checked_at": time.time()}
+        return {**status, "tools": tools}
+
+    def call_timeout(self, name: str, tool_name: str) -> float:
+        """Deadline in seconds for a call to the tool: its own, else the server's, else CALL_TIMEOUT."""
+        config = self.servers.get(name) or {}
+        return config.get('tool_timeouts', {}).get(tool_name) or config.get('timeout') or CALL_TIMEOUT
+
+    def _breaker_rejects(self, name: str) -> Optional[str]:
+        """
+        Why a call to the server must fail fast, or None if it may go ahead.
+
+        Once an open breaker's cool-down is over, the next call goes ahead as
+        the trial call and the breaker is half-open until it finishes.
+        """
+        breaker = self.breakers.get(name)
+        if breaker is None or breaker["state"] == "closed":
+            return None
+        if breaker["state"] == "half_open":
+            return f"Server {name} is unavailable; a trial call is in progress"
+        remaining = breaker["opened_at"] + BREAKER_COOLDOWN - time.monotonic()
+        if remaining <= 0:
+            breaker["state"] = "half_open"
+            return None
+        return (f"Server {name} is unavailable after {breaker['failures']} failed calls "
+                f"({breaker['last_error']}); retrying in {remaining:.0f}s")
+
+    def _record_call(self, name: str, error: Optional[str] = None):
+        """Feed a call's outcome to the server's breaker; error is set for failures and timeouts."""
+        breaker = self.breakers.setdefault(
+            name, {"state": "closed", "failures": 0, "opened_at": None, "last_error": None}
+        )
+        if error is None:
+            if breaker["state"] != "closed":
+                logger.info(f"Circuit breaker for server {name} closed")
+            breaker.update(state="closed", failures=0, opened_at=None, last_error=None)
+            return
+
+        breaker["failures"] += 1
+        breaker["last_error"] = error
+        if breaker["state"] == "half_open" or breaker["failures"] >= BREAKER_FAILURES:
+            if breaker["state"] != "open":
+                logger.warning(f"Circuit breaker for server {name} opened for {BREAKER_COOLDOWN}s: {error}")
+            breaker.update(state="open", opened_at=time.monotonic())
+
+    def _release_trial(self, name: str):
+        """End a half-open breaker's trial call without a verdict, so the next call is the trial."""
+        breaker = self.breakers.get(name)
+        if breaker and breaker["state"] == "half_open":
+            breaker["state"] = "open"
+
+    def breaker_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-server breaker state, consecutive failures, last error and seconds until the next trial call."""
+        now = time.monotonic()
+        return {
+            name: {
+                "state": breaker["state"],
+                "failures": breaker["failures"],
+                "last_error": breaker["last_error"],
+                "retry_in": max(0.0, breaker["opened_at"] + BREAKER_COOLDOWN - now) if breaker["state"] == "open" else 0.0
+            }
+            for name, breaker in self.breakers.items()
+        }
 
     async def call_tool(self, server_name: str, tool_name: str,
-                       arguments: Dict[str, Any]) -> Dict[str, Any]:
+                       arguments: Dict[str, Any], timeout: float = None) -> Dict[str, Any]:
         """
         Call a tool on an MCP server.
 
+        A call to a tool the server marks read-only or idempotent is sent
+        once more, to another session, if its session turns out to be lost.
+        The call is abandoned at its deadline, and servers configured with
+        cancel_on_timeout are told to stop working on it. Timeouts and lost
+        connections count towards the server's circuit breaker; while it is
+        open, calls fail at once.
+
         Args:
             server_name: Server identifier
             tool_name: Tool name (without server prefix)
             arguments: Tool arguments
+            timeout: Seconds to wait (defaults to call_timeout)
 
         Returns:
-            Tool execution result
+            Tool execution result, with "timed_out" or "circuit_open" set on those errors
         """
-        if server_name not in self.sessions:
-            if not await self.connect_server(server_name):
-                return {"error": f"Could not connect to server {server_name}"}
+        rejection = self._breaker_rejects(server_name)
+        if rejection:
+            return {"error": rejection, "circuit_open": True}
 
+        timeout = timeout or self.call_timeout(server_name, tool_name)
         try:
-            session = self.sessions[server_name]
-            result = await session.call_tool(tool_name, arguments)
-
-            # Extract text content from MCP result
-            if hasattr(result, 'content') and result.content:
-                content_text = ""
-                for content in result.content:
-                    if hasattr(content, 'text'):
-                        content_text += content.text
-                    elif isinstance(content, str):
-                        content_text += content
-
-                return {
-                    "success": True,
-                    "result": content_text,
-                    "raw_result": result
-                }
-            else:
-                return {
-                    "success": True,
-                    "result": str(result),
-                    "raw_result": result
-                }
-
+            result = await asyncio.wait_for(self._send_tool_call(server_name, tool_name, arguments), timeout)
+        except asyncio.TimeoutError:
+            error_msg = f"Tool {tool_name} on server {server_name} timed out after {timeout}s"
+            logger.error(error_msg)
+            self._record_call(server_name, error_msg)
+            return {"error": error_msg, "timed_out": True}
+        except asyncio.CancelledError:
+            # An abandoned trial call proves nothing; let the next call try
+            self._release_trial(server_name)
+            raise
         except Exception as e:
             error_msg = str(e)
+            if isinstance(e, ConnectionError) or is_connection_lost(e):
+                self._record_call(server_name, error_msg)
+            else:
+                # An error the server answered with neither counts against it nor closes the breaker
+                self._release_trial(server_name)
             # Check if this is the background_tasks error
             if "background_tasks" in error_msg:
                 logger.warning(f"Tool {tool_name} on server {server_name} requires FastAPI background_tasks which is not available via MCP. This tool cannot be used.")
@@ -269,15 +791,90 @@ class MCPClientManager:
             logger.error(f"Error calling tool {tool_name} on server {server_name}: {e}")
             return {"error": error_msg}
 
+        if getattr(result, "isError", False):
+            self._release_trial(server_name)
+        else:
+            self._record_call(server_name)
+
+        # Extract text content from MCP result
+        if hasattr(result, 'content') and result.content:
+            content_text = ""
+            for content in result.content:
+                if hasattr(content, 'text'):
+                    content_text += content.text
+                elif isinstance(content, str):
+                    content_text += content
+
+            return {
+                "success": True,
+                "result": content_text,
+                "raw_result": result
+            }
+        else:
+            return {
+                "success": True,
+                "result": str(result),
+                "raw_result": result
+            }
+
+    def is_idempotent(self, name: str, tool_name: str) -> bool:
+        """Whether the server's tool catalog marks the tool safe to call again."""
+        catalog = self.tool_catalogs.get(name)
+        return bool(catalog) and tool_name in catalog["idempotent"]
+
+    async def _send_tool_call(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Call the tool, retrying an idempotent call once on another session if its session was lost."""
+        try:
+            return await self._dispatch_tool_call(server_name, tool_name, arguments)
+        except Exception as e:
+            if not (is_connection_lost(e) and self.is_idempotent(server_name, tool_name)):
+                raise
+            # The lost session is out of rotation and a standby promoted, so this goes elsewhere
+            logger.info(f"Retrying {tool_name} on server {server_name} after losing its session: {e!r}")
+            return await self._dispatch_tool_call(server_name, tool_name, arguments)
+
+    async def _dispatch_tool_call(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Connect if needed and call the tool on a pooled session, cancelling it on the server if abandoned."""
+        if not self.has_session(server_name):
+            if not await self.connect_server(server_name):
+                raise ConnectionError(f"Could not connect to server {server_name}")
+
+        # Routed to the least-busy healthy process in the server's pool
+        async with self.pooled_session(server_name) as session:
+            call = {"request_id": None}
+            outgoing_call.set(call)
+            try:
+                return await session.call_tool(tool_name, arguments)
+            except asyncio.CancelledError:
+                # Off by default: servers on mcp 1.x can crash when a cancellation races the
+                # tool's response ("Request already responded to"), losing every call on them
+                if self.servers[server_name].get('cancel_on_timeout') and call["request_id"] is not None:
+                    await self._cancel_request(session, call["request_id"], f"{tool_name} call abandoned by the client")
+                raise
+            finally:
+                outgoing_call.set(None)
+
+    async def _cancel_request(self, session: Any, request_id: int, reason: str):
+        """Send notifications/cancelled so the server stops working on an abandoned request."""
+        try:
+            await session.send_notification(ClientNotification(CancelledNotification(
+                params=CancelledNotificationParams(requestId=request_id, reason=reason)
+            )))
+        except Exception as e:
+            logger.debug(f"Could not cancel request {request_id}: {e}")
+
     async def disconnect_all(self):
         """Disconnect from all MCP servers."""
-        for name in list(self.sessions.keys()):
+        for name in list(self.pools.keys()):
             await self.disconnect_server(name)
 
 # Global MCP client manager instance
 mcp_manager = MCPClientManager()
 
-def setup_mcp_server(name: str, server_path: str, env_vars: Dict[str, str] = None, python_path: str = None, command: str = None, args: List[str] = None):
+def setup_mcp_server(name: str, server_path: str, env_vars: Dict[str, str] = None, python_path: str = None, command: str = None, args: List[str] = None,
+                     discovery_timeout: float = None, pool_size: int = None, max_in_flight: int = None,
+                     timeout: float = None, tool_timeouts: Dict[str, float] = None, standby: int = None,
+                     cancel_on_timeout: bool = None):
     """
     Setup an MCP server for spawning.
 
@@ -288,6 +885,13 @@ def setup_mcp_server(name: str, server_path: str, env_vars: Dict[str, str] = Non
         python_path: Python executable path (deprecated, use command instead)
         command: Command to run (e.g., 'python', 'node')
         args: Additional arguments for the server
+        discovery_timeout: Seconds tool discovery waits for the server
+        pool_size: Number of server processes to spawn
+        max_in_flight: Concurrent calls per process before callers queue
+        timeout: Seconds a tool call may take
+        tool_timeouts: Seconds allowed for particular tools, by tool name
+        standby: Number of warm standby processes to keep
+        cancel_on_timeout: Send notifications/cancelled for calls past their deadline
     """
     logger.info(f"Setting up MCP server '{name}' at path: {server_path}")
     
@@ -309,7 +913,14 @@ def setup_mcp_server(name: str, server_path: str, env_vars: Dict[str, str] = Non
         server_path=server_path,
         args=args or [],
         env=env,
-        command=command or python_path
+        command=command or python_path,
+        discovery_timeout=discovery_timeout,
+        pool_size=pool_size,
+        max_in_flight=max_in_flight,
+        timeout=timeout,
+        tool_timeouts=tool_timeouts,
+        standby=standby,
+        cancel_on_timeout=cancel_on_timeout
     )
     
     logger.info(f"MCP server '{name}' configured")
@@ -330,22 +941,29 @@ def setup_localmcp_server(server_path: str, env_vars: Dict[str, str] = None):
     return setup_mcp_server("localmcp", server_path, default_env)
 
 async def get_mcp_tools() -> List[Dict[str, Any]]:
-    """Get all available MCP tools in OpenAI function format."""
+    """
+    Get all available MCP tools in OpenAI function format.
+
+    Servers are asked concurrently, each within its discovery deadline, so a
+    slow or failed server is left out (see mcp_manager.discovery_status)
+    instead of holding up the caller.
+    """
     all_tools = []
 
-    for server_name in mcp_manager.servers:
-        tools = await mcp_manager.get_server_tools(server_name)
-        all_tools.extend(tools)
+    results = await asyncio.gather(*(mcp_manager.discover_tools(server_name) for server_name in list(mcp_manager.servers)))
+    for result in results:
+        all_tools.extend(result["tools"])
 
     return all_tools
 
-async def execute_mcp_tool(function_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+async def execute_mcp_tool(function_name: str, arguments: Dict[str, Any], timeout: float = None) -> Dict[str, Any]:
     """
     Execute an MCP tool by function name.
 
     Args:
         function_name: Function name (format: servername_toolname)
         arguments: Tool arguments
+        timeout: Seconds to wait (defaults to the tool's configured deadline)
 
     Returns:
         Tool execution result
@@ -358,9 +976,10 @@ async def execute_mcp_tool(function_name: str, arguments: Dict[str, Any]) -> Dic
     server_name = parts[0]
     tool_name = parts[1]
 
-    return await mcp_manager.call_tool(server_name, tool_name, arguments)
+    return await mcp_manager.call_tool(server_name, tool_name, arguments, timeout=timeout)
 
 # Cleanup function for graceful shutdown
 async def cleanup_mcp():
     """Cleanup MCP connections."""
+    await mcp_manager.stop_supervisor()
     await mcp_manager.disconnect_all()
@@ -2,6 +2,7 @@
 FastAPI server for the Python agent.
 """
 import os
+import asyncio
 import json
 import uuid
 from contextlib import asynccontextmanager
@@ -29,42 +30,56 @@ async def lifespan(app: FastAPI):
     if status["valid_servers"]:
         print(f"🔌 MCP servers available: {', '.join(status['valid_servers'])}")
         
-        # Eagerly connect to all enabled MCP servers
+        # Eagerly connect to all enabled MCP servers, concurrently
         print("🔄 Pre-connecting to enabled MCP servers...")
         enabled_servers = get_enabled_servers()
         
-        for server_name, config in enabled_servers.items():
-            if is_server_configured(server_name):
-                try:
-                    print(f"   Connecting to {server_name}...")
-                    
-                    # Setup the server configuration if not already done
-                    if server_name not in mcp_manager.servers:
-                        success = setup_mcp_server(
-                            server_name, 
-                            config["path"], 
-                            config.get("env_vars"),
-                            command=config.get("command"),
-                            args=config.get("args", [])
-                        )
-                        if not success:
-                            print(f"   ❌ Failed to setup {server_name}")
-                            continue
+        async def preconnect(server_name: str, config: Dict[str, Any]):
+            try:
+                print(f"   Connecting to {server_name}...")
+                
+                # Setup the server configuration if not already done
+                if server_name not in mcp_manager.servers:
+                    success = setup_mcp_server(
+                        server_name, 
+                        config["path"], 
+                        config.get("env_vars"),
+                        command=config.get("command"),
+                        args=config.get("args", []),
+                        discovery_timeout=config.get("discovery_timeout"),
+                        pool_size=config.get("pool_size"),
+                        max_in_flight=config.get("max_in_flight"),
+                        timeout=config.get("timeout"),
+                        tool_timeouts=config.get("tool_timeouts"),
+                        standby=config.get("standby"),
+                        cancel_on_timeout=config.get("cancel_on_timeout")
+                    )
+                    if not success:
+                        print(f"   ❌ Failed to setup {server_name}")
+                        return
+                
+                # Attempt connection, waiting at most the server's discovery deadline
+                discovery = await mcp_manager.discover_tools(server_name)
+                if discovery["status"] == "ok":
+                    print(f"   ✅ Connected to {server_name} ({len(discovery['tools'])} tools)")
+                elif discovery["status"] == "degraded":
+                    print(f"   ⏳ {server_name} is slow to start; still connecting in the background")
+                else:
+                    print(f"   ❌ Failed to connect to {server_name}")
                     
-                    # Attempt connection
-                    connected = await mcp_manager.connect_server(server_name)
-                    if connected:
-                        # Get tool count for feedback
-                        tools = await mcp_manager.get_server_tools(server_name)
-                        tool_count = len(tools)
-                        print(f"   ✅ Connected to {server_name} ({tool_count} tools)")
-                    else:
-                        print(f"   ❌ Failed to connect to {server_name}")
-                        
-                except Exception as e:
-                    print(f"   ❌ Error connecting to {server_name}: {str(e)}")
+            except Exception as e:
+                print(f"   ❌ Error connecting to {server_name}: {str(e)}")
+        
+        await asyncio.gather(*(
+            preconnect(server_name, config)
+            for server_name, config in enabled_servers.items()
+            if is_server_configured(server_name)
+        ))
                     
         print("🔌 MCP server initialization complete")
+        
+        # Keep the connected servers healthy: pings, reconnects and warm standbys
+        mcp_manager.start_supervisor()
     else:
         print("⚠️  No MCP servers configured")
         print("   Run: python setup_mcp.py to configure MCP servers")
@@ -120,7 +135,14 @@ def initialize_mcp_servers(agent_instance: PythonAgent):
                     config["path"],
                     config.get("env_vars", {}),
                     command=config.get("command"),
-                    args=config.get("args", [])
+                    args=config.get("args", []),
+                    discovery_timeout=config.get("discovery_timeout"),
+                    pool_size=config.get("pool_size"),
+                    max_in_flight=config.get("max_in_flight"),
+                    timeout=config.get("timeout"),
+                    tool_timeouts=config.get("tool_timeouts"),
+                    standby=config.get("standby"),
+                    cancel_on_timeout=config.get("cancel_on_timeout")
                 )
                 if success:
                     print(f"✅ MCP server {server_name} configured")
@@ -180,7 +202,8 @@ async def generate_welcome_message() -> str:
         # Get active people
         active_result = await execute_mcp_tool("redis-dating_list_people", {
             "active_only": True,
-            "include_details": False
+            "include_details": False,
+            "fields": ["name", "start_date"]
         })
         
         active_people = []
@@ -326,7 +349,13 @@ async def get_mcp_status():
             "enabled_servers": list(enabled_servers.keys()),
             "valid_servers": status["valid_servers"],
             "invalid_servers": status["invalid_servers"],
-            "warnings": status["warnings"]
+            "warnings": status["warnings"],
+            # Outcome of each server's last tool discovery (ok, degraded or failed)
+            "discovery": mcp_manager.discovery_status,
+            # Per-server session pools: size, healthy sessions, in-flight calls and queue depth
+            "pools": mcp_manager.pool_stats(),
+            # Per-server circuit breakers: state, consecutive failures and seconds until the next trial call
+            "circuit_breakers": mcp_manager.breaker_stats()
         }
     except Exception as e:
         return {
@@ -335,12 +364,22 @@ async def get_mcp_status():
         }
 
 @app.get("/mcp/tools")
-async def get_mcp_tools():
+async def get_mcp_tools(refresh: bool = Query(False, description="Refetch tool catalogs instead of serving them from memory")):
     """Get all available MCP tools from all connected servers."""
     try:
         from mcp_config import MCP_SERVERS
         all_tools = {}
         
+        # Ask every set-up server at once, each within its discovery deadline
+        discoverable = [
+            server_name for server_name, config in MCP_SERVERS.items()
+            if config.get("enabled", False) and server_name in mcp_manager.servers
+        ]
+        discoveries = dict(zip(discoverable, await asyncio.gather(
+            *(mcp_manager.discover_tools(server_name, refresh=refresh) for server_name in discoverable),
+            return_exceptions=True
+        )))
+        
         # Check all servers, not just enabled ones, to show disabled state
         for server_name, config in MCP_SERVERS.items():
             # Skip if disabled
@@ -354,11 +393,14 @@ async def get_mcp_tools():
                 continue
             try:
                 # Check if server is connected
-                if server_name in mcp_manager.servers:
-                    tools = await mcp_manager.get_server_tools(server_name)
+                if server_name in discoveries:
+                    discovery = discoveries[server_name]
+                    if isinstance(discovery, Exception):
+                        raise discovery
                     all_tools[server_name] = {
                         "description": config.get("description", ""),
-                        "status": "connected",
+                        # Degraded servers missed their discovery deadline and show their last known tools
+                        "status": {"ok": "connected", "degraded": "degraded"}.get(discovery["status"], "error"),
                         "enabled": True,
                         "tools": [
                             {
@@ -366,9 +408,11 @@ async def get_mcp_tools():
                                 "description": tool["function"].get("description", ""),
                                 "parameters": tool["function"].get("parameters", {})
                             }
-                            for tool in tools
+                            for tool in discovery["tools"]
                         ]
                     }
+                    if "error" in discovery:
+                        all_tools[server_name]["error"] = discovery["error"]
                 else:
                     all_tools[server_name] = {
                         "description": config.get("description", ""),
@@ -468,7 +512,14 @@ async def connect_mcp_server(server_name: str):
                 config["path"],
                 config.get("env_vars", {}),
                 command=config.get("command"),
-                args=config.get("args", [])
+                args=config.get("args", []),
+                discovery_timeout=config.get("discovery_timeout"),
+                pool_size=config.get("pool_size"),
+                max_in_flight=config.get("max_in_flight"),
+                timeout=config.get("timeout"),
+                tool_timeouts=config.get("tool_timeouts"),
+                standby=config.get("standby"),
+                cancel_on_timeout=config.get("cancel_on_timeout")
             )
             if not success:
                 raise HTTPException(
@@ -515,17 +566,16 @@ async def generate_person_summary(person: Dict[str, Any]) -> str:
         
         # Query memories from agent-memory-server using the correct tool name
         memories_text = ""
-        try:
-            # Use search_long_term_memory with text parameter (the actual tool name)
-            result = await execute_mcp_tool(
-                "agent-memory-server_search_long_term_memory", 
-                {"text": memory_tags, "limit": 5}
-            )
-            if result.get("success") and result.get("result"):
-                memories_text = result["result"]
-        except Exception as e:
-            # Silently fail - memories are optional
-            pass
+        # Use search_long_term_memory with text parameter (the actual tool name)
+        result = await execute_mcp_tool(
+            "agent-memory-server_search_long_term_memory", 
+            {"text": memory_tags, "limit": 5}
+        )
+        if result.get("success") and result.get("result"):
+            memories_text = result["result"]
+        elif not result.get("success"):
+            # Memories are optional
+            print(f"⚠️  No memories for summary of {person.get('name')}: {result.get('error')}")
         
         # If we got memories, generate a brief summary
         if memories_text and len(memories_text.strip()) > 0:
@@ -642,11 +692,15 @@ async def fetch_person_record(name: str) -> Dict[str, Any]:
         return hydrate_person(person_data)
     raise HTTPException(status_code=404, detail=f"Person '{name}' not found")
 
-async def list_people_records(active_only: bool = False) -> List[Dict[str, Any]]:
+async def list_people_records(active_only: bool = False,
+                              fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """List people, optionally projected to `fields` so only those are read and sent."""
     from mcp_client import execute_mcp_tool
     args: Dict[str, Any] = {"include_details": False}
     if active_only:
         args["active_only"] = True
+    if fields:
+        args["fields"] = fields
     result = await execute_mcp_tool("redis-dating_list_people", args)
     people: List[Dict[str, Any]] = []
     if result.get("success") and result.get("result"):
@@ -657,6 +711,44 @@ async def list_people_records(active_only: bool = False) -> List[Dict[str, Any]]
             people = payload
     return [hydrate_person(person) for person in people]
 
+# redis-dating_query_dates files a date whose `when` doesn't parse at this time
+UNPARSED_WHEN = "1970-01-01T00:00:00Z"
+
+async def query_date_entries(args: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Run redis-dating_query_dates and return (entries, next_cursor)."""
+    from mcp_client import execute_mcp_tool
+    result = await execute_mcp_tool("redis-dating_query_dates", args)
+    if result.get("success") and result.get("result"):
+        payload = extract_json_chunk(result["result"])
+        if isinstance(payload, dict):
+            if payload.get("success") is False:
+                raise HTTPException(status_code=400, detail=payload.get("error", "Invalid date query"))
+            return payload.get("data", []), payload.get("next_cursor")
+    raise HTTPException(status_code=500, detail=result.get("error", "Failed to query dates"))
+
+async def query_all_date_entries(args: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Page through redis-dating_query_dates from args["cursor"] (if any) to the end."""
+    args = {**args, "limit": 1000}
+    entries: List[Dict[str, Any]] = []
+    while True:
+        page, next_cursor = await query_date_entries(args)
+        entries.extend(page)
+        if not next_cursor:
+            return entries
+        args["cursor"] = next_cursor
+
+async def run_date_tool(tool_name: str, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Call one of the atomic redis-dating date tools and return the affected entry."""
+    from mcp_client import execute_mcp_tool
+    result = await execute_mcp_tool(f"redis-dating_{tool_name}", args)
+    payload = extract_json_chunk(result["result"]) if result.get("success") and result.get("result") else None
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=500, detail=result.get("error", f"{tool_name} failed"))
+    if not payload.get("success"):
+        error = payload.get("error", f"{tool_name} failed")
+        raise HTTPException(status_code=404 if payload.get("code") == "not_found" else 400, detail=error)
+    return payload["data"]
+
 async def fetch_memories_for_person(person: Dict[str, Any], limit: int = 12) -> Tuple[List[Dict[str, Any]], Optional[str]]:
     """
     Fetch memories for a person using tag-based filtering.
@@ -686,22 +778,21 @@ async def fetch_memories_for_person(person: Dict[str, Any], limit: int = 12) ->
     last_updated: Optional[str] = None
     
     # Use the correct agent-memory-server tool: search_long_term_memory
-    try:
-        # Search with the person's name as text
-        result = await execute_mcp_tool(
-            "agent-memory-server_search_long_term_memory",
-            {"text": person_name, "limit": limit * 2},  # Get more to filter
-        )
-        if result.get("success") and result.get("result"):
-            payload = extract_json_chunk(result["result"])
-            if isinstance(payload, dict):
-                memories = payload.get("memories", [])
-                if not memories and isinstance(payload, list):
-                    memories = payload
-            elif isinstance(payload, list):
+    # Search with the person's name as text
+    result = await execute_mcp_tool(
+        "agent-memory-server_search_long_term_memory",
+        {"text": person_name, "limit": limit * 2},  # Get more to filter
+    )
+    if result.get("success") and result.get("result"):
+        payload = extract_json_chunk(result["result"])
+        if isinstance(payload, dict):
+            memories = payload.get("memories", [])
+            if not memories and isinstance(payload, list):
                 memories = payload
-    except Exception:
-        pass
+        elif isinstance(payload, list):
+            memories = payload
+    elif not result.get("success"):
+        print(f"⚠️  No memories for {person_name}: {result.get('error')}")
     
     # Filter memories to ensure they match this person
     # Check if memory has the person's name in entities or topics
@@ -1033,18 +1124,21 @@ async def get_dashboard_data():
         from mcp_client import execute_mcp_tool
         import json
         import asyncio
-        from collections import defaultdict
         from datetime import datetime
         
         # Run independent API calls in parallel for better performance
-        stats_result, active_result, all_people_result = await asyncio.gather(
+        stats_result, active_result, analytics_result, upcoming_result = await asyncio.gather(
             execute_mcp_tool("redis-dating_get_statistics", {}),
             execute_mcp_tool("redis-dating_list_people", {
                 "active_only": True,
                 "include_details": False
             }),
-            execute_mcp_tool("redis-dating_list_people", {
-                "include_details": False
+            execute_mcp_tool("redis-dating_get_analytics", {}),
+            # Next upcoming date comes straight from the time-ordered dates index
+            execute_mcp_tool("redis-dating_query_dates", {
+                "from": datetime.now(timezone.utc).isoformat(),
+                "completed": False,
+                "limit": 1
             })
         )
         
@@ -1099,229 +1193,44 @@ async def get_dashboard_data():
         
         active_people = [hydrate_person(person) for person in active_people]
         
-        # Process dating history (group by month)
-        
         dating_history = []
         next_date = None
         
-        if all_people_result.get("success") and all_people_result.get("result"):
-            try:
-                all_people_data = json.loads(all_people_result["result"])
-                people_list = []
-                if isinstance(all_people_data, dict) and "data" in all_people_data:
-                    people_list = all_people_data["data"]
-                elif isinstance(all_people_data, list):
-                    people_list = all_people_data
-                
-                people_list = [hydrate_person(person) for person in people_list]
-                
-                # Group by month for history chart
-                monthly_counts = defaultdict(int)
-                upcoming_dates = []
-                
-                for person in people_list:
-                    if person.get("start_date"):
-                        try:
-                            date_obj = datetime.fromisoformat(person["start_date"].replace("Z", "+00:00"))
-                            month_key = date_obj.strftime("%Y-%m")
-                            monthly_counts[month_key] += 1
-                        except (ValueError, AttributeError):
-                            pass
-                    
-                    # Check for upcoming dates from unified dates array
-                    dates_list = person.get("dates", [])
-                    if isinstance(dates_list, str):
-                        try:
-                            dates_list = json.loads(dates_list)
-                        except (json.JSONDecodeError, TypeError):
-                            dates_list = []
-                    if not isinstance(dates_list, list):
-                        dates_list = []
-                    
-                    # Find upcoming dates (not completed, in the future)
-                    for date_entry in dates_list:
-                        if isinstance(date_entry, dict):
-                            completed = date_entry.get("completed", False)
-                            if not completed:
-                                when_str = date_entry.get("when")
-                                if when_str:
-                                    try:
-                                        # Parse date with timezone handling
-                                        date_str = when_str.replace("Z", "+00:00") if when_str.endswith("Z") else when_str
-                                        date_obj = datetime.fromisoformat(date_str)
-                                        # Ensure timezone-aware comparison
-                                        if date_obj.tzinfo is None:
-                                            date_obj = date_obj.replace(tzinfo=timezone.utc)
-                                        now = datetime.now(timezone.utc)
-                                        if date_obj > now:
-                                            upcoming_dates.append({
-                                                "name": person.get("name", "Unknown"),
-                                                "date": when_str
-                                            })
-                                    except (ValueError, AttributeError) as e:
-                                        print(f"Error parsing date '{when_str}': {e}")
-                                        pass
-                
-                # Convert to array format for chart
-                dating_history = [
-                    {"month": month, "count": count}
-                    for month, count in sorted(monthly_counts.items())
-                ]
-                
-                # Get next upcoming date
-                if upcoming_dates:
-                    next_date = min(upcoming_dates, key=lambda x: x["date"])
-                
-                # Enhanced analytics
-                total_dates = 0
-                dates_per_person = []
-                date_locations = defaultdict(int)
-                dates_by_month = defaultdict(int)
-                relationship_durations = []
-                date_frequency = defaultdict(int)
-                
-                for person in people_list:
-                    person_name = person.get("name", "Unknown")
-                    dates_list = person.get("dates", [])
-                    
-                    # Parse dates if string
-                    if isinstance(dates_list, str):
-                        try:
-                            dates_list = json.loads(dates_list)
-                        except (json.JSONDecodeError, TypeError):
-                            dates_list = []
-                    
-                    if not isinstance(dates_list, list):
-                        dates_list = []
-                    
-                    date_count = len(dates_list)
-                    total_dates += date_count
-                    
-                    if date_count > 0:
-                        dates_per_person.append({
-                            "name": person_name,
-                            "count": date_count
-                        })
-                    
-                    # Track date locations
-                    for date_entry in dates_list:
-                        if isinstance(date_entry, dict):
-                            location = date_entry.get("where", "Unknown")
-                            if location:
-                                date_locations[location] += 1
-                            
-                            # Track dates by month
-                            when_str = date_entry.get("when")
-                            if when_str:
-                                try:
-                                    date_obj = datetime.fromisoformat(when_str.replace("Z", "+00:00"))
-                                    month_key = date_obj.strftime("%Y-%m")
-                                    dates_by_month[month_key] += 1
-                                except (ValueError, AttributeError):
-                                    pass
-                    
-                    # Calculate relationship duration
-                    start_date_str = person.get("start_date")
-                    end_date_str = person.get("end_date")
-                    if start_date_str:
-                        try:
-                            start_dt = datetime.fromisoformat(start_date_str.replace("Z", "+00:00"))
-                            end_dt = None
-                            if end_date_str:
-                                try:
-                                    end_dt = datetime.fromisoformat(end_date_str.replace("Z", "+00:00"))
-                                except (ValueError, AttributeError):
-                                    pass
-                            if not end_dt:
-                                end_dt = datetime.now()
-                            
-                            duration_days = (end_dt - start_dt).days
-                            if duration_days > 0:
-                                relationship_durations.append({
-                                    "name": person_name,
-                                    "days": duration_days
-                                })
-                        except (ValueError, AttributeError):
-                            pass
-                    
-                    # Date frequency (how many dates per person)
-                    date_frequency[date_count] += 1
-                
-                # Sort and format analytics data
-                dates_per_person_sorted = sorted(
-                    dates_per_person, 
-                    key=lambda x: x["count"], 
-                    reverse=True
-                )[:10]  # Top 10
-                
-                date_locations_sorted = sorted(
-                    [{"location": loc, "count": count} for loc, count in date_locations.items()],
-                    key=lambda x: x["count"],
-                    reverse=True
-                )[:10]  # Top 10
-                
-                dates_by_month_sorted = [
-                    {"month": month, "count": count}
-                    for month, count in sorted(dates_by_month.items())
-                ]
-                
-                relationship_durations_sorted = sorted(
-                    relationship_durations,
-                    key=lambda x: x["days"],
-                    reverse=True
-                )[:10]  # Top 10
-                
-                date_frequency_dist = [
-                    {"dates": count, "people": freq}
-                    for count, freq in sorted(date_frequency.items())
-                ]
-                
-                # Calculate averages
-                avg_dates_per_person = total_dates / len(people_list) if people_list else 0
-                avg_relationship_duration = (
-                    sum(d["days"] for d in relationship_durations) / len(relationship_durations)
-                    if relationship_durations else 0
-                )
-                longest_relationship = relationship_durations_sorted[0] if relationship_durations_sorted else None
-                
-                # Add to statistics
-                statistics["total_dates"] = total_dates
-                statistics["avg_dates_per_person"] = round(avg_dates_per_person, 1)
-                statistics["avg_relationship_duration_days"] = round(avg_relationship_duration, 1)
-                statistics["longest_relationship"] = longest_relationship
-                
-                # Add analytics arrays
-                analytics = {
-                    "dates_per_person": dates_per_person_sorted,
-                    "date_locations": date_locations_sorted,
-                    "dates_by_month": dates_by_month_sorted,
-                    "relationship_durations": relationship_durations_sorted,
-                    "date_frequency_distribution": date_frequency_dist
-                }
-                    
-            except (json.JSONDecodeError, TypeError) as e:
-                print(f"Error parsing people data: {e}")
-                analytics = {
-                    "dates_per_person": [],
-                    "date_locations": [],
-                    "dates_by_month": [],
-                    "relationship_durations": [],
-                    "date_frequency_distribution": []
+        if upcoming_result.get("success") and upcoming_result.get("result"):
+            upcoming_payload = extract_json_chunk(upcoming_result["result"])
+            if isinstance(upcoming_payload, dict) and upcoming_payload.get("data"):
+                upcoming = upcoming_payload["data"][0]
+                next_date = {
+                    "name": upcoming.get("person_name", "Unknown"),
+                    "date": upcoming.get("when")
                 }
         
+        analytics = {
+            "dates_per_person": [],
+            "date_locations": [],
+            "dates_by_month": [],
+            "relationship_durations": [],
+            "date_frequency_distribution": []
+        }
+        # Aggregates are precomputed on write by the redis-dating server
+        if analytics_result.get("success") and analytics_result.get("result"):
+            analytics_payload = extract_json_chunk(analytics_result["result"])
+            if isinstance(analytics_payload, dict) and isinstance(analytics_payload.get("data"), dict):
+                data = analytics_payload["data"]
+                dating_history = data.get("dating_history", [])
+                statistics["total_dates"] = data.get("total_dates", 0)
+                statistics["avg_dates_per_person"] = data.get("avg_dates_per_person", 0)
+                statistics["avg_relationship_duration_days"] = data.get("avg_relationship_duration_days", 0)
+                statistics["longest_relationship"] = data.get("longest_relationship")
+                analytics = {key: data.get(key, []) for key in analytics}
+        
         return {
             "success": True,
             "statistics": statistics,
             "activePeople": active_people,
             "nextDate": next_date,
             "datingHistory": dating_history,
-            "analytics": analytics if 'analytics' in locals() else {
-                "dates_per_person": [],
-                "date_locations": [],
-                "dates_by_month": [],
-                "relationship_durations": [],
-                "date_frequency_distribution": []
-            }
+            "analytics": analytics
         }
         
     except Exception as e:
@@ -1352,7 +1261,11 @@ async def get_dashboard_data():
 @app.get("/dossiers")
 async def list_dossiers(activeOnly: bool = Query(False)):
     try:
-        people = await list_people_records(active_only=activeOnly)
+        # meeting_place is the legacy fallback hydrate_person uses for how_we_met
+        people = await list_people_records(
+            active_only=activeOnly,
+            fields=["name", "status", "how_we_met", "meeting_place", "photo_url"]
+        )
         simplified = [
             {
                 "name": person.get("name"),
@@ -1431,12 +1344,7 @@ async def add_dossier_date(person_name: str, request: AddDateRequest):
             "learnings": request.learnings,
             "id": str(uuid.uuid4()),
         }
-        updated_dates = person.get("dates", []) + [new_entry]
-        from mcp_client import execute_mcp_tool
-        await execute_mcp_tool(
-            "redis-dating_update_person",
-            {"name": person["name"], "dates": updated_dates},
-        )
+        await run_date_tool("append_date", {"name": person["name"], "date": new_entry})
         memory_text_parts = [
             f"Date with {person['name']} at {request.where.strip()}",
             f"on {when_iso}",
@@ -1522,71 +1430,48 @@ async def dossier_chat(person_name: str, request: DossierChatRequest):
 async def get_calendar_dates(
     person_name: Optional[str] = Query(None, description="Filter by person name"),
     active_only: bool = Query(False, description="Only show dates for active people"),
-    completed: Optional[bool] = Query(None, description="Filter by completed status")
+    completed: Optional[bool] = Query(None, description="Filter by completed status"),
+    from_date: Optional[str] = Query(None, alias="from", description="Only dates at or after this ISO date/time"),
+    to_date: Optional[str] = Query(None, alias="to", description="Only dates at or before this ISO date/time"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; omit to return every matching date"),
+    cursor: Optional[str] = Query(None, description="next_cursor from a previous page")
 ):
-    """Get all dates across all people with optional filtering."""
+    """Get dates across all people in chronological order with optional filtering and windowing."""
     try:
-        from mcp_client import execute_mcp_tool
-        import json
-        
-        # Get all people (or just active if requested)
-        args: Dict[str, Any] = {"include_details": False}
+        args: Dict[str, Any] = {}
+        if person_name:
+            args["person"] = person_name
         if active_only:
             args["active_only"] = True
-        
-        result = await execute_mcp_tool("redis-dating_list_people", args)
-        people: List[Dict[str, Any]] = []
-        if result.get("success") and result.get("result"):
-            payload = extract_json_chunk(result["result"])
-            if isinstance(payload, dict) and "data" in payload:
-                people = payload["data"]
-            elif isinstance(payload, list):
-                people = payload
-        
-        # Collect all dates from all people
-        all_dates = []
-        for person in people:
-            person_name_val = person.get("name", "")
-            
-            # Apply person filter if specified
-            if person_name and person_name_val.lower() != person_name.lower():
-                continue
-            
-            # Get dates for this person
-            dates = person.get("dates", [])
-            if isinstance(dates, str) and dates:
-                try:
-                    dates = json.loads(dates)
-                except json.JSONDecodeError:
-                    dates = []
-            
-            if not isinstance(dates, list):
-                dates = []
-            
-            # Process each date
-            for date_entry in dates:
-                if not isinstance(date_entry, dict):
-                    continue
-                
-                # Add person_name if not present
-                date_entry = dict(date_entry)
-                date_entry["person_name"] = person_name_val
-                
-                # Ensure id exists
-                if "id" not in date_entry:
-                    date_entry["id"] = str(uuid.uuid4())
-                
-                # Ensure completed field exists (default to False)
-                if "completed" not in date_entry:
-                    date_entry["completed"] = False
-                
-                # Apply completed filter if specified
-                if completed is not None and date_entry.get("completed") != completed:
-                    continue
-                
-                all_dates.append(date_entry)
-        
-        return {"success": True, "data": all_dates}
+        if completed is not None:
+            args["completed"] = completed
+        if from_date:
+            args["from"] = from_date
+        if to_date:
+            args["to"] = to_date
+        
+        if limit is not None:
+            args["limit"] = limit
+            if cursor:
+                args["cursor"] = cursor
+            all_dates, next_cursor = await query_date_entries(args)
+            return {"success": True, "data": all_dates, "next_cursor": next_cursor}
+        
+        # No page size requested: keep the old contract and return the whole window
+        if cursor:
+            args["cursor"] = cursor
+        all_dates = await query_all_date_entries(args)
+        if from_date or to_date:
+            # Dates whose `when` the server can't parse are indexed at the epoch, outside any
+            # real window; they were listed before windowing, so keep handing them to the client
+            undated_args = {key: value for key, value in args.items() if key != "cursor"}
+            undated = await query_all_date_entries({**undated_args, "from": UNPARSED_WHEN, "to": UNPARSED_WHEN})
+            seen = {entry["id"] for entry in all_dates if entry.get("id")}
+            all_dates.extend(entry for entry in undated if not entry.get("id") or entry["id"] not in seen)
+        
+        return {"success": True, "data": all_dates, "next_cursor": None}
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch dates: {e}")
 
@@ -1611,28 +1496,10 @@ async def create_calendar_date(request: CreateDateRequest):
             "learnings": request.learnings or "",
             "id": str(uuid.uuid4()),
             "completed": request.completed if request.completed is not None else False,
-            "person_name": request.person_name,
         }
         
-        # Get existing dates
-        existing_dates = person.get("dates", [])
-        if isinstance(existing_dates, str) and existing_dates:
-            try:
-                existing_dates = json.loads(existing_dates)
-            except json.JSONDecodeError:
-                existing_dates = []
-        if not isinstance(existing_dates, list):
-            existing_dates = []
-        
-        # Add new date
-        updated_dates = existing_dates + [new_entry]
-        
-        # Update person record
-        from mcp_client import execute_mcp_tool
-        await execute_mcp_tool(
-            "redis-dating_update_person",
-            {"name": person["name"], "dates": updated_dates},
-        )
+        # Append atomically on the server; the returned entry carries person_name
+        new_entry = await run_date_tool("append_date", {"name": person["name"], "date": new_entry})
         
         # Store memory if not completed (future date)
         if not new_entry["completed"]:
@@ -1674,85 +1541,23 @@ async def create_calendar_date(request: CreateDateRequest):
 async def update_calendar_date(date_id: str, request: UpdateDateRequest):
     """Update an existing date."""
     try:
-        from mcp_client import execute_mcp_tool
-        import json
-        
-        # Find the date across all people
-        result = await execute_mcp_tool("redis-dating_list_people", {
-            "include_details": False
-        })
-        people: List[Dict[str, Any]] = []
-        if result.get("success") and result.get("result"):
-            payload = extract_json_chunk(result["result"])
-            if isinstance(payload, dict) and "data" in payload:
-                people = payload["data"]
-            elif isinstance(payload, list):
-                people = payload
-        
-        found_person = None
-        found_date_index = -1
-        
-        for person in people:
-            dates = person.get("dates", [])
-            if isinstance(dates, str) and dates:
-                try:
-                    dates = json.loads(dates)
-                except json.JSONDecodeError:
-                    dates = []
-            if not isinstance(dates, list):
-                dates = []
-            
-            for idx, date_entry in enumerate(dates):
-                if isinstance(date_entry, dict) and date_entry.get("id") == date_id:
-                    found_person = person
-                    found_date_index = idx
-                    break
-            
-            if found_person:
-                break
-        
-        if not found_person or found_date_index == -1:
-            raise HTTPException(status_code=404, detail="Date not found")
-        
-        # Get the date entry
-        dates = found_person.get("dates", [])
-        if isinstance(dates, str) and dates:
-            try:
-                dates = json.loads(dates)
-            except json.JSONDecodeError:
-                dates = []
-        if not isinstance(dates, list):
-            dates = []
-        
-        date_entry = dict(dates[found_date_index])
-        
-        # Update fields
+        changes: Dict[str, Any] = {}
         if request.where is not None:
-            date_entry["where"] = request.where.strip()
+            changes["where"] = request.where.strip()
         if request.when is not None:
             when_iso = coerce_iso_datetime(request.when)
             if not when_iso:
                 raise HTTPException(status_code=400, detail="Invalid date/time provided")
-            date_entry["when"] = when_iso
+            changes["when"] = when_iso
         if request.notes is not None:
-            date_entry["notes"] = request.notes
+            changes["notes"] = request.notes
         if request.learnings is not None:
-            date_entry["learnings"] = request.learnings
+            changes["learnings"] = request.learnings
         if request.completed is not None:
-            date_entry["completed"] = request.completed
+            changes["completed"] = request.completed
         
-        # Ensure person_name is set
-        if "person_name" not in date_entry:
-            date_entry["person_name"] = found_person.get("name", "")
-        
-        # Update the dates array
-        dates[found_date_index] = date_entry
-        
-        # Update person record
-        await execute_mcp_tool(
-            "redis-dating_update_person",
-            {"name": found_person["name"], "dates": dates},
-        )
+        # Patch atomically on the server so concurrent edits to the same person aren't lost
+        date_entry = await run_date_tool("patch_date", {"date_id": date_id, "changes": changes})
         
         return {"success": True, "data": date_entry}
     except HTTPException:
@@ -1764,64 +1569,7 @@ async def update_calendar_date(date_id: str, request: UpdateDateRequest):
 async def delete_calendar_date(date_id: str):
     """Delete a date."""
     try:
-        from mcp_client import execute_mcp_tool
-        import json
-        
-        # Find the date across all people
-        result = await execute_mcp_tool("redis-dating_list_people", {
-            "include_details": False
-        })
-        people: List[Dict[str, Any]] = []
-        if result.get("success") and result.get("result"):
-            payload = extract_json_chunk(result["result"])
-            if isinstance(payload, dict) and "data" in payload:
-                people = payload["data"]
-            elif isinstance(payload, list):
-                people = payload
-        
-        found_person = None
-        found_date_index = -1
-        
-        for person in people:
-            dates = person.get("dates", [])
-            if isinstance(dates, str) and dates:
-                try:
-                    dates = json.loads(dates)
-                except json.JSONDecodeError:
-                    dates = []
-            if not isinstance(dates, list):
-                dates = []
-            
-            for idx, date_entry in enumerate(dates):
-                if isinstance(date_entry, dict) and date_entry.get("id") == date_id:
-                    found_person = person
-                    found_date_index = idx
-                    break
-            
-            if found_person:
-                break
-        
-        if not found_person or found_date_index == -1:
-            raise HTTPException(status_code=404, detail="Date not found")
-        
-        # Get the dates array
-        dates = found_person.get("dates", [])
-        if isinstance(dates, str) and dates:
-            try:
-                dates = json.loads(dates)
-            except json.JSONDecodeError:
-                dates = []
-        if not isinstance(dates, list):
-            dates = []
-        
-        # Remove the date
-        dates.pop(found_date_index)
-        
-        # Update person record
-        await execute_mcp_tool(
-            "redis-dating_update_person",
-            {"name": found_person["name"], "dates": dates},
-        )
+        await run_date_tool("remove_date", {"date_id": date_id})
         
         return {"success": True, "message": "Date deleted"}
     except HTTPException:
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Resilience tests for MCPClientManager against real redis-dating server processes.
+
+The server runs on its SQLite backend (a temporary file) and on its Redis
+backend (fakeredis served over TCP). Calls that time out must leave the
+server usable, and calls routed to a pool process that died must still
+succeed. An error the server answers a half-open breaker's trial call with
+must leave the breaker as it was.
+"""
+import asyncio
+import os
+import socket
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("mcp")
+
+import mcp_client
+from mcp_client import MCPClientManager
+
+SERVER_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mcp_servers", "redis-dating", "mcp_server.py"
+)
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def backend_env(request, tmp_path):
+    """Environment for a redis-dating server on the given backend."""
+    if request.param == "sqlite":
+        yield {"REDIS_DATING_BACKEND": "sqlite", "REDIS_DATING_SQLITE_PATH": str(tmp_path / "dating.sqlite3")}
+        return
+
+    fakeredis = pytest.importorskip("fakeredis")
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    redis_server = fakeredis.TcpFakeServer(("127.0.0.1", port), server_type="redis")
+    thread = threading.Thread(target=redis_server.serve_forever, daemon=True)
+    thread.start()
+    yield {"REDIS_DATING_BACKEND": "redis", "REDIS_HOST": "127.0.0.1", "REDIS_PORT": str(port), "REDIS_DB": "0"}
+    redis_server.shutdown()
+    redis_server.server_close()
+
+
+def make_manager(env, **config):
+    manager = MCPClientManager()
+    manager.add_server("dating", SERVER_PATH, env=env, **config)
+    return manager
+
+
+async def timeouts_then_call(env):
+    manager = make_manager(env, tool_timeouts={"get_person": 0.0005})
+    try:
+        assert (await manager.call_tool("dating", "create_person", {"name": "Ann"}))["success"]
+        for _ in range(3):
+            result = await manager.call_tool("dating", "get_person", {"name": "Ann"})
+            assert result.get("timed_out"), result
+        # Give a late response the chance to take the server down, as a cancellation race did
+        await asyncio.sleep(0.2)
+        result = await manager.call_tool("dating", "get_statistics", {})
+        assert result.get("success"), result
+        assert manager.breakers["dating"]["state"] == "closed"
+        assert manager.pool_stats()["dating"]["healthy"] == 1
+    finally:
+        await manager.disconnect_all()
+
+
+async def trial_call_answered_with_an_error(env):
+    manager = make_manager(env)
+    try:
+        assert (await manager.call_tool("dating", "create_person", {"name": "Ann"}))["success"]
+        # An open breaker whose cool-down is over, so the next call is its trial
+        manager.breakers["dating"] = {
+            "state": "open", "failures": mcp_client.BREAKER_FAILURES, "last_error": "timed out",
+            "opened_at": time.monotonic() - mcp_client.BREAKER_COOLDOWN - 1
+        }
+        # Fails the tool's input schema, so the server answers with an isError result
+        result = await manager.call_tool("dating", "get_person", {})
+        assert result["raw_result"].isError, result
+        breaker = manager.breakers["dating"]
+        assert (breaker["state"], breaker["failures"]) == ("open", mcp_client.BREAKER_FAILURES)
+
+        assert (await manager.call_tool("dating", "get_person", {"name": "Ann"}))["success"]
+        assert manager.breakers["dating"]["state"] == "closed"
+    finally:
+        await manager.disconnect_all()
+
+
+async def calls_survive_a_killed_process(env):
+    manager = make_manager(env, pool_size=2, standby=1)
+    try:
+        assert (await manager.call_tool("dating", "create_person", {"name": "Ann"}))["success"]
+        victim = manager.pools["dating"][0]
+        # stdio_client keeps the spawned process on its async generator frame
+        process = victim["stdio_context"].gen.ag_frame.f_locals["process"]
+        process.kill()
+        await process.wait()
+
+        results = await asyncio.gather(*(
+            manager.call_tool("dating", "get_person", {"name": "Ann"}) for _ in range(6)
+        ))
+        assert all(result.get("success") for result in results), results
+        assert not victim["healthy"]
+    finally:
+        await manager.disconnect_all()
+
+
+def test_timed_out_calls_leave_the_server_usable(backend_env):
+    asyncio.run(timeouts_then_call(backend_env))
+
+
+def test_server_errors_leave_the_breaker_alone(backend_env):
+    asyncio.run(trial_call_answered_with_an_error(backend_env))
+
+
+def test_calls_fail_over_when_a_pool_process_dies(backend_env):
+    asyncio.run(calls_survive_a_killed_process(backend_env))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark N concurrent get_person calls against the redis-dating server.
+
+Compares the asyncio client (a pooled connection per in-flight call) with the
+previous behaviour, where a synchronous redis.Redis client was called directly
+from the async tool handlers and blocked the event loop for every round trip.
+
+Uses REDIS_HOST/REDIS_PORT when REDIS_HOST is set (the selected DB is written
+to), otherwise starts a fakeredis TCP server in a subprocess. With fakeredis,
+--rtt-ms puts a delaying proxy in front of it to model a networked Redis.
+
+Usage:
+    python bench_concurrency.py --people 200 --concurrency 64 --rounds 20
+    python bench_concurrency.py --rtt-ms 1
+"""
+import argparse
+import asyncio
+import importlib.util
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_server.py")
+
+
+def load_server():
+    spec = importlib.util.spec_from_file_location("redis_dating_server", SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class BlockingClient:
+    """Wrap a sync redis.Redis so awaited calls block the loop, as before the asyncio port."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def serve_fake(port, rtt_ms):
+    """Run fakeredis on `port`, behind a proxy adding `rtt_ms` per round trip if set."""
+    import threading
+    from fakeredis import TcpFakeServer
+
+    backend_port = free_port() if rtt_ms else port
+    backend = TcpFakeServer(("127.0.0.1", backend_port), server_type="redis")
+    if not rtt_ms:
+        backend.serve_forever()
+        return
+    threading.Thread(target=backend.serve_forever, daemon=True).start()
+    delay = rtt_ms / 2000
+
+    async def forward(reader, writer):
+        while data := await reader.read(65536):
+            await asyncio.sleep(delay)
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    async def handle(client_reader, client_writer):
+        backend_reader, backend_writer = await asyncio.open_connection("127.0.0.1", backend_port)
+        await asyncio.gather(forward(client_reader, backend_writer), forward(backend_reader, client_writer))
+
+    async def run():
+        proxy = await asyncio.start_server(handle, "127.0.0.1", port)
+        await proxy.serve_forever()
+
+    asyncio.run(run())
+
+
+def start_fake_server(rtt_ms):
+    port = free_port()
+    process = subprocess.Popen([sys.executable, __file__, "--serve-fake", str(port), "--rtt-ms", str(rtt_ms)])
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return process, port
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError("fakeredis TCP server did not start")
+
+
+async def run_rounds(server, names, concurrency, rounds):
+    """Return per-round wall times for `concurrency` simultaneous get_person calls.
+
+    Round 0 is an untimed warm-up so pool connections are already open.
+    """
+    timings = []
+    for i in range(rounds + 1):
+        batch = [names[(i * concurrency + j) % len(names)] for j in range(concurrency)]
+        start = time.perf_counter()
+        results = await asyncio.gather(*(server.get_person(name) for name in batch))
+        if i:
+            timings.append(time.perf_counter() - start)
+        assert all(result["success"] for result in results)
+    return timings
+
+
+def report(label, timings, concurrency):
+    total_calls = concurrency * len(timings)
+    print(
+        f"{label:>8}: median round {statistics.median(timings) * 1000:.1f} ms, "
+        f"max {max(timings) * 1000:.1f} ms, {total_calls / sum(timings):.0f} calls/s"
+    )
+
+
+async def main_async(args, host, port):
+    import redis
+
+    server = load_server()
+    os.environ.setdefault("REDIS_POOL_MAX_CONNECTIONS", str(args.concurrency))
+    server.REDIS_POOL_MAX_CONNECTIONS = int(os.environ["REDIS_POOL_MAX_CONNECTIONS"])
+
+    names = [f"Bench Person {i}" for i in range(args.people)]
+    server.redis_client = None
+    for name in names:
+        await server.create_person(name, status="active", how_we_met="benchmark")
+
+    server.redis_client = BlockingClient(redis.Redis(host=host, port=port, db=args.db, decode_responses=True))
+    before = await run_rounds(server, names, args.concurrency, args.rounds)
+
+    server.redis_client = None
+    after = await run_rounds(server, names, args.concurrency, args.rounds)
+
+    print(
+        f"{args.concurrency} concurrent get_person calls x {args.rounds} rounds "
+        f"({args.people} people, rtt {args.rtt_ms} ms)"
+    )
+    report("sync", before, args.concurrency)
+    report("asyncio", after, args.concurrency)
+
+    for name in names:
+        await server.delete_person(name)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--people", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=0, help="simulated round trip (fakeredis only)")
+    parser.add_argument("--serve-fake", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve_fake:
+        serve_fake(args.serve_fake, args.rtt_ms)
+        return
+
+    process = None
+    if os.getenv("REDIS_HOST"):
+        host, port = os.environ["REDIS_HOST"], int(os.getenv("REDIS_PORT", "6379"))
+    else:
+        process, port = start_fake_server(args.rtt_ms)
+        host = "127.0.0.1"
+        os.environ["REDIS_HOST"], os.environ["REDIS_PORT"] = host, str(port)
+    args.db = int(os.getenv("REDIS_DB", "0"))
+
+    try:
+        asyncio.run(main_async(args, host, port))
+    finally:
+        if process is not None:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
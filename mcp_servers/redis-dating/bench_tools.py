@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+"""
+Seed the redis-dating server with synthetic data and benchmark every tool.
+
+People get weighted statuses and how_we_met values, start/end dates, and a
+date history with places, notes and learnings. They are written straight to
+Redis in pipelined batches, through the server's own storage and index
+helpers, so derived keys match what the tools would have built.
+
+The server then runs as a subprocess and is driven over real MCP stdio, one
+tool at a time, with --concurrency calls in flight. The harness reports
+p50/p95/p99 latency, throughput, and request/response sizes per tool, and
+writes them to a JSON file. Pass a previous file to --compare to print the
+change per tool.
+
+Uses REDIS_HOST/REDIS_PORT when REDIS_HOST is set, otherwise starts a
+fakeredis TCP server (see bench_concurrency.py). A real database must be
+empty unless --flush is given, and is flushed before seeding. With
+--backend sqlite the same data is seeded into a SQLite file instead (a fresh
+temporary one unless --sqlite-path is given) and the server runs on it.
+
+Usage:
+    python bench_tools.py --people 10000 --dates 50 --concurrency 16
+    python bench_tools.py --people 500 --tools get_person,list_people --output before.json
+    python bench_tools.py --people 500 --compare before.json
+    python bench_tools.py --people 500 --backend sqlite --compare before.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from bench_concurrency import SERVER_PATH, load_server, start_fake_server
+
+FIRST_NAMES = [
+    "Alex", "Avery", "Bea", "Cam", "Charlie", "Dana", "Eli", "Emma", "Finn", "Gia", "Hana", "Isla",
+    "Jamie", "Jordan", "Kai", "Lena", "Leo", "Maya", "Mia", "Nico", "Noah", "Olive", "Priya", "Quinn",
+    "Riley", "Rosa", "Sam", "Sofia", "Taylor", "Theo", "Uma", "Val", "Wren", "Xavi", "Yara", "Zoe"
+]
+LAST_NAMES = [
+    "Adams", "Bauer", "Chen", "Diaz", "Evans", "Fischer", "Garcia", "Haddad", "Ito", "Jensen", "Kim",
+    "Lopez", "Murphy", "Nguyen", "Okafor", "Patel", "Quinn", "Rossi", "Silva", "Tanaka", "Ueda",
+    "Varga", "Walsh", "Xu", "Young", "Zhang"
+]
+STATUS_WEIGHTS = {"active": 20, "exploring": 15, "paused": 10, "not_pursuing": 45, "past": 10}
+HOW_WE_MET_WEIGHTS = {
+    "Hinge": 25, "Bumble": 15, "Tinder": 12, "Through friends": 15, "Work": 8, "Bar": 7,
+    "Gym": 5, "Party": 5, "Class": 4, "Wedding": 2, "Dog park": 2
+}
+PLACES = [
+    "Blue Bottle Coffee", "Tartine", "Golden Gate Park", "SFMOMA", "Dolores Park", "The Fillmore",
+    "Zuni Cafe", "Ferry Building", "Lands End", "Alamo Drafthouse", "Bi-Rite", "Smuggler's Cove",
+    "Ocean Beach", "Chinatown", "Mission Bowling Club", "Twin Peaks", "Exploratorium", "Foreign Cinema"
+]
+WORDS = (
+    "we talked about travel family work music books movies food hiking cooking dogs cats siblings "
+    "childhood plans weekend favourite laughed lot really easy conversation nervous start warmed up "
+    "shared dessert walked home rain sunset wine coffee tea late night early morning funny story "
+    "podcast concert museum painting climbing running soccer board games trivia karaoke"
+).split()
+
+# Tools that touch every record; they get --heavy-calls calls, made one at a time
+HEAVY_TOOLS = ("get_analytics", "memory_report", "rebuild_indexes", "archive_people", "migrate_storage")
+# Run order: reads first, then writes (append before patch/remove, create before delete), then heavy tools
+TOOL_ORDER = (
+    "get_person", "get_people", "list_people", "search_people", "get_statistics", "read_changes",
+    "query_dates", "get_date_by_id", "HGETALL", "SCAN", "KEYS", "redis_stats",
+    "update_person", "update_people", "HSET", "append_date", "patch_date", "remove_date",
+    "create_person", "delete_person",
+    "get_analytics", "memory_report", "rebuild_indexes", "archive_people", "migrate_storage"
+)
+
+
+def weighted(rnd, weights):
+    return rnd.choices(list(weights), weights=list(weights.values()))[0]
+
+
+def sentence(rnd, low, high):
+    return " ".join(rnd.choices(WORDS, k=rnd.randint(low, high))).capitalize() + "."
+
+
+def generate_person(rnd, index, dates_per_person, now):
+    """One synthetic person record with hash-style fields (dates as a JSON string)."""
+    first, last = rnd.choice(FIRST_NAMES), rnd.choice(LAST_NAMES)
+    status = weighted(rnd, STATUS_WEIGHTS)
+    start = now - timedelta(days=rnd.randint(7, 3 * 365))
+    person = {
+        "name": f"{first} {last} {index}",
+        "status": status,
+        "how_we_met": weighted(rnd, HOW_WE_MET_WEIGHTS),
+        "start_date": start.date().isoformat(),
+        "created_at": start.isoformat(),
+        "last_updated": now.isoformat()
+    }
+    if status in ("not_pursuing", "past"):
+        person["end_date"] = (start + timedelta(days=rnd.randint(3, 300))).date().isoformat()
+    elif rnd.random() < 0.5:
+        person["next_date"] = (now + timedelta(days=rnd.randint(1, 21))).date().isoformat()
+    dates = []
+    for _ in range(dates_per_person):
+        when = start + timedelta(days=rnd.randint(0, max((now - start).days, 1)), hours=rnd.randint(17, 22))
+        dates.append({
+            "id": str(uuid.UUID(int=rnd.getrandbits(128), version=4)),
+            "where": rnd.choice(PLACES),
+            "when": when.isoformat(timespec="minutes"),
+            "notes": sentence(rnd, 10, 40),
+            "learnings": sentence(rnd, 5, 15),
+            "completed": when < now
+        })
+    dates.sort(key=lambda entry: entry["when"])
+    person["dates"] = json.dumps(dates)
+    return person
+
+
+async def seed(server, people, dates_per_person, seed_value, chunk_size=200):
+    """Write synthetic people and their derived keys in pipelined batches; returns (names, date ids)."""
+    r = server.get_redis_client()
+    await server.ensure_storage_mode()
+    rnd = random.Random(seed_value)
+    now = datetime.now().replace(microsecond=0)
+    names, date_ids = [], []
+    for start in range(0, people, chunk_size):
+        pipe = r.pipeline(transaction=False)
+        for index in range(start, min(start + chunk_size, people)):
+            person = generate_person(rnd, index, dates_per_person, now)
+            normalized_name = server.normalize_name(person["name"])
+            server.queue_person_write(pipe, server.get_person_key(person["name"]), person, create=True)
+            server.ensure_index(normalized_name, pipe)
+            server.queue_index_updates(pipe, normalized_name, None, server.to_stored(person))
+            names.append(person["name"])
+            date_ids.extend(entry["id"] for entry in json.loads(person["dates"]))
+        await pipe.execute()
+    await r.set(server.INDEX_VERSION_KEY, server.INDEX_VERSION)
+    return names, date_ids
+
+
+def seed_sqlite(server, people, dates_per_person, seed_value, chunk_size=200):
+    """Write the same synthetic people through the SQLite store, a transaction per batch; returns (names, date ids)."""
+    store = server.get_store()
+    rnd = random.Random(seed_value)
+    now = datetime.now().replace(microsecond=0)
+    names, date_ids = [], []
+    for start in range(0, people, chunk_size):
+        batch = [generate_person(rnd, index, dates_per_person, now) for index in range(start, min(start + chunk_size, people))]
+
+        def write():
+            for person in batch:
+                store.save(server.normalize_name(person["name"]), None, person)
+
+        store.transaction(write, (), True)
+        for person in batch:
+            names.append(person["name"])
+            date_ids.extend(entry["id"] for entry in json.loads(person["dates"]))
+    return names, date_ids
+
+
+class Workload:
+    """Argument factories for each tool, plus the ids that write tools hand to later ones."""
+
+    def __init__(self, names, date_ids, storage, seed_value):
+        self.rnd = random.Random(seed_value + 1)
+        self.names = names
+        self.date_ids = date_ids
+        self.storage = storage
+        self.appended_ids = []
+        self.created_names = []
+        self.created_count = 0
+
+    def name(self):
+        return self.rnd.choice(self.names)
+
+    def key(self):
+        return f"dating:person:{self.name().lower()}"
+
+    def date(self):
+        return {"where": self.rnd.choice(PLACES), "when": datetime.now().isoformat(timespec="minutes"),
+                "notes": sentence(self.rnd, 10, 40), "completed": False}
+
+    def search_query(self):
+        query = self.name().split()[0].lower()
+        if self.rnd.random() < 0.3 and len(query) > 3:
+            # A one-letter typo, to exercise the fuzzy path
+            position = self.rnd.randrange(1, len(query))
+            query = query[:position] + self.rnd.choice("aeiou") + query[position + 1:]
+        return query
+
+    def args(self, tool):
+        rnd = self.rnd
+        if tool == "get_person":
+            return {"name": self.name()}
+        if tool == "get_people":
+            return {"names": [self.name() for _ in range(20)]}
+        if tool == "list_people":
+            return {"status": weighted(rnd, STATUS_WEIGHTS), "fields": ["name", "status", "how_we_met", "start_date"],
+                    "limit": 100}
+        if tool == "search_people":
+            return {"query": self.search_query()}
+        if tool == "read_changes":
+            return {"since_id": "0", "limit": 100}
+        if tool == "query_dates":
+            start = datetime.now() - timedelta(days=rnd.randint(30, 3 * 365))
+            return {"from_date": start.date().isoformat(), "to_date": (start + timedelta(days=30)).date().isoformat(),
+                    "limit": 50}
+        if tool == "get_date_by_id":
+            return {"date_id": rnd.choice(self.date_ids)}
+        if tool == "HGETALL":
+            return {"key": self.key()}
+        if tool == "SCAN":
+            return {"pattern": "dating:person:*", "count": 500, "max_results": 500}
+        if tool == "KEYS":
+            return {"pattern": "dating:people:status:*"}
+        if tool == "memory_report":
+            return {"sample": 100}
+        if tool == "update_person":
+            return {"name": self.name(), "next_date": (datetime.now() + timedelta(days=rnd.randint(1, 30))).date().isoformat()}
+        if tool == "update_people":
+            return {"updates": [{"name": self.name(), "memory_tags": f"bench-{rnd.randint(0, 9)}"} for _ in range(10)]}
+        if tool == "HSET":
+            return {"key": self.key(), "field": "memory_tags", "value": f"bench-{rnd.randint(0, 9)}"}
+        if tool == "append_date":
+            return {"name": self.name(), "date": self.date()}
+        if tool == "patch_date":
+            return {"date_id": rnd.choice(self.appended_ids or self.date_ids), "changes": {"learnings": sentence(rnd, 5, 15)}}
+        if tool == "remove_date":
+            return {"date_id": self.appended_ids.pop()} if self.appended_ids else None
+        if tool == "create_person":
+            self.created_count += 1
+            name = f"Bench Temp {self.created_count}"
+            self.created_names.append(name)
+            return {"name": name, "status": "exploring", "how_we_met": "Hinge", "dates": [self.date()]}
+        if tool == "delete_person":
+            return {"name": self.created_names.pop()} if self.created_names else None
+        if tool == "archive_people":
+            # A dry run measures choosing candidates without shrinking the dataset between runs
+            return {"older_than": "365d", "dry_run": True}
+        if tool == "migrate_storage":
+            # Converting to the current layout finds nothing to do, so it measures the full scan and probe
+            return {"target": self.storage}
+        return {}
+
+    def record(self, tool, response):
+        if tool == "append_date" and response.get("success"):
+            self.appended_ids.append(response["data"]["id"])
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))]
+
+
+def summarize(latencies, request_sizes, response_sizes, errors, concurrency, wall_seconds):
+    ordered = sorted(latencies)
+    return {
+        "calls": len(latencies),
+        "errors": errors,
+        "concurrency": concurrency,
+        "wall_s": round(wall_seconds, 3),
+        "throughput_per_s": round(len(latencies) / wall_seconds, 1) if wall_seconds else None,
+        "latency_ms": {
+            "p50": round(percentile(ordered, 0.50), 3),
+            "p95": round(percentile(ordered, 0.95), 3),
+            "p99": round(percentile(ordered, 0.99), 3),
+            "mean": round(sum(ordered) / len(ordered), 3),
+            "max": round(ordered[-1], 3)
+        },
+        "request_bytes": {"avg": round(sum(request_sizes) / len(request_sizes)), "max": max(request_sizes)},
+        "response_bytes": {"avg": round(sum(response_sizes) / len(response_sizes)), "max": max(response_sizes)}
+    }
+
+
+async def run_tool(session, workload, tool, calls, concurrency):
+    """Make `calls` calls to one tool with `concurrency` in flight; returns its summary or None."""
+    latencies, request_sizes, response_sizes = [], [], []
+    errors = 0
+    remaining = iter(range(calls))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            arguments = workload.args(tool)
+            if arguments is None:
+                return
+            start = time.perf_counter()
+            try:
+                result = await session.call_tool(tool, arguments)
+                text = result.content[0].text if result.content else ""
+                response = json.loads(text) if text else {}
+                failed = result.isError or not response.get("success", False)
+            except Exception:
+                text, response, failed = "", {}, True
+            latencies.append((time.perf_counter() - start) * 1000)
+            request_sizes.append(len(json.dumps(arguments).encode()))
+            response_sizes.append(len(text.encode()))
+            errors += failed
+            workload.record(tool, response)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, calls))))
+    if not latencies:
+        return None
+    return summarize(latencies, request_sizes, response_sizes, errors, concurrency, time.perf_counter() - start)
+
+
+async def drive(args, env, workload, tools):
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    params = StdioServerParameters(command=sys.executable, args=[SERVER_PATH], env=env)
+    with open(args.server_log or os.devnull, "w") as errlog:
+        async with stdio_client(params, errlog=errlog) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                available = {tool.name for tool in (await session.list_tools()).tools}
+                if "redis_stats" in available:
+                    await session.call_tool("redis_stats", {"reset": True})
+                results = {}
+                for tool in tools:
+                    if tool not in available:
+                        print(f"{tool:>16}: not offered by the server, skipped")
+                        continue
+                    if tool in HEAVY_TOOLS:
+                        summary = await run_tool(session, workload, tool, args.heavy_calls, 1)
+                    else:
+                        summary = await run_tool(session, workload, tool, args.calls, args.concurrency)
+                    if summary is None:
+                        continue
+                    results[tool] = summary
+                    latency = summary["latency_ms"]
+                    print(
+                        f"{tool:>16}: p50 {latency['p50']:8.2f} ms  p95 {latency['p95']:8.2f} ms  "
+                        f"p99 {latency['p99']:8.2f} ms  {summary['throughput_per_s']:8.1f}/s  "
+                        f"resp {summary['response_bytes']['avg']:>8} B  errors {summary['errors']}"
+                    )
+                server_stats = None
+                if "redis_stats" in available:
+                    stats = await session.call_tool("redis_stats", {})
+                    server_stats = json.loads(stats.content[0].text).get("data")
+    return results, server_stats
+
+
+def compare(results, baseline_path):
+    """Print the relative change of each tool's latency and throughput against a previous run."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["tools"]
+    print(f"\nChange vs {baseline_path} (negative latency / positive throughput is better):")
+    for tool, summary in results.items():
+        before = baseline.get(tool)
+        if not before:
+            continue
+        changes = []
+        for label, now_value, old_value in (
+            ("p50", summary["latency_ms"]["p50"], before["latency_ms"]["p50"]),
+            ("p95", summary["latency_ms"]["p95"], before["latency_ms"]["p95"]),
+            ("p99", summary["latency_ms"]["p99"], before["latency_ms"]["p99"]),
+            ("throughput", summary["throughput_per_s"], before["throughput_per_s"])
+        ):
+            changes.append(f"{label} {(now_value - old_value) / old_value * 100:+6.1f}%" if old_value else f"{label} n/a")
+        print(f"{tool:>16}: " + "  ".join(changes))
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(SERVER_PATH),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main_async(args, host, port):
+    os.environ["REDIS_DATING_STORAGE"] = args.storage
+    os.environ["REDIS_DATING_BACKEND"] = args.backend
+    if args.sqlite_path:
+        os.environ["REDIS_DATING_SQLITE_PATH"] = args.sqlite_path
+    server = load_server()
+
+    if args.backend == "sqlite":
+        if os.path.exists(args.sqlite_path):
+            if not args.flush:
+                raise SystemExit(f"{args.sqlite_path} already exists; pass --flush to replace it")
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(args.sqlite_path + suffix):
+                    os.remove(args.sqlite_path + suffix)
+        started = time.perf_counter()
+        names, date_ids = seed_sqlite(server, args.people, args.dates, args.seed)
+        seed_seconds = time.perf_counter() - started
+        print(f"Seeded {len(names)} people x {args.dates} dates (sqlite {args.sqlite_path}) in {seed_seconds:.1f}s")
+        server.get_store().close()
+    else:
+        r = server.get_redis_client()
+        if await r.scard("dating:people:all") and not args.flush:
+            raise SystemExit(f"Redis db {args.db} already holds people; pass --flush to wipe it")
+        await r.flushdb()
+
+        started = time.perf_counter()
+        names, date_ids = await seed(server, args.people, args.dates, args.seed)
+        seed_seconds = time.perf_counter() - started
+        print(f"Seeded {len(names)} people x {args.dates} dates ({server.storage_mode} storage) in {seed_seconds:.1f}s")
+        await r.aclose()
+
+    tools = [tool for tool in TOOL_ORDER if tool in args.tools] if args.tools else list(TOOL_ORDER)
+    if args.fake and "memory_report" in tools:
+        # fakeredis has no MEMORY/OBJECT, and its TCP server drops the connection on unknown commands
+        print("memory_report skipped: fakeredis doesn't implement MEMORY USAGE")
+        tools.remove("memory_report")
+    if args.fake and server.storage_mode == "json" and "migrate_storage" in tools:
+        # Its layout probe gets a WRONGTYPE reply per JSON key, and fakeredis's TCP server drops the
+        # connection when a pipeline holds more than one error reply
+        print("migrate_storage skipped: fakeredis can't pipeline several error replies")
+        tools.remove("migrate_storage")
+    env = dict(os.environ)
+    if args.backend == "redis":
+        env.update({"REDIS_HOST": host, "REDIS_PORT": str(port), "REDIS_DB": str(args.db)})
+    workload = Workload(names, date_ids, server.storage_mode, args.seed)
+    results, server_stats = await drive(args, env, workload, tools)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "backend": args.backend,
+            "redis": None if args.backend == "sqlite" else "fakeredis" if args.fake else f"{host}:{port}/{args.db}",
+            "rtt_ms": args.rtt_ms,
+            "storage": None if args.backend == "sqlite" else server.storage_mode,
+            "sqlite_path": args.sqlite_path if args.backend == "sqlite" else None,
+            "people": args.people,
+            "dates_per_person": args.dates,
+            "concurrency": args.concurrency,
+            "calls": args.calls,
+            "heavy_calls": args.heavy_calls,
+            "seed": args.seed,
+            "seed_seconds": round(seed_seconds, 2)
+        },
+        "tools": results,
+        "server_redis_stats": server_stats
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--people", type=int, default=10000)
+    parser.add_argument("--dates", type=int, default=50, help="date entries per person")
+    parser.add_argument("--concurrency", type=int, default=8, help="calls in flight per tool")
+    parser.add_argument("--calls", type=int, default=200, help="calls per tool")
+    parser.add_argument("--heavy-calls", type=int, default=3, help=f"sequential calls for {', '.join(HEAVY_TOOLS)}")
+    parser.add_argument("--tools", type=lambda value: value.split(","), help="comma-separated subset of tools")
+    parser.add_argument("--storage", choices=["hash", "compact", "json"], default=os.getenv("REDIS_DATING_STORAGE", "hash"))
+    parser.add_argument("--backend", choices=["redis", "sqlite"], default=os.getenv("REDIS_DATING_BACKEND", "redis"))
+    parser.add_argument("--sqlite-path", help="database file for --backend sqlite (default: a fresh temporary file)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--rtt-ms", type=float, default=0, help="simulated round trip (fakeredis only)")
+    parser.add_argument("--flush", action="store_true", help="allow wiping a non-empty Redis database")
+    parser.add_argument("--output", default="bench_tools_results.json")
+    parser.add_argument("--compare", help="previous results file to diff against")
+    parser.add_argument("--server-log", help="file for the server's stderr (default: discarded)")
+    args = parser.parse_args()
+
+    process = None
+    args.fake = args.backend == "redis" and not os.getenv("REDIS_HOST")
+    if args.backend == "sqlite":
+        # No Redis is involved
+        args.sqlite_path = args.sqlite_path or os.path.join(tempfile.mkdtemp(prefix="bench-dating-"), "dating.sqlite3")
+        host, port = None, None
+    elif args.fake:
+        process, port = start_fake_server(args.rtt_ms)
+        host = "127.0.0.1"
+        os.environ["REDIS_HOST"], os.environ["REDIS_PORT"] = host, str(port)
+    else:
+        host, port = os.environ["REDIS_HOST"], int(os.getenv("REDIS_PORT", "6379"))
+    args.db = int(os.getenv("REDIS_DB", "0"))
+
+    try:
+        asyncio.run(main_async(args, host, port))
+    finally:
+        if process is not None:
+            process.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,16 @@ Serves as the single source of truth for people the user is dating.
 
 import sys
 import os
+import base64
 import json
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 # Add the agent directory to path so we can find the venv
 agent_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'agent')
@@ -23,10 +29,13 @@ import asyncio
 import logging
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
+from mcp.types import Tool, TextContent, ToolAnnotations
 
 try:
     import redis
+    from redis import asyncio as aioredis
+    from redis.asyncio.retry import Retry
+    from redis.backoff import AbstractBackoff, EqualJitterBackoff
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
@@ -38,17 +47,144 @@ logger = logging.getLogger("redis-dating-server")
 # Create server instance
 server = Server("redis-dating-server")
 
+# Redis connection pool settings
+REDIS_POOL_MAX_CONNECTIONS = int(os.getenv("REDIS_POOL_MAX_CONNECTIONS", "32"))
+# Seconds a command waits for a free pooled connection before failing
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT", "5"))
+REDIS_SOCKET_KEEPALIVE = os.getenv("REDIS_SOCKET_KEEPALIVE", "true").lower() == "true"
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+# Retries on connection errors and timeouts, with equal-jitter exponential backoff
+REDIS_RETRIES = int(os.getenv("REDIS_RETRIES", "3"))
+REDIS_RETRY_BASE_MS = float(os.getenv("REDIS_RETRY_BASE_MS", "50"))
+REDIS_RETRY_CAP_MS = float(os.getenv("REDIS_RETRY_CAP_MS", "1000"))
+
+# Client metrics reported by redis_stats
+# Latency histogram bucket upper bounds in milliseconds
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, float("inf"))
+command_metrics: Dict[str, Dict[str, Any]] = {}
+retry_metrics = {"retries": 0}
+metrics_started_at = time.time()
+
+def payload_size(value: Any) -> int:
+    """Approximate wire size in bytes of a command argument or reply."""
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8")) if not value.isascii() else len(value)
+    if isinstance(value, dict):
+        return sum(payload_size(k) + payload_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sum(payload_size(item) for item in value)
+    return len(str(value))
+
+def record_command(name: str, elapsed_ms: float, sent: int, received: int, failed: bool = False):
+    """Add one command (or pipeline) execution to the metrics."""
+    metrics = command_metrics.get(name)
+    if metrics is None:
+        metrics = command_metrics[name] = {
+            "calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0,
+            "bytes_sent": 0, "bytes_received": 0, "buckets": [0] * len(LATENCY_BUCKETS_MS)
+        }
+    metrics["calls"] += 1
+    metrics["errors"] += int(failed)
+    metrics["total_ms"] += elapsed_ms
+    metrics["max_ms"] = max(metrics["max_ms"], elapsed_ms)
+    metrics["bytes_sent"] += sent
+    metrics["bytes_received"] += received
+    for i, bound in enumerate(LATENCY_BUCKETS_MS):
+        if elapsed_ms <= bound:
+            metrics["buckets"][i] += 1
+            break
+
+def latency_percentile(buckets: List[int], fraction: float) -> Optional[float]:
+    """Upper bound (ms) of the histogram bucket holding the given percentile."""
+    target = sum(buckets) * fraction
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS_MS, buckets):
+        seen += count
+        if count and seen >= target:
+            return bound if bound != float("inf") else None
+    return None
+
+async def timed_command(name: str, call, sent: int):
+    """Await call() and record its latency and sizes under name."""
+    start = time.perf_counter()
+    try:
+        response = await call()
+    except Exception:
+        record_command(name, (time.perf_counter() - start) * 1000, sent, 0, failed=True)
+        raise
+    record_command(name, (time.perf_counter() - start) * 1000, sent, payload_size(response))
+    return response
+
+if REDIS_AVAILABLE:
+    class CountingBackoff(AbstractBackoff):
+        """Equal-jitter backoff that counts retries for redis_stats."""
+
+        def __init__(self):
+            self.backoff = EqualJitterBackoff(cap=REDIS_RETRY_CAP_MS / 1000, base=REDIS_RETRY_BASE_MS / 1000)
+
+        def reset(self):
+            self.backoff.reset()
+
+        def compute(self, failures: int) -> float:
+            retry_metrics["retries"] += 1
+            return self.backoff.compute(failures)
+
+    class InstrumentedPipeline(aioredis.client.Pipeline):
+        """Pipeline that records each execute() (and WATCH-mode immediate commands)."""
+
+        async def execute(self, raise_on_error: bool = True):
+            name = "MULTI" if self.is_transaction or self.explicit_transaction else "PIPELINE"
+            sent = sum(payload_size(args) for args, _ in self.command_stack)
+            return await timed_command(name, lambda: super(InstrumentedPipeline, self).execute(raise_on_error), sent)
+
+        async def immediate_execute_command(self, *args, **options):
+            return await timed_command(
+                str(args[0]).upper(),
+                lambda: super(InstrumentedPipeline, self).immediate_execute_command(*args, **options),
+                payload_size(args)
+            )
+
+    class InstrumentedRedis(aioredis.Redis):
+        """asyncio Redis client recording per-command latency and payload sizes."""
+
+        async def execute_command(self, *args, **options):
+            return await timed_command(
+                str(args[0]).upper(),
+                lambda: super(InstrumentedRedis, self).execute_command(*args, **options),
+                payload_size(args)
+            )
+
+        def pipeline(self, transaction: bool = True, shard_hint: Optional[str] = None):
+            return InstrumentedPipeline(self.connection_pool, self.response_callbacks, transaction, shard_hint)
+
 # Redis connection
-redis_client: Optional[redis.Redis] = None
+redis_client: Optional["aioredis.Redis"] = None
 
-def get_redis_client() -> redis.Redis:
-    """Get or create Redis client."""
+def get_redis_client() -> "aioredis.Redis":
+    """Get or create the instrumented asyncio Redis client backed by a bounded connection pool."""
     global redis_client
     if redis_client is None:
-        host = os.getenv("REDIS_HOST", "localhost")
-        port = int(os.getenv("REDIS_PORT", "6379"))
-        db = int(os.getenv("REDIS_DB", "0"))
-        redis_client = redis.Redis(host=host, port=port, db=db, decode_responses=True)
+        pool = aioredis.BlockingConnectionPool(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            db=int(os.getenv("REDIS_DB", "0")),
+            decode_responses=True,
+            max_connections=REDIS_POOL_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT,
+            socket_keepalive=REDIS_SOCKET_KEEPALIVE,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+            retry=Retry(CountingBackoff(), REDIS_RETRIES),
+            retry_on_error=[redis.exceptions.ConnectionError, redis.exceptions.TimeoutError]
+        )
+        redis_client = InstrumentedRedis(connection_pool=pool)
     return redis_client
 
 def normalize_name(name: str) -> str:
@@ -70,25 +206,712 @@ def get_timestamp() -> str:
     """Get current ISO timestamp."""
     return datetime.now().isoformat()
 
-def ensure_index(normalized_name: str):
-    """Ensure person is in the index set."""
+def ensure_index(normalized_name: str, pipe):
+    """Queue adding a person to the index set."""
+    pipe.sadd("dating:people:all", normalized_name)
+
+def remove_from_index(normalized_name: str, pipe):
+    """Queue removing a person from the index set."""
+    pipe.srem("dating:people:all", normalized_name)
+
+# Derived data (statistics counters) kept in sync with person hashes
+STATS_STATUS_KEY = "dating:stats:status"
+STATS_HOW_WE_MET_KEY = "dating:stats:how_we_met"
+INDEX_VERSION_KEY = "dating:meta:index_version"
+# Bump when derived keys change shape so startup rebuilds them
+INDEX_VERSION = "6"
+# Sorted set of every date entry, scored by the epoch seconds of its `when`
+DATES_INDEX_KEY = "dating:dates:by_when"
+# Hash of date id -> normalized name of the person the date belongs to
+DATE_OWNER_KEY = "dating:dates:owner"
+# Name search postings: sets of normalized names per trigram, short prefix and phonetic code
+SEARCH_KEY_PATTERN = "dating:search:*"
+# Queries shorter than a trigram are answered from prefix postings of this length or less
+SEARCH_PREFIX_MAX_LENGTH = 2
+# Fraction of query trigrams a name must share to count as a fuzzy match
+SEARCH_MIN_TRIGRAM_SIMILARITY = float(os.getenv("REDIS_DATING_SEARCH_MIN_SIMILARITY", "0.5"))
+# Capped stream of person change events (approximate MAXLEN trimming)
+CHANGES_STREAM_KEY = "dating:changes"
+CHANGES_STREAM_MAXLEN = int(os.getenv("REDIS_DATING_CHANGES_MAXLEN", "10000"))
+# Analytics rollups read by get_analytics
+ANALYTICS_TOTALS_KEY = "dating:analytics:totals"  # total_dates, ended_days_sum, ended_count
+ANALYTICS_START_MONTH_KEY = "dating:analytics:start_month"  # YYYY-MM of start_date -> people
+ANALYTICS_DATE_MONTH_KEY = "dating:analytics:date_month"  # YYYY-MM of a date's when -> dates
+ANALYTICS_FREQUENCY_KEY = "dating:analytics:date_frequency"  # dates per person -> people
+ANALYTICS_LOCATIONS_KEY = "dating:analytics:locations"  # zset: where -> dates
+ANALYTICS_DATES_PER_PERSON_KEY = "dating:analytics:dates_per_person"  # zset: person -> dates (> 0)
+ANALYTICS_ENDED_DAYS_KEY = "dating:analytics:ended_days"  # zset: person -> end - start in days (> 0)
+ANALYTICS_ONGOING_START_KEY = "dating:analytics:ongoing_start"  # zset: person without end_date -> start epoch
+ANALYTICS_KEYS = (
+    ANALYTICS_TOTALS_KEY, ANALYTICS_START_MONTH_KEY, ANALYTICS_DATE_MONTH_KEY, ANALYTICS_FREQUENCY_KEY,
+    ANALYTICS_LOCATIONS_KEY, ANALYTICS_DATES_PER_PERSON_KEY, ANALYTICS_ENDED_DAYS_KEY, ANALYTICS_ONGOING_START_KEY
+)
+# Counter rollups stored as sorted sets (so top-N is a range read) rather than hashes
+ANALYTICS_ZSET_COUNTERS = (ANALYTICS_LOCATIONS_KEY,)
+# Archive tier: inactive people live in compressed string keys outside dating:people:all
+# and the lookup indexes, but still count in the statistics counters and analytics rollups
+ARCHIVE_KEY_PREFIX = "dating:archive:"
+ARCHIVE_INDEX_KEY = "dating:people:archived"  # zset: person -> archived epoch
+# Automatic archiving of people inactive for this many days (0 disables it)
+ARCHIVE_AFTER_DAYS = float(os.getenv("REDIS_DATING_ARCHIVE_AFTER_DAYS", "0"))
+ARCHIVE_INTERVAL_SECONDS = float(os.getenv("REDIS_DATING_ARCHIVE_INTERVAL_SECONDS", "3600"))
+# Storage backend: "redis", or "sqlite" for an embedded database file (single-node installs without Redis)
+STORAGE_BACKEND = os.getenv("REDIS_DATING_BACKEND", "redis").lower()
+SQLITE_PATH = os.getenv(
+    "REDIS_DATING_SQLITE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "dating.sqlite3")
+)
+
+def get_status_index_key(status: str) -> str:
+    """Get the secondary index set holding everyone with a (canonical) status."""
+    return f"dating:people:status:{status}"
+
+def parse_dates_field(raw_dates: Any) -> List[Dict[str, Any]]:
+    """Parse a stored dates value into a list of entries (invalid data yields [])."""
+    if isinstance(raw_dates, str):
+        if not raw_dates:
+            return []
+        try:
+            raw_dates = json.loads(raw_dates)
+        except json.JSONDecodeError:
+            return []
+    if not isinstance(raw_dates, list):
+        return []
+    return [entry for entry in raw_dates if isinstance(entry, dict)]
+
+def parse_when(value: Any) -> Optional[float]:
+    """Convert an ISO date/datetime to epoch seconds (naive values are UTC)."""
+    if not value or not isinstance(value, str):
+        return None
+    cleaned = value.strip()
+    if cleaned.endswith("Z"):
+        cleaned = cleaned[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(cleaned)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+def iso_month(value: Any) -> Optional[str]:
+    """YYYY-MM of an ISO date/datetime, or None if it doesn't parse."""
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.strip().replace("Z", "+00:00")).strftime("%Y-%m")
+    except ValueError:
+        return None
+
+def get_date_index_member(normalized_name: str, date_id: str) -> str:
+    """Encode a (person, date id) pair as a dates index member."""
+    return json.dumps([normalized_name, date_id])
+
+def indexed_dates(normalized_name: str, person_data: Dict[str, Any]) -> Dict[str, float]:
+    """Map dates index member -> score for a person's date entries."""
+    members = {}
+    for entry in parse_dates_field(person_data.get("dates")):
+        if not entry.get("id"):
+            continue
+        score = parse_when(entry.get("when") or entry.get("date"))
+        # Entries without a parseable `when` sort first and only show up in unbounded queries
+        members[get_date_index_member(normalized_name, str(entry["id"]))] = score if score is not None else 0
+    return members
+
+SOUNDEX_CODES = {
+    **dict.fromkeys("bfpv", "1"), **dict.fromkeys("cgjkqsxz", "2"), **dict.fromkeys("dt", "3"),
+    "l": "4", **dict.fromkeys("mn", "5"), "r": "6"
+}
+
+def soundex(word: str) -> Optional[str]:
+    """American Soundex code for a word (None when it has no ASCII letters)."""
+    letters = [c for c in word.lower() if "a" <= c <= "z"]
+    if not letters:
+        return None
+    code = letters[0].upper()
+    previous = SOUNDEX_CODES.get(letters[0], "")
+    for c in letters[1:]:
+        digit = SOUNDEX_CODES.get(c, "")
+        if digit and digit != previous:
+            code += digit
+            if len(code) == 4:
+                break
+        # h and w don't separate letters with the same code; vowels do
+        if c not in "hw":
+            previous = digit
+    return code.ljust(4, "0")
+
+def name_tokens(text: str) -> List[str]:
+    """Split a normalized name into words."""
+    return re.findall(r"[^\W_]+", text)
+
+def name_trigrams(text: str) -> Set[str]:
+    """All three-character substrings of a normalized name or query."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def get_search_postings(normalized_name: str) -> Set[str]:
+    """Search posting keys a person's name is filed under."""
+    keys = {f"dating:search:tri:{trigram}" for trigram in name_trigrams(normalized_name)}
+    for token in [normalized_name] + name_tokens(normalized_name):
+        for length in range(1, min(len(token), SEARCH_PREFIX_MAX_LENGTH) + 1):
+            keys.add(f"dating:search:prefix:{token[:length]}")
+    for token in name_tokens(normalized_name):
+        code = soundex(token)
+        if code:
+            keys.add(f"dating:search:phonetic:{code}")
+    return keys
+
+LEGACY_STATUS_MAP = {"past": "not_pursuing"}
+
+def canonical_status(status: Optional[str]) -> str:
+    """Lowercase a status, defaulting to active and mapping legacy values."""
+    status = (status or "active").lower()
+    return LEGACY_STATUS_MAP.get(status, status)
+
+def effective_how_we_met(person_data: Dict[str, str]) -> Optional[str]:
+    """How we met, falling back to the legacy meeting_place field."""
+    return person_data.get("how_we_met") or person_data.get("meeting_place") or None
+
+def queue_index_updates(pipe, normalized_name: str, old: Optional[Dict[str, str]],
+                        new: Optional[Dict[str, str]]):
+    """
+    Queue updates to derived keys for a person going from old to new.
+
+    Either side may be None (create/delete). Must be called after
+    pipe.multi() so the updates commit atomically with the record write.
+    Also bumps the person's version and appends a change event.
+    """
+    queue_hot_index_updates(pipe, normalized_name, old, new)
+    queue_stats_updates(pipe, old, new)
+    queue_analytics_updates(pipe, normalized_name, old, new)
+    queue_change_event(pipe, normalized_name, old, new)
+
+def queue_hot_index_updates(pipe, normalized_name: str, old: Optional[Dict[str, str]],
+                            new: Optional[Dict[str, str]]):
+    """Queue updates to the lookup indexes (status sets, dates index and owner, search postings)."""
+    old_status = canonical_status(old.get("status")) if old is not None else None
+    new_status = canonical_status(new.get("status")) if new is not None else None
+    if old_status != new_status:
+        if old_status:
+            pipe.srem(get_status_index_key(old_status), normalized_name)
+        if new_status:
+            pipe.sadd(get_status_index_key(new_status), normalized_name)
+
+    old_dates = indexed_dates(normalized_name, old) if old is not None else {}
+    new_dates = indexed_dates(normalized_name, new) if new is not None else {}
+    removed_dates = [member for member in old_dates if member not in new_dates]
+    if removed_dates:
+        pipe.zrem(DATES_INDEX_KEY, *removed_dates)
+        pipe.hdel(DATE_OWNER_KEY, *[json.loads(member)[1] for member in removed_dates])
+    changed_dates = {member: score for member, score in new_dates.items() if old_dates.get(member) != score}
+    if changed_dates:
+        pipe.zadd(DATES_INDEX_KEY, changed_dates)
+    added_dates = [member for member in new_dates if member not in old_dates]
+    if added_dates:
+        pipe.hset(DATE_OWNER_KEY, mapping={json.loads(member)[1]: normalized_name for member in added_dates})
+
+    # Search postings depend only on the normalized name, so they change on create/delete
+    if old is None and new is not None:
+        for posting_key in get_search_postings(normalized_name):
+            pipe.sadd(posting_key, normalized_name)
+    elif old is not None and new is None:
+        for posting_key in get_search_postings(normalized_name):
+            pipe.srem(posting_key, normalized_name)
+
+def queue_stats_updates(pipe, old: Optional[Dict[str, str]], new: Optional[Dict[str, str]]):
+    """Queue updates to the status and how-we-met counters read by get_statistics."""
+    old_status = canonical_status(old.get("status")) if old is not None else None
+    new_status = canonical_status(new.get("status")) if new is not None else None
+    if old_status != new_status:
+        if old_status:
+            pipe.hincrby(STATS_STATUS_KEY, old_status, -1)
+        if new_status:
+            pipe.hincrby(STATS_STATUS_KEY, new_status, 1)
+
+    old_how_we_met = effective_how_we_met(old) if old is not None else None
+    new_how_we_met = effective_how_we_met(new) if new is not None else None
+    if old_how_we_met != new_how_we_met:
+        if old_how_we_met:
+            pipe.hincrby(STATS_HOW_WE_MET_KEY, old_how_we_met, -1)
+        if new_how_we_met:
+            pipe.hincrby(STATS_HOW_WE_MET_KEY, new_how_we_met, 1)
+
+def analytics_contribution(normalized_name: str, person_data: Optional[Dict[str, str]]
+                           ) -> Tuple[Dict[Tuple[str, str], int], Dict[Tuple[str, str], float]]:
+    """
+    A person's share of the analytics rollups.
+
+    Returns (counters, members): counter increments keyed by (key, field),
+    and sorted set memberships keyed by (key, member) with their scores.
+    """
+    counters: Dict[Tuple[str, str], int] = {}
+    members: Dict[Tuple[str, str], float] = {}
+    if person_data is None:
+        return counters, members
+    
+    def count(key, field, amount=1):
+        counters[(key, field)] = counters.get((key, field), 0) + amount
+    
+    start_month = iso_month(person_data.get("start_date"))
+    if start_month:
+        count(ANALYTICS_START_MONTH_KEY, start_month)
+    
+    dates = parse_dates_field(person_data.get("dates"))
+    count(ANALYTICS_FREQUENCY_KEY, str(len(dates)))
+    if dates:
+        count(ANALYTICS_TOTALS_KEY, "total_dates", len(dates))
+        members[(ANALYTICS_DATES_PER_PERSON_KEY, normalized_name)] = len(dates)
+    for entry in dates:
+        location = entry.get("where", "Unknown")
+        if location:
+            count(ANALYTICS_LOCATIONS_KEY, str(location))
+        date_month = iso_month(entry.get("when"))
+        if date_month:
+            count(ANALYTICS_DATE_MONTH_KEY, date_month)
+    
+    start = parse_when(person_data.get("start_date"))
+    end = parse_when(person_data.get("end_date"))
+    if start is not None and end is not None:
+        days = int((end - start) // 86400)
+        if days > 0:
+            count(ANALYTICS_TOTALS_KEY, "ended_days_sum", days)
+            count(ANALYTICS_TOTALS_KEY, "ended_count")
+            members[(ANALYTICS_ENDED_DAYS_KEY, normalized_name)] = days
+    elif start is not None:
+        # Ongoing durations grow with time, so only the start is stored
+        members[(ANALYTICS_ONGOING_START_KEY, normalized_name)] = start
+    return counters, members
+
+def queue_analytics_updates(pipe, normalized_name: str, old: Optional[Dict[str, str]],
+                            new: Optional[Dict[str, str]]):
+    """Queue the difference between a person's old and new analytics contributions."""
+    old_counters, old_members = analytics_contribution(normalized_name, old)
+    new_counters, new_members = analytics_contribution(normalized_name, new)
+    
+    trimmed = set()
+    for key, field in set(old_counters) | set(new_counters):
+        delta = new_counters.get((key, field), 0) - old_counters.get((key, field), 0)
+        if not delta:
+            continue
+        if key in ANALYTICS_ZSET_COUNTERS:
+            pipe.zincrby(key, delta, field)
+            if delta < 0:
+                trimmed.add(key)
+        else:
+            pipe.hincrby(key, field, delta)
+    # Drop sorted set counters that reached zero so top-N reads stay clean
+    for key in trimmed:
+        pipe.zremrangebyscore(key, "-inf", 0)
+    
+    for key, member in old_members:
+        if (key, member) not in new_members:
+            pipe.zrem(key, member)
+    for (key, member), score in new_members.items():
+        if old_members.get((key, member)) != score:
+            pipe.zadd(key, {member: score})
+
+def describe_change(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]],
+                    op: Optional[str] = None) -> Tuple[str, List[str], int]:
+    """
+    The (op, changed fields, version) of a change event for a person going from old to new.
+
+    `op` overrides the create/update/delete inferred from old and new.
+    """
+    old_fields = old or {}
+    new_fields = new or {}
+    try:
+        version = int(old_fields.get("version") or 0) + 1
+    except ValueError:
+        version = 1
+    changed = sorted(
+        field for field in set(old_fields) | set(new_fields)
+        if field != "version" and old_fields.get(field) != new_fields.get(field)
+    )
+    if op in ("archive", "restore"):
+        # The record only moves between its hot and archive keys; its contents don't change
+        changed = []
+    if new is None:
+        op = op or "delete"
+    else:
+        op = op or ("create" if old is None else "update")
+    return op, changed, version
+
+def queue_change_event(pipe, normalized_name: str, old: Optional[Dict[str, str]],
+                       new: Optional[Dict[str, str]], op: Optional[str] = None) -> int:
+    """
+    Queue the next version of a person and a change event describing it.
+
+    The version lives in the person hash, so the WATCH on that key makes it
+    race-free. It is also set on `new` so callers return what they wrote.
+    Returns the version.
+    """
+    op, changed, version = describe_change(old, new, op)
+    if new is not None:
+        new["version"] = str(version)
+        queue_person_write(pipe, f"dating:person:{normalized_name}", {"version": str(version)})
+    pipe.xadd(
+        CHANGES_STREAM_KEY,
+        {"person": normalized_name, "op": op, "fields": ",".join(changed), "version": version},
+        maxlen=CHANGES_STREAM_MAXLEN,
+        approximate=True
+    )
+    return version
+
+# Person records are stored as hashes (dates as a JSON string), compact hashes
+# (short field names, large dates compressed) or, with the RedisJSON module,
+# as JSON documents (dates as a native array)
+STORAGE_MODES = ("hash", "compact", "json")
+STORAGE_MODE_KEY = "dating:meta:storage"
+REQUESTED_STORAGE_MODE = os.getenv("REDIS_DATING_STORAGE", "hash").lower()
+JSON_PROBE_KEY = "dating:meta:json_probe"
+# Layout in use, settled at startup by ensure_storage_mode
+storage_mode = "hash"
+# Short hash field names used by the compact layout; tools still see the long ones
+COMPACT_FIELD_NAMES = {
+    "name": "n", "status": "s", "start_date": "sd", "end_date": "ed", "how_we_met": "hw",
+    "meeting_place": "mp", "next_date": "nd", "dates": "d", "details": "dt", "memory_tags": "mt",
+    "photo_url": "p", "created_at": "ca", "last_updated": "lu", "version": "v"
+}
+EXPANDED_FIELD_NAMES = {short: field for field, short in COMPACT_FIELD_NAMES.items()}
+# In the compact layout, dates values at least this long are stored zlib-compressed
+COMPRESS_MIN_BYTES = int(os.getenv("REDIS_DATING_COMPRESS_MIN_BYTES", "128"))
+COMPRESSED_PREFIX = "z:"
+
+def json_path(field: str) -> str:
+    """JSONPath of a top-level document field."""
+    if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", field):
+        return f"$.{field}"
+    return f"$[{json.dumps(field)}]"
+
+def to_document(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert hash fields to document values, parsing dates into an array."""
+    document = dict(fields)
+    raw_dates = document.get("dates")
+    if isinstance(raw_dates, str):
+        try:
+            parsed = json.loads(raw_dates) if raw_dates else []
+        except json.JSONDecodeError:
+            parsed = None
+        if isinstance(parsed, list):
+            document["dates"] = parsed
+    return document
+
+def to_hash_fields(document: Dict[str, Any]) -> Dict[str, str]:
+    """Convert document values to hash fields, JSON-encoding anything that isn't a string."""
+    return {field: value if isinstance(value, str) else json.dumps(value) for field, value in document.items()}
+
+def compress_value(value: str) -> str:
+    """
+    zlib-compress a long value (base64, so it stays valid UTF-8).
+
+    The original is kept when it is short or compression doesn't shrink it.
+    """
+    if len(value.encode()) < COMPRESS_MIN_BYTES:
+        return value
+    packed = COMPRESSED_PREFIX + base64.b64encode(zlib.compress(value.encode(), 9)).decode("ascii")
+    return packed if len(packed) < len(value.encode()) else value
+
+def decompress_value(value: str) -> str:
+    """Undo compress_value (uncompressed values pass through)."""
+    if not value.startswith(COMPRESSED_PREFIX):
+        return value
+    return zlib.decompress(base64.b64decode(value[len(COMPRESSED_PREFIX):])).decode()
+
+def to_compact_fields(fields: Dict[str, str]) -> Dict[str, str]:
+    """Rename hash fields to their short names and compress large dates values."""
+    return {
+        COMPACT_FIELD_NAMES.get(field, field): compress_value(value) if field == "dates" else value
+        for field, value in fields.items()
+    }
+
+def from_compact_fields(compact: Dict[str, str]) -> Dict[str, str]:
+    """Expand short hash field names and decompress dates (plain fields pass through)."""
+    fields = {}
+    for short, value in compact.items():
+        field = EXPANDED_FIELD_NAMES.get(short, short)
+        fields[field] = decompress_value(value) if field == "dates" else value
+    return fields
+
+def to_stored(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Fields as the current storage mode reads them back."""
+    return to_document(fields) if storage_mode == "json" else fields
+
+def decode_document(reply: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode a `JSON.GET key $` reply (None if the key is missing)."""
+    if reply is None:
+        return None
+    documents = json.loads(reply)
+    if documents and isinstance(documents[0], dict):
+        return documents[0] or None
+    return None
+
+def person_read_command(client, key: str, fields: Optional[List[str]] = None):
+    """
+    Issue the read of a person record, or queue it on a buffered pipeline.
+
+    Decode the reply with decode_person using the same fields.
+    """
+    if storage_mode == "json":
+        if not fields:
+            return client.execute_command("JSON.GET", key, "$")
+        paths = [json_path(field) for field in fields]
+        # Several paths always reply {path: [matches]}; a lone path's reply shape varies between
+        # implementations, so it is sent twice
+        return client.execute_command("JSON.GET", key, *(paths * 2 if len(paths) == 1 else paths))
+    if storage_mode == "compact" and fields:
+        fields = [COMPACT_FIELD_NAMES.get(field, field) for field in fields]
+    return client.hmget(key, fields) if fields else client.hgetall(key)
+
+def decode_person(reply: Any, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Decode a person read into its fields; absent fields are left out and a missing record is None."""
+    if storage_mode == "json":
+        if not fields:
+            return decode_document(reply)
+        if reply is None:
+            return None
+        values = json.loads(reply)
+        data = {field: values[json_path(field)][0] for field in fields if values.get(json_path(field))}
+    elif fields:
+        data = {field: value for field, value in zip(fields, reply) if value is not None}
+        if storage_mode == "compact" and "dates" in data:
+            data["dates"] = decompress_value(data["dates"])
+    else:
+        data = from_compact_fields(reply) if storage_mode == "compact" else reply
+    return data or None
+
+async def read_person(client, key: str, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Read a person record (or some of its fields) with a direct or WATCHing client."""
+    return decode_person(await person_read_command(client, key, fields), fields)
+
+def queue_person_write(pipe, key: str, fields: Dict[str, Any], create: bool = False,
+                       mode: Optional[str] = None):
+    """
+    Queue writing fields of a person record in the current (or given) storage mode.
+
+    With create, fields are the whole record and the key must not exist yet;
+    JSON documents have to be created at the root before fields can be set.
+    """
+    mode = mode or storage_mode
+    if mode == "json":
+        document = to_document(fields)
+        if create:
+            pipe.execute_command("JSON.SET", key, "$", json.dumps(document))
+        else:
+            for field, value in document.items():
+                pipe.execute_command("JSON.SET", key, json_path(field), json.dumps(value))
+    else:
+        hash_fields = to_hash_fields(fields)
+        pipe.hset(key, mapping=to_compact_fields(hash_fields) if mode == "compact" else hash_fields)
+
+# Optional in-process LRU cache of whole person records (size 0 disables it)
+PERSON_CACHE_SIZE = int(os.getenv("REDIS_DATING_CACHE_SIZE", "0"))
+PERSON_CACHE_TTL_SECONDS = float(os.getenv("REDIS_DATING_CACHE_TTL_SECONDS", "30"))
+person_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+cache_metrics = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+# Bumped by every invalidation; a read only fills the cache if it didn't change meanwhile,
+# so a read racing a write can't cache the old record
+cache_generation = 0
+# "subscribed" while keyspace notifications are being received
+cache_notifications = "off"
+
+def cache_lookup(key: str) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached, unexpired person record, counting the hit or miss."""
+    entry = person_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        person_cache.move_to_end(key)
+        cache_metrics["hits"] += 1
+        return dict(entry[1])
+    if entry is not None:
+        del person_cache[key]
+    cache_metrics["misses"] += 1
+    return None
+
+def cache_store(key: str, person_data: Dict[str, Any], generation: int):
+    """Cache a person record read at `generation`, evicting the least recently used past the size limit."""
+    if generation != cache_generation:
+        return
+    person_cache[key] = (time.monotonic() + PERSON_CACHE_TTL_SECONDS, dict(person_data))
+    person_cache.move_to_end(key)
+    while len(person_cache) > PERSON_CACHE_SIZE:
+        person_cache.popitem(last=False)
+        cache_metrics["evictions"] += 1
+
+def cache_invalidate(*keys: str):
+    """Drop person records from the cache (all of them when no keys are given)."""
+    global cache_generation
+    cache_generation += 1
+    for key in keys or list(person_cache):
+        if person_cache.pop(key, None) is not None:
+            cache_metrics["invalidations"] += 1
+
+async def read_person_cached(key: str) -> Optional[Dict[str, Any]]:
+    """read_person through the person cache; for reads outside transactions only."""
+    r = get_redis_client()
+    if not PERSON_CACHE_SIZE:
+        return await read_person(r, key)
+    person_data = cache_lookup(key)
+    if person_data is None:
+        generation = cache_generation
+        person_data = await read_person(r, key)
+        if person_data is not None:
+            cache_store(key, person_data, generation)
+    return person_data
+
+async def watch_person_invalidations():
+    """
+    Invalidate cached person records from Redis keyspace notifications.
+
+    Catches writes made by other processes. It needs notify-keyspace-events to
+    include K and the generic, hash and module classes (e.g. "KA"). The cache
+    is cleared whenever the subscription is (re)established, since events may
+    have been missed in between. Without notifications, entries still expire
+    after PERSON_CACHE_TTL_SECONDS.
+    """
+    global cache_notifications
+    r = get_redis_client()
+    try:
+        flags = (await r.config_get("notify-keyspace-events")).get("notify-keyspace-events", "")
+        if "K" not in flags:
+            logger.warning(
+                "notify-keyspace-events doesn't publish keyspace events - cached people only see other "
+                f"processes' writes after {PERSON_CACHE_TTL_SECONDS}s"
+            )
+    except redis.exceptions.ResponseError:
+        pass
+    
+    pattern = f"__keyspace@{int(os.getenv('REDIS_DB', '0'))}__:dating:person:*"
+    channel_prefix_length = len(pattern) - len("dating:person:*")
+    delay = 1
+    while True:
+        pubsub = r.pubsub()
+        try:
+            await pubsub.psubscribe(pattern)
+            cache_invalidate()
+            cache_notifications = "subscribed"
+            delay = 1
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message["type"] == "pmessage":
+                    cache_invalidate(message["channel"][channel_prefix_length:])
+        except asyncio.CancelledError:
+            cache_notifications = "off"
+            raise
+        except Exception as e:
+            cache_notifications = "reconnecting"
+            logger.warning(f"Keyspace notification subscription failed: {e} - retrying in {delay}s")
+        finally:
+            cache_invalidate()
+            await pubsub.reset()
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 30)
+
+# Returned from a transaction instead of a result when the person has to be restored first
+RESTORE_NEEDED = object()
+
+async def run_person_transaction(key: str, func, restore: bool = False) -> Dict[str, Any]:
+    """
+    Run func(pipe, old_data) under WATCH on a person key, retrying on conflict.
+
+    old_data is the current record or None. func queues its writes after
+    calling pipe.multi() and returns the tool result; returning without
+    calling multi() aborts the write. With restore, an archived person is
+    restored first, so func sees their record.
+    """
     r = get_redis_client()
-    r.sadd("dating:people:all", normalized_name)
+    normalized_name = key[len("dating:person:"):]
 
-def remove_from_index(normalized_name: str):
-    """Remove person from index set."""
+    async def transaction(pipe):
+        old_data = await read_person(pipe, key)
+        # Only misses pay for the archive check
+        if old_data is None and restore and await pipe.zscore(ARCHIVE_INDEX_KEY, normalized_name) is not None:
+            return RESTORE_NEEDED
+        return func(pipe, old_data)
+
+    try:
+        result = await r.transaction(transaction, key, value_from_callable=True)
+        if result is RESTORE_NEEDED:
+            await restore_archived(normalized_name)
+            restore = False
+            result = await r.transaction(transaction, key, value_from_callable=True)
+        return result
+    finally:
+        # After EXEC, so a concurrent read of the old record can't be cached past the write
+        cache_invalidate(key)
+
+# Number of HGETALL commands sent per pipeline round trip during bulk reads
+BULK_READ_CHUNK_SIZE = int(os.getenv("REDIS_DATING_BULK_CHUNK_SIZE", "500"))
+
+async def fetch_people(normalized_names: List[str], fields: Optional[List[str]] = None,
+                       atomic: bool = False, use_cache: bool = False) -> List[Tuple[str, Dict[str, str]]]:
+    """
+    Fetch many person records using pipelined HGETALL (or JSON.GET) calls.
+
+    Names are sent in chunks of BULK_READ_CHUNK_SIZE so very large sets don't
+    build one huge reply buffer. Missing keys come back empty and are
+    skipped, which replaces the per-person EXISTS check. With `fields`, only
+    those fields are read (HMGET or JSONPath) and absent ones are left out. With
+    `atomic`, everything is read in one MULTI/EXEC as a consistent snapshot.
+    With `use_cache`, cached records are served from the person cache and
+    whole records read from Redis are added to it.
+
+    Returns (normalized_name, person_data) pairs.
+    """
+    if use_cache and PERSON_CACHE_SIZE and not atomic:
+        cached = {}
+        for normalized_name in normalized_names:
+            person_data = cache_lookup(f"dating:person:{normalized_name}")
+            if person_data is not None:
+                cached[normalized_name] = project(person_data, fields)
+        generation = cache_generation
+        fetched = dict(await fetch_people([name for name in normalized_names if name not in cached], fields))
+        if not fields:
+            for normalized_name, person_data in fetched.items():
+                cache_store(f"dating:person:{normalized_name}", person_data, generation)
+        return [
+            (normalized_name, cached.get(normalized_name) or fetched[normalized_name])
+            for normalized_name in normalized_names if normalized_name in cached or normalized_name in fetched
+        ]
+    
+    r = get_redis_client()
+    people = []
+    names = list(normalized_names)
+    chunk_size = max(len(names), 1) if atomic else BULK_READ_CHUNK_SIZE
+    for start in range(0, len(names), chunk_size):
+        chunk = names[start:start + chunk_size]
+        pipe = r.pipeline(transaction=atomic)
+        for normalized_name in chunk:
+            person_read_command(pipe, f"dating:person:{normalized_name}", fields)
+        for normalized_name, reply in zip(chunk, await pipe.execute()):
+            person_data = decode_person(reply, fields)
+            if person_data:
+                people.append((normalized_name, person_data))
+    return people
+
+async def fetch_all_people() -> List[Tuple[str, Dict[str, str]]]:
+    """Fetch every indexed person record."""
     r = get_redis_client()
-    r.srem("dating:people:all", normalized_name)
+    return await fetch_people(await r.smembers("dating:people:all"))
 
 # High-Level Operations
 
 def serialize_dates_field(dates: Optional[Any]) -> Optional[str]:
-    """Serialize dates data to JSON for storage."""
+    """Serialize dates data to JSON for storage, giving every entry a stable id."""
     if dates is None:
         return None
     
     if isinstance(dates, str):
-        return dates
+        try:
+            parsed = json.loads(dates) if dates else None
+        except json.JSONDecodeError:
+            return dates
+        if not isinstance(parsed, list):
+            return dates
+        dates = parsed
+    
+    if isinstance(dates, list):
+        dates = [
+            {**entry, "id": str(uuid.uuid4())} if isinstance(entry, dict) and not entry.get("id") else entry
+            for entry in dates
+        ]
     
     try:
         return json.dumps(dates)
@@ -96,26 +919,18 @@ def serialize_dates_field(dates: Optional[Any]) -> Optional[str]:
         raise ValueError("Dates must be JSON serializable (array of objects).")
 
 
-async def create_person(name: str, start_date: Optional[str] = None, 
-                       end_date: Optional[str] = None, meeting_place: Optional[str] = None,
-                       details: Optional[str] = None, status: Optional[str] = None,
-                       memory_tags: Optional[str] = None, how_we_met: Optional[str] = None,
-                       next_date: Optional[str] = None, dates: Optional[Any] = None,
-                       photo_url: Optional[str] = None) -> Dict[str, Any]:
-    """Create a new person record."""
+def build_person_record(name: str, start_date: Optional[str] = None,
+                        end_date: Optional[str] = None, meeting_place: Optional[str] = None,
+                        details: Optional[str] = None, status: Optional[str] = None,
+                        memory_tags: Optional[str] = None, how_we_met: Optional[str] = None,
+                        next_date: Optional[str] = None, dates: Optional[Any] = None,
+                        photo_url: Optional[str] = None) -> Dict[str, str]:
+    """Build a new person's hash fields (raises ValueError for invalid input)."""
     if not name:
-        return {"success": False, "error": "Name is required"}
+        raise ValueError("Name is required")
     
     if status and not validate_status(status):
-        return {"success": False, "error": "Invalid status. Must be one of: active, paused, exploring, not_pursuing"}
-    
-    r = get_redis_client()
-    normalized_name = normalize_name(name)
-    key = get_person_key(name)
-    
-    # Check if person already exists
-    if r.exists(key):
-        return {"success": False, "error": f"Person '{name}' already exists. Use update_person to modify."}
+        raise ValueError("Invalid status. Must be one of: active, paused, exploring, not_pursuing")
     
     # Set default status
     if not status:
@@ -146,43 +961,61 @@ async def create_person(name: str, start_date: Optional[str] = None,
     if photo_url:
         person_data["photo_url"] = photo_url
     if dates is not None:
-        try:
-            serialized_dates = serialize_dates_field(dates)
-            if serialized_dates is not None:
-                person_data["dates"] = serialized_dates
-        except ValueError as e:
-            return {"success": False, "error": str(e)}
-    
-    # Store in Redis
-    r.hset(key, mapping=person_data)
-    
-    # Add to index
-    ensure_index(normalized_name)
-    
-    return {"success": True, "data": person_data}
+        serialized_dates = serialize_dates_field(dates)
+        if serialized_dates is not None:
+            person_data["dates"] = serialized_dates
+    return person_data
 
-async def update_person(name: str, start_date: Optional[str] = None,
+async def create_person(name: str, start_date: Optional[str] = None, 
                        end_date: Optional[str] = None, meeting_place: Optional[str] = None,
                        details: Optional[str] = None, status: Optional[str] = None,
                        memory_tags: Optional[str] = None, how_we_met: Optional[str] = None,
                        next_date: Optional[str] = None, dates: Optional[Any] = None,
                        photo_url: Optional[str] = None) -> Dict[str, Any]:
-    """Update an existing person record."""
-    if not name:
-        return {"success": False, "error": "Name is required"}
-    
-    if status and not validate_status(status):
-        return {"success": False, "error": "Invalid status. Must be one of: active, paused, exploring, not_pursuing"}
+    """Create a new person record."""
+    try:
+        person_data = build_person_record(
+            name, start_date=start_date, end_date=end_date, meeting_place=meeting_place,
+            details=details, status=status, memory_tags=memory_tags, how_we_met=how_we_met,
+            next_date=next_date, dates=dates, photo_url=photo_url
+        )
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
     
-    r = get_redis_client()
     normalized_name = normalize_name(name)
     key = get_person_key(name)
+    person_data = to_stored(person_data)
     
-    # Check if person exists
-    if not r.exists(key):
-        return {"success": False, "error": f"Person '{name}' not found. Use create_person to create a new record."}
+    def write(pipe, old_data):
+        # Check if person already exists
+        if old_data is not None:
+            return {"success": False, "error": f"Person '{name}' already exists. Use update_person to modify."}
+        
+        pipe.multi()
+        # Store in Redis
+        queue_person_write(pipe, key, person_data, create=True)
+        # Add to index
+        ensure_index(normalized_name, pipe)
+        queue_index_updates(pipe, normalized_name, None, person_data)
+        return {"success": True, "data": person_data}
+    
+    return await run_person_transaction(key, write, restore=True)
+
+# Fields update_person / update_people accept besides name
+UPDATABLE_FIELDS = (
+    "start_date", "end_date", "meeting_place", "details", "status",
+    "memory_tags", "how_we_met", "next_date", "dates", "photo_url"
+)
+
+def build_update_data(start_date: Optional[str] = None, end_date: Optional[str] = None,
+                      meeting_place: Optional[str] = None, details: Optional[str] = None,
+                      status: Optional[str] = None, memory_tags: Optional[str] = None,
+                      how_we_met: Optional[str] = None, next_date: Optional[str] = None,
+                      dates: Optional[Any] = None, photo_url: Optional[str] = None) -> Dict[str, str]:
+    """Build the fields an update writes (raises ValueError for invalid input)."""
+    if status and not validate_status(status):
+        raise ValueError("Invalid status. Must be one of: active, paused, exploring, not_pursuing")
     
-    # Build update data
     update_data = {"last_updated": get_timestamp()}
     
     if start_date is not None:
@@ -205,160 +1038,1376 @@ async def update_person(name: str, start_date: Optional[str] = None,
     if photo_url is not None:
         update_data["photo_url"] = photo_url
     if dates is not None:
+        serialized_dates = serialize_dates_field(dates)
+        update_data["dates"] = serialized_dates if serialized_dates is not None else ""
+    return update_data
+
+async def update_person(name: str, start_date: Optional[str] = None,
+                       end_date: Optional[str] = None, meeting_place: Optional[str] = None,
+                       details: Optional[str] = None, status: Optional[str] = None,
+                       memory_tags: Optional[str] = None, how_we_met: Optional[str] = None,
+                       next_date: Optional[str] = None, dates: Optional[Any] = None,
+                       photo_url: Optional[str] = None) -> Dict[str, Any]:
+    """Update an existing person record."""
+    if not name:
+        return {"success": False, "error": "Name is required"}
+    
+    try:
+        update_data = build_update_data(
+            start_date=start_date, end_date=end_date, meeting_place=meeting_place,
+            details=details, status=status, memory_tags=memory_tags, how_we_met=how_we_met,
+            next_date=next_date, dates=dates, photo_url=photo_url
+        )
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    
+    normalized_name = normalize_name(name)
+    key = get_person_key(name)
+    
+    def write(pipe, old_data):
+        # Check if person exists
+        if old_data is None:
+            return {"success": False, "error": f"Person '{name}' not found. Use create_person to create a new record."}
+        
+        person_data = {**old_data, **to_stored(update_data)}
+        pipe.multi()
+        # Update Redis
+        queue_person_write(pipe, key, update_data)
+        queue_index_updates(pipe, normalized_name, old_data, person_data)
+        return {"success": True, "data": person_data}
+    
+    return await run_person_transaction(key, write, restore=True)
+
+# Maximum items per get_people / update_people call
+BATCH_MAX_ITEMS = 1000
+
+def projection_fields(fields: Any) -> Optional[List[str]]:
+    """Validate a fields projection, putting name (which identifies each record) first; raises ValueError."""
+    if fields is None:
+        return None
+    if not isinstance(fields, list) or not all(isinstance(field, str) and field for field in fields):
+        raise ValueError("fields must be a list of field names")
+    return ["name"] + [field for field in dict.fromkeys(fields) if field != "name"]
+
+def project(person_data: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """The requested fields of a record (absent ones left out), or all of it without a projection."""
+    return {field: person_data[field] for field in fields if field in person_data} if fields else person_data
+
+def prepare_updates(updates: Any) -> Tuple[List[Optional[Dict[str, Any]]], List[Tuple[int, str, str, Dict[str, str]]]]:
+    """
+    Validate a batch of updates.
+
+    Returns per-item results, filled in for invalid items, and the valid
+    ones as (position, name, normalized name, update data). Raises
+    ValueError if the batch itself is invalid.
+    """
+    if not isinstance(updates, list) or not updates:
+        raise ValueError("updates must be a non-empty array")
+    if len(updates) > BATCH_MAX_ITEMS:
+        raise ValueError(f"At most {BATCH_MAX_ITEMS} updates per call")
+    
+    results: List[Optional[Dict[str, Any]]] = [None] * len(updates)
+    prepared = []
+    for i, item in enumerate(updates):
+        name = item.get("name") if isinstance(item, dict) else None
+        if not name:
+            results[i] = {"name": name, "success": False, "error": "Name is required"}
+            continue
+        unknown = sorted(set(item) - {"name", *UPDATABLE_FIELDS})
+        if unknown:
+            results[i] = {"name": name, "success": False, "error": f"Unknown fields: {', '.join(unknown)}"}
+            continue
         try:
-            serialized_dates = serialize_dates_field(dates)
-            update_data["dates"] = serialized_dates if serialized_dates is not None else ""
+            update_data = build_update_data(**{field: item.get(field) for field in UPDATABLE_FIELDS})
         except ValueError as e:
-            return {"success": False, "error": str(e)}
+            results[i] = {"name": name, "success": False, "error": str(e)}
+            continue
+        prepared.append((i, name, normalize_name(name), update_data))
+    return results, prepared
+
+async def update_people(updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Apply many partial updates in one WATCH/MULTI transaction.
+
+    All touched records are read in one pipelined round trip and all valid
+    updates commit together with their index updates; a concurrent write to
+    any of them retries the whole batch. Invalid or missing people fail
+    individually without blocking the rest. Several updates to the same
+    person are applied in order. Archived people are restored first.
+    """
+    try:
+        results, prepared = prepare_updates(updates)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    
+    normalized_names = list(dict.fromkeys(normalized_name for _, _, normalized_name, _ in prepared))
+    restore = True
+    
+    async def transaction(pipe):
+        # Keys are already WATCHed, so reading them over a separate pipeline is safe
+        current = dict(await fetch_people(normalized_names))
+        missing = [normalized_name for normalized_name in normalized_names if normalized_name not in current]
+        if restore and missing:
+            archived = await archived_among(pipe, missing)
+            if archived:
+                return archived
+        batch_results = {}
+        writes = []
+        for i, name, normalized_name, update_data in prepared:
+            old_data = current.get(normalized_name)
+            if old_data is None:
+                batch_results[i] = {"name": name, "success": False, "error": f"Person '{name}' not found"}
+                continue
+            person_data = {**old_data, **to_stored(update_data)}
+            current[normalized_name] = person_data
+            writes.append((normalized_name, update_data, old_data, person_data))
+            batch_results[i] = {"name": name, "success": True, "data": person_data}
+        if writes:
+            pipe.multi()
+            for normalized_name, update_data, old_data, person_data in writes:
+                queue_person_write(pipe, f"dating:person:{normalized_name}", update_data)
+                queue_index_updates(pipe, normalized_name, old_data, person_data)
+        return batch_results
+    
+    if prepared:
+        r = get_redis_client()
+        watched_keys = [f"dating:person:{normalized_name}" for normalized_name in normalized_names]
+        try:
+            batch_results = await r.transaction(transaction, *watched_keys, value_from_callable=True)
+            if isinstance(batch_results, list):
+                # Archived people are restored, then the batch runs against their records
+                for normalized_name in batch_results:
+                    await restore_archived(normalized_name)
+                restore = False
+                batch_results = await r.transaction(transaction, *watched_keys, value_from_callable=True)
+        finally:
+            cache_invalidate(*watched_keys)
+        for i, result in batch_results.items():
+            results[i] = result
+    
+    succeeded = sum(1 for result in results if result["success"])
+    return {"success": True, "data": results, "updated": succeeded, "failed": len(results) - succeeded}
+
+async def get_people(names: List[str], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Fetch many people in one MULTI/EXEC round trip, with a result per requested name.
+
+    Requested people who are archived are restored.
+    """
+    if not isinstance(names, list) or not names:
+        return {"success": False, "error": "names must be a non-empty array"}
+    if len(names) > BATCH_MAX_ITEMS:
+        return {"success": False, "error": f"At most {BATCH_MAX_ITEMS} names per call"}
+    try:
+        fields = projection_fields(fields)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    
+    valid_names = [name for name in names if isinstance(name, str) and normalize_name(name)]
+    normalized_names = list(dict.fromkeys(map(normalize_name, valid_names)))
+    found = dict(await fetch_people(normalized_names, fields, atomic=True))
+    missing = [normalized_name for normalized_name in normalized_names if normalized_name not in found]
+    for normalized_name in await archived_among(get_redis_client(), missing):
+        person_data = await restore_archived(normalized_name)
+        if person_data is not None:
+            found[normalized_name] = project(person_data, fields)
+    results = []
+    for name in names:
+        if not isinstance(name, str) or not normalize_name(name):
+            results.append({"name": name, "success": False, "error": "Name is required"})
+        elif normalize_name(name) in found:
+            results.append({"name": name, "success": True, "data": found[normalize_name(name)]})
+        else:
+            results.append({"name": name, "success": False, "error": f"Person '{name}' not found"})
+    return {"success": True, "data": results, "found": sum(1 for result in results if result["success"])}
+
+async def get_person(name: str) -> Dict[str, Any]:
+    """Get a person's record by name."""
+    if not name:
+        return {"success": False, "error": "Name is required"}
+    
+    key = get_person_key(name)
+    
+    # An empty reply means the key doesn't exist, so no separate EXISTS round trip
+    person_data = await read_person_cached(key)
+    if not person_data:
+        # Archived people are restored on demand
+        person_data = await restore_archived(normalize_name(name))
+    if not person_data:
+        return {"success": False, "error": f"Person '{name}' not found"}
+    
+    return {"success": True, "data": person_data}
+
+async def list_people(status: Optional[str] = None, active_only: bool = False,
+                     include_details: bool = True, fields: Optional[List[str]] = None,
+                     limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    List all people with optional filtering, field projection and pagination.
+
+    People are ordered by normalized name. The cursor is the last normalized
+    name of the previous page (returned as next_cursor, null on the last
+    page), so pages stay stable when people are added or removed.
+    """
+    try:
+        fields = projection_fields(fields)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    if limit is not None:
+        try:
+            limit = max(1, min(int(limit), 1000))
+        except (TypeError, ValueError):
+            return {"success": False, "error": "limit must be an integer"}
+    
+    r = get_redis_client()
+    
+    # Filters are served from the per-status index sets so only matching records are fetched
+    wanted_statuses = set()
+    if active_only:
+        wanted_statuses.add("active")
+    if status:
+        wanted_statuses.add(canonical_status(status))
+    
+    if not wanted_statuses:
+        names = await r.smembers("dating:people:all")
+    elif len(wanted_statuses) > 1:
+        # active_only combined with a different status can never match
+        names = set()
+    else:
+        names = await r.smembers(get_status_index_key(wanted_statuses.pop()))
+    
+    names = sorted(name for name in names if cursor is None or name > cursor)
+    next_cursor = None
+    if limit is not None and len(names) > limit:
+        names = names[:limit]
+        next_cursor = names[-1]
+    people_data = await fetch_people(names, fields, use_cache=True)
+    
+    people = []
+    for _, person_data in people_data:
+        # Optionally exclude details
+        if not include_details:
+            person_data = {k: v for k, v in person_data.items() 
+                          if k not in ["details", "memory_tags"]}
+        
+        people.append(person_data)
+    
+    return {"success": True, "data": people, "next_cursor": next_cursor}
+
+async def delete_person(name: str) -> Dict[str, Any]:
+    """Delete a person record."""
+    if not name:
+        return {"success": False, "error": "Name is required"}
+    
+    normalized_name = normalize_name(name)
+    key = get_person_key(name)
+    
+    def write(pipe, old_data):
+        if old_data is None:
+            return {"success": False, "error": f"Person '{name}' not found"}
+        
+        pipe.multi()
+        # Delete record
+        pipe.delete(key)
+        # Remove from index
+        remove_from_index(normalized_name, pipe)
+        queue_index_updates(pipe, normalized_name, old_data, None)
+        return {"success": True, "message": f"Person '{name}' deleted"}
+    
+    return await run_person_transaction(key, write, restore=True)
+
+def get_archive_key(normalized_name: str) -> str:
+    """Get the archive key holding an archived person's compressed record."""
+    return f"{ARCHIVE_KEY_PREFIX}{normalized_name}"
+
+def pack_archived(person_data: Dict[str, Any]) -> str:
+    """Encode a person record for its archive key (hash fields as JSON, compressed when that helps)."""
+    return compress_value(json.dumps(to_hash_fields(person_data)))
+
+def unpack_archived(packed: Optional[str]) -> Optional[Dict[str, str]]:
+    """Decode an archive key's value into hash fields (None if the key is missing)."""
+    return json.loads(decompress_value(packed)) if packed else None
+
+async def fetch_archived(normalized_names: List[str]) -> List[Tuple[str, Dict[str, str]]]:
+    """Fetch archived person records with pipelined GETs; names without an archive key are skipped."""
+    r = get_redis_client()
+    people = []
+    names = list(normalized_names)
+    for start in range(0, len(names), BULK_READ_CHUNK_SIZE):
+        chunk = names[start:start + BULK_READ_CHUNK_SIZE]
+        for normalized_name, packed in zip(chunk, await r.mget([get_archive_key(name) for name in chunk])):
+            person_data = unpack_archived(packed)
+            if person_data:
+                people.append((normalized_name, person_data))
+    return people
+
+async def archived_among(client, normalized_names: List[str]) -> List[str]:
+    """The given people that are archived, in one ZMSCORE."""
+    if not normalized_names:
+        return []
+    scores = await client.zmscore(ARCHIVE_INDEX_KEY, normalized_names)
+    return [name for name, score in zip(normalized_names, scores) if score is not None]
+
+# Fields that say when a person was last active, read when choosing who to archive
+ACTIVITY_FIELDS = ["status", "created_at", "last_updated", "start_date", "end_date", "next_date", "dates"]
+
+def last_activity(person_data: Dict[str, Any]) -> float:
+    """Epoch seconds of the most recent timestamp or date recorded for a person (0 if none parse)."""
+    times = [parse_when(person_data.get(field)) for field in ACTIVITY_FIELDS[1:-1]]
+    times += [parse_when(entry.get("when") or entry.get("date")) for entry in parse_dates_field(person_data.get("dates"))]
+    return max((when for when in times if when is not None), default=0)
+
+def is_archivable(person_data: Dict[str, Any], cutoff: float) -> bool:
+    """Whether a person is not being pursued and has had no activity since cutoff."""
+    return canonical_status(person_data.get("status")) == "not_pursuing" and last_activity(person_data) < cutoff
+
+def parse_cutoff(older_than: Any) -> Optional[float]:
+    """Epoch cutoff for an age in days ("180d" or a number) or an ISO date."""
+    if isinstance(older_than, (int, float)) and not isinstance(older_than, bool):
+        return time.time() - older_than * 86400
+    if not isinstance(older_than, str):
+        return None
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*d?\s*", older_than)
+    if match:
+        return time.time() - float(match.group(1)) * 86400
+    return parse_when(older_than)
+
+def queue_archive(pipe, normalized_name: str, person_data: Dict[str, Any]):
+    """
+    Queue moving a person from their hot key and indexes to their archive key.
+
+    Statistics counters and analytics rollups are left alone, so they keep
+    counting the person while archived.
+    """
+    version = queue_change_event(pipe, normalized_name, person_data, None, op="archive")
+    pipe.set(get_archive_key(normalized_name), pack_archived({**person_data, "version": str(version)}))
+    pipe.zadd(ARCHIVE_INDEX_KEY, {normalized_name: time.time()})
+    pipe.delete(f"dating:person:{normalized_name}")
+    remove_from_index(normalized_name, pipe)
+    queue_hot_index_updates(pipe, normalized_name, person_data, None)
+
+async def archive_chunk(normalized_names: List[str], cutoff: float) -> List[str]:
+    """Archive the still eligible people among normalized_names in one WATCHed MULTI; returns who moved."""
+    r = get_redis_client()
+    keys = [f"dating:person:{normalized_name}" for normalized_name in normalized_names]
+    
+    async def transaction(pipe):
+        # Keys are already WATCHed, so reading them over a separate pipeline is safe
+        eligible = [
+            (normalized_name, person_data) for normalized_name, person_data in await fetch_people(normalized_names)
+            if is_archivable(person_data, cutoff)
+        ]
+        if eligible:
+            pipe.multi()
+            for normalized_name, person_data in eligible:
+                queue_archive(pipe, normalized_name, person_data)
+        return [normalized_name for normalized_name, _ in eligible]
+    
+    try:
+        return await r.transaction(transaction, *keys, value_from_callable=True)
+    finally:
+        cache_invalidate(*keys)
+
+async def archive_people(older_than: Any = None, dry_run: bool = False) -> Dict[str, Any]:
+    """
+    Move not_pursuing people with no activity since older_than to the archive tier.
+
+    older_than is an age in days ("180d") or an ISO date, defaulting to
+    REDIS_DATING_ARCHIVE_AFTER_DAYS. Only the status index's members are
+    examined, and each chunk is re-checked under WATCH so a concurrent
+    update keeps the person hot. Archived people drop out of list_people,
+    search_people and query_dates but still count in get_statistics and
+    get_analytics; tools addressing them by name restore them.
+    """
+    if older_than is None and ARCHIVE_AFTER_DAYS > 0:
+        older_than = ARCHIVE_AFTER_DAYS
+    cutoff = parse_cutoff(older_than)
+    if cutoff is None:
+        return {"success": False, "error": "older_than must be an age in days like '180d' or an ISO date"}
+    
+    r = get_redis_client()
+    names = sorted(await r.smembers(get_status_index_key("not_pursuing")))
+    candidates = [
+        normalized_name for normalized_name, person_data in await fetch_people(names, ACTIVITY_FIELDS)
+        if is_archivable(person_data, cutoff)
+    ]
+    if dry_run:
+        return {"success": True, "data": {"archived": 0, "eligible": len(candidates), "people": candidates}}
+    
+    archived = []
+    for start in range(0, len(candidates), BULK_READ_CHUNK_SIZE):
+        archived += await archive_chunk(candidates[start:start + BULK_READ_CHUNK_SIZE], cutoff)
+    if archived:
+        logger.info(f"Archived {len(archived)} inactive people")
+    return {"success": True, "data": {"archived": len(archived), "eligible": len(candidates), "people": archived}}
+
+async def restore_archived(normalized_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Move an archived person back to their hot key and indexes.
+
+    Returns the restored record, or None if the person isn't archived.
+    """
+    key = f"dating:person:{normalized_name}"
+    archive_key = get_archive_key(normalized_name)
+    r = get_redis_client()
+    
+    async def transaction(pipe):
+        person_data = unpack_archived(await pipe.get(archive_key))
+        if person_data is None:
+            return None
+        existing = await read_person(pipe, key)
+        if existing is not None:
+            return existing
+        if person_data.get("dates"):
+            # Records archived before date ids existed get them now, so their dates are indexed
+            person_data = {**person_data, "dates": serialize_dates_field(person_data["dates"])}
+        stored = to_stored(person_data)
+        pipe.multi()
+        queue_person_write(pipe, key, person_data, create=True)
+        pipe.delete(archive_key)
+        pipe.zrem(ARCHIVE_INDEX_KEY, normalized_name)
+        ensure_index(normalized_name, pipe)
+        queue_hot_index_updates(pipe, normalized_name, None, stored)
+        # Versions continue from the archived record's
+        queue_change_event(pipe, normalized_name, dict(stored), stored, op="restore")
+        return stored
+    
+    try:
+        return await r.transaction(transaction, key, archive_key, value_from_callable=True)
+    finally:
+        cache_invalidate(key)
+
+async def restore_person(name: str) -> Dict[str, Any]:
+    """Restore an archived person to the hot set."""
+    if not name:
+        return {"success": False, "error": "Name is required"}
+    person_data = await restore_archived(normalize_name(name))
+    if person_data is None:
+        return {"success": False, "error": f"Person '{name}' is not archived"}
+    return {"success": True, "data": person_data}
+
+async def run_archive_policy():
+    """Archive people inactive for REDIS_DATING_ARCHIVE_AFTER_DAYS every REDIS_DATING_ARCHIVE_INTERVAL_SECONDS."""
+    while True:
+        try:
+            await get_store().archive_people(ARCHIVE_AFTER_DAYS)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Archive policy run failed: {e}")
+        await asyncio.sleep(ARCHIVE_INTERVAL_SECONDS)
+
+def score_name_match(query: str, normalized_name: str, trigram_similarity: float,
+                     phonetic_similarity: float) -> float:
+    """Rank a candidate name for a normalized query (0 means no match)."""
+    if normalized_name == query:
+        return 1.0
+    if normalized_name.startswith(query):
+        return 0.9
+    if any(token.startswith(query) for token in name_tokens(normalized_name)):
+        return 0.8
+    if query in normalized_name:
+        return 0.7
+    score = 0.0
+    if trigram_similarity >= SEARCH_MIN_TRIGRAM_SIMILARITY:
+        score = 0.55 * trigram_similarity
+    # Every query word sounding like a word of the name ("Cristina" -> "Christina")
+    if phonetic_similarity == 1.0:
+        score = max(score, 0.3) + 0.1
+    return score
+
+def plan_search(query: Any, limit: Any, phonetic: bool) -> Tuple[str, int, List[str], List[str]]:
+    """
+    Validate a search and list the postings it reads (raises ValueError).
+
+    Returns (normalized query, limit, query postings, phonetic postings).
+    Query postings are the query's trigrams, or its prefix posting when it
+    is shorter than a trigram.
+    """
+    if not query:
+        raise ValueError("Query is required")
+    normalized_query = normalize_name(query)
+    if not normalized_query:
+        raise ValueError("Query is required")
+    limit = max(1, min(int(limit), 1000))
+    
+    query_postings = [f"dating:search:tri:{trigram}" for trigram in sorted(name_trigrams(normalized_query))]
+    if not query_postings:
+        query_postings = [f"dating:search:prefix:{normalized_query}"]
+    phonetic_codes = sorted({code for code in map(soundex, name_tokens(normalized_query)) if code}) if phonetic else []
+    return normalized_query, limit, query_postings, [f"dating:search:phonetic:{code}" for code in phonetic_codes]
+
+def rank_search_matches(normalized_query: str, trigram_hits: Dict[str, int], phonetic_hits: Dict[str, int],
+                        posting_count: int, phonetic_count: int, allowed: Optional[Set[str]] = None) -> List[str]:
+    """Rank candidate names by their posting hits, best match first, dropping non-matches."""
+    ranked = []
+    for normalized_name in set(trigram_hits) | set(phonetic_hits):
+        if allowed is not None and normalized_name not in allowed:
+            continue
+        score = score_name_match(
+            normalized_query,
+            normalized_name,
+            trigram_hits.get(normalized_name, 0) / posting_count,
+            phonetic_hits.get(normalized_name, 0) / phonetic_count if phonetic_count else 0.0
+        )
+        if score > 0:
+            ranked.append((-score, len(normalized_name), normalized_name))
+    ranked.sort()
+    return [normalized_name for _, _, normalized_name in ranked]
+
+async def search_people(query: str, status: Optional[str] = None, limit: int = 20,
+                        phonetic: bool = True, include_archived: bool = False) -> Dict[str, Any]:
+    """
+    Search people by name (fuzzy matching) using the search postings.
+
+    Candidates come from trigram postings (or prefix postings for one or
+    two character queries) plus Soundex postings, are ranked by match
+    quality, and only the top `limit` person hashes are fetched. With
+    include_archived, archived names are matched against the postings they
+    would have, and archived people among the returned matches are restored.
+    """
+    try:
+        normalized_query, limit, query_postings, phonetic_postings = plan_search(query, limit, phonetic)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    
+    r = get_redis_client()
+    pipe = r.pipeline(transaction=False)
+    for posting_key in query_postings + phonetic_postings:
+        pipe.smembers(posting_key)
+    if status:
+        pipe.smembers(get_status_index_key(canonical_status(status)))
+    # Only not_pursuing people are ever archived
+    include_archived = include_archived and (not status or canonical_status(status) == "not_pursuing")
+    if include_archived:
+        pipe.zrange(ARCHIVE_INDEX_KEY, 0, -1)
+    replies = await pipe.execute()
+    
+    archived = set(replies.pop()) if include_archived else set()
+    allowed = set(replies.pop()) | archived if status else None
+    trigram_hits: Dict[str, int] = {}
+    for members in replies[:len(query_postings)]:
+        for normalized_name in members:
+            trigram_hits[normalized_name] = trigram_hits.get(normalized_name, 0) + 1
+    phonetic_hits: Dict[str, int] = {}
+    for members in replies[len(query_postings):]:
+        for normalized_name in members:
+            phonetic_hits[normalized_name] = phonetic_hits.get(normalized_name, 0) + 1
+    # Archived names aren't in the postings, so count the postings they would be filed under
+    for normalized_name in archived:
+        postings = get_search_postings(normalized_name)
+        hits = sum(1 for posting_key in query_postings if posting_key in postings)
+        if hits:
+            trigram_hits[normalized_name] = hits
+        hits = sum(1 for posting_key in phonetic_postings if posting_key in postings)
+        if hits:
+            phonetic_hits[normalized_name] = hits
+    
+    ranked = rank_search_matches(
+        normalized_query, trigram_hits, phonetic_hits, len(query_postings), len(phonetic_postings), allowed
+    )
+    shown = ranked[:limit]
+    found = dict(await fetch_people([name for name in shown if name not in archived]))
+    for normalized_name in shown:
+        if normalized_name in archived:
+            person_data = await restore_archived(normalized_name)
+            if person_data is not None:
+                found[normalized_name] = person_data
+    matches = [found[name] for name in shown if name in found]
+    return {"success": True, "data": matches, "total_matches": len(ranked)}
+
+def parse_dates_query(from_date: Optional[str], to_date: Optional[str], limit: Any,
+                      cursor: Optional[str]) -> Tuple[Any, Any, int, int]:
+    """Validate query_dates bounds and paging into (min score, max score, limit, offset); raises ValueError."""
+    min_score = parse_when(from_date) if from_date else "-inf"
+    max_score = parse_when(to_date) if to_date else "+inf"
+    if min_score is None or max_score is None:
+        raise ValueError("from and to must be ISO dates or datetimes")
+    try:
+        return min_score, max_score, max(1, min(int(limit), 1000)), int(cursor) if cursor else 0
+    except (TypeError, ValueError):
+        raise ValueError("limit and cursor must be integers")
+
+def date_result(entry: Dict[str, Any], person_name: str) -> Dict[str, Any]:
+    """A date entry as tools return it, with person_name and completed filled in."""
+    entry = dict(entry)
+    entry["person_name"] = person_name
+    entry.setdefault("completed", False)
+    return entry
+
+def person_dates_page(normalized_name: str, person_data: Dict[str, Any], min_score: Any, max_score: Any,
+                      completed: Optional[bool], limit: int, offset: int) -> Dict[str, Any]:
+    """One page of query_dates results from a single person's record."""
+    scored = []
+    for entry in parse_dates_field(person_data.get("dates")):
+        score = parse_when(entry.get("when") or entry.get("date"))
+        score = score if score is not None else 0
+        if min_score != "-inf" and score < min_score:
+            continue
+        if max_score != "+inf" and score > max_score:
+            continue
+        entry = date_result(entry, person_data.get("name") or normalized_name)
+        if completed is not None and entry["completed"] != completed:
+            continue
+        scored.append((score, entry))
+    scored.sort(key=lambda item: item[0])
+    page = [entry for _, entry in scored[offset:offset + limit]]
+    has_more = offset + limit < len(scored)
+    return {"success": True, "data": page, "next_cursor": str(offset + limit) if has_more else None}
+
+async def query_dates(from_date: Optional[str] = None, to_date: Optional[str] = None,
+                      person: Optional[str] = None, completed: Optional[bool] = None,
+                      active_only: bool = False, limit: int = 100,
+                      cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Query date entries in `when` order using the dates index.
+
+    The cursor is an offset into the index range returned as next_cursor;
+    it is null once the range is exhausted.
+    """
+    try:
+        min_score, max_score, limit, offset = parse_dates_query(from_date, to_date, limit, cursor)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    
+    r = get_redis_client()
+    
+    if person:
+        # A single person's dates are already in one hash, so skip the global index
+        normalized_name = normalize_name(person)
+        pipe = r.pipeline(transaction=False)
+        person_read_command(pipe, f"dating:person:{normalized_name}", ["name", "dates"])
+        pipe.sismember(get_status_index_key("active"), normalized_name)
+        reply, is_active = await pipe.execute()
+        if active_only and not is_active:
+            return {"success": True, "data": [], "next_cursor": None}
+        person_data = decode_person(reply, ["name", "dates"]) or {}
+        return person_dates_page(
+            normalized_name, person_data, min_score, max_score, completed, limit, offset
+        )
+    
+    active_names = await r.smembers(get_status_index_key("active")) if active_only else None
+    
+    results = []
+    next_cursor = None
+    while len(results) < limit:
+        batch = await r.zrangebyscore(DATES_INDEX_KEY, min_score, max_score, start=offset, num=max(limit * 2, 50))
+        if not batch:
+            break
+        
+        # Resolve the batch with one HMGET per distinct person, sent as a single pipeline
+        refs = [json.loads(member) for member in batch]
+        people = list(dict.fromkeys(normalized_name for normalized_name, _ in refs))
+        pipe = r.pipeline(transaction=False)
+        for normalized_name in people:
+            person_read_command(pipe, f"dating:person:{normalized_name}", ["name", "dates"])
+        entries_by_person = {}
+        for normalized_name, reply in zip(people, await pipe.execute()):
+            person_data = decode_person(reply, ["name", "dates"]) or {}
+            entries_by_person[normalized_name] = (
+                person_data.get("name") or normalized_name,
+                {str(entry.get("id")): entry for entry in parse_dates_field(person_data.get("dates"))}
+            )
+        
+        for position, (normalized_name, date_id) in enumerate(refs):
+            if active_names is not None and normalized_name not in active_names:
+                continue
+            person_name, entries = entries_by_person[normalized_name]
+            entry = entries.get(date_id)
+            if entry is None:
+                continue
+            entry = date_result(entry, person_name)
+            if completed is not None and entry["completed"] != completed:
+                continue
+            results.append(entry)
+            if len(results) == limit:
+                next_cursor = str(offset + position + 1)
+                break
+        else:
+            offset += len(batch)
+            continue
+        break
+    
+    return {"success": True, "data": results, "next_cursor": next_cursor}
+
+async def get_date_by_id(date_id: str) -> Dict[str, Any]:
+    """Look up a single date entry by id via the date owner index."""
+    if not date_id:
+        return {"success": False, "error": "Date id is required"}
+    
+    r = get_redis_client()
+    normalized_name = await r.hget(DATE_OWNER_KEY, date_id)
+    if normalized_name is None:
+        return {"success": False, "error": f"Date '{date_id}' not found"}
+    
+    person_data = await read_person(r, f"dating:person:{normalized_name}", ["name", "dates"]) or {}
+    for entry in parse_dates_field(person_data.get("dates")):
+        if str(entry.get("id")) == date_id:
+            return {"success": True, "data": date_result(entry, person_data.get("name") or normalized_name)}
+    
+    return {"success": False, "error": f"Date '{date_id}' not found"}
+
+def queue_dates_write(pipe, key: str, raw_dates: Any, update_data: Dict[str, str],
+                      affected_entry: Dict[str, Any], op: str):
+    """
+    Queue the write of a single date mutation.
+
+    JSON documents get an in-place ARRAPPEND, element JSON.SET or ARRPOP on
+    $.dates; hashes (and documents whose dates aren't an array yet) have the
+    whole dates field rewritten.
+    """
+    index = None
+    if storage_mode == "json" and isinstance(raw_dates, list) and op != "append":
+        # Positions are in the stored array, which may hold entries parse_dates_field skips
+        index = next((
+            position for position, raw in enumerate(raw_dates)
+            if isinstance(raw, dict) and str(raw.get("id")) == str(affected_entry.get("id"))
+        ), None)
+    if storage_mode == "json" and isinstance(raw_dates, list) and (op == "append" or index is not None):
+        if op == "append":
+            pipe.execute_command("JSON.ARRAPPEND", key, "$.dates", json.dumps(affected_entry))
+        elif op == "patch":
+            pipe.execute_command("JSON.SET", key, f"$.dates[{index}]", json.dumps(affected_entry))
+        else:
+            pipe.execute_command("JSON.ARRPOP", key, "$.dates", index)
+        queue_person_write(pipe, key, {"last_updated": update_data["last_updated"]})
+    else:
+        queue_person_write(pipe, key, update_data)
+
+async def run_dates_mutation(normalized_name: str, mutate) -> Dict[str, Any]:
+    """
+    Apply mutate(entries) to one person's dates atomically and return the affected entry.
+
+    mutate returns (new_entries, affected_entry, op) with op one of "append",
+    "patch" or "remove", or an error result dict. It may run more than once
+    if the record changes underneath us, so it must not have side effects.
+    In JSON storage mode only the affected array element is written.
+    """
+    key = f"dating:person:{normalized_name}"
+    
+    def write(pipe, old_data):
+        if old_data is None:
+            return {"success": False, "error": f"Person '{normalized_name}' not found", "code": "not_found"}
+        
+        outcome = mutate(parse_dates_field(old_data.get("dates")))
+        if isinstance(outcome, dict):
+            return outcome
+        entries, affected_entry, op = outcome
+        
+        update_data = {"dates": json.dumps(entries), "last_updated": get_timestamp()}
+        new_data = {**old_data, **to_stored(update_data)}
+        pipe.multi()
+        queue_dates_write(pipe, key, old_data.get("dates"), update_data, affected_entry, op)
+        queue_index_updates(pipe, normalized_name, old_data, new_data)
+        
+        return {"success": True, "data": date_result(affected_entry, old_data.get("name") or normalized_name)}
+    
+    return await run_person_transaction(key, write, restore=True)
+
+def append_mutation(new_entry: Dict[str, Any]):
+    """The dates mutation appending an entry (given an id if it has none)."""
+    new_entry = {k: v for k, v in new_entry.items() if k != "person_name"}
+    new_entry["id"] = str(new_entry.get("id") or uuid.uuid4())
+    
+    def mutate(entries):
+        if any(str(entry.get("id")) == new_entry["id"] for entry in entries):
+            return {"success": False, "error": f"Date '{new_entry['id']}' already exists"}
+        return entries + [new_entry], new_entry, "append"
+    
+    return mutate
+
+def patch_mutation(date_id: str, changes: Dict[str, Any]):
+    """The dates mutation updating fields of one entry in place."""
+    changes = {k: v for k, v in changes.items() if k not in ("id", "person_name")}
+    
+    def mutate(entries):
+        for idx, entry in enumerate(entries):
+            if str(entry.get("id")) == date_id:
+                patched = {**entry, **changes}
+                return entries[:idx] + [patched] + entries[idx + 1:], patched, "patch"
+        return {"success": False, "error": f"Date '{date_id}' not found", "code": "not_found"}
+    
+    return mutate
+
+def remove_mutation(date_id: str):
+    """The dates mutation removing one entry."""
+    def mutate(entries):
+        for idx, entry in enumerate(entries):
+            if str(entry.get("id")) == date_id:
+                return entries[:idx] + entries[idx + 1:], entry, "remove"
+        return {"success": False, "error": f"Date '{date_id}' not found", "code": "not_found"}
+    
+    return mutate
+
+async def append_date(name: str, date: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Append a date entry to a person's dates."""
+    if not name:
+        return {"success": False, "error": "Name is required"}
+    if not isinstance(date, dict):
+        return {"success": False, "error": "Date must be an object"}
+    
+    return await run_dates_mutation(normalize_name(name), append_mutation(date))
+
+async def patch_date(date_id: str, changes: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Update fields of a single date entry in place."""
+    if not date_id:
+        return {"success": False, "error": "Date id is required"}
+    if not isinstance(changes, dict):
+        return {"success": False, "error": "Changes must be an object"}
+    
+    r = get_redis_client()
+    normalized_name = await r.hget(DATE_OWNER_KEY, date_id)
+    if normalized_name is None:
+        return {"success": False, "error": f"Date '{date_id}' not found", "code": "not_found"}
+    
+    return await run_dates_mutation(normalized_name, patch_mutation(date_id, changes))
+
+async def remove_date(date_id: str) -> Dict[str, Any]:
+    """Remove a single date entry and return it."""
+    if not date_id:
+        return {"success": False, "error": "Date id is required"}
+    
+    r = get_redis_client()
+    normalized_name = await r.hget(DATE_OWNER_KEY, date_id)
+    if normalized_name is None:
+        return {"success": False, "error": f"Date '{date_id}' not found", "code": "not_found"}
+    
+    return await run_dates_mutation(normalized_name, remove_mutation(date_id))
+
+def parse_stream_id(stream_id: str) -> Tuple[int, int]:
+    """Split a stream id ("<ms>-<seq>" or "<ms>") into comparable parts."""
+    ms, _, seq = stream_id.partition("-")
+    return int(ms), int(seq or 0)
+
+def change_event_result(entry_id: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """A stored change event as read_changes returns it."""
+    return {
+        "id": entry_id,
+        "person": fields.get("person"),
+        "op": fields.get("op"),
+        "fields": [field for field in (fields.get("fields") or "").split(",") if field],
+        "version": int(fields.get("version") or 0)
+    }
+
+async def read_changes(since_id: Optional[str] = None, limit: int = 100,
+                       block_ms: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Read change events after since_id from the change stream.
+
+    Pass back last_id to continue. since_id "$" returns no events and only
+    the current last_id, to start following from now. `reset` is true when
+    events after since_id have already been trimmed away, so the consumer
+    must re-list instead of applying deltas.
+    """
+    since_id = str(since_id or "0-0")
+    r = get_redis_client()
+    if since_id == "$":
+        latest = await r.xrevrange(CHANGES_STREAM_KEY, count=1)
+        return {"success": True, "data": [], "last_id": latest[0][0] if latest else "0-0", "reset": False}
+    try:
+        since = parse_stream_id(since_id)
+        limit = max(1, min(int(limit), 1000))
+        block_ms = min(int(block_ms), 10000) if block_ms else None
+    except (TypeError, ValueError):
+        return {"success": False, "error": "since_id must be a stream id like 1700000000000-0"}
+    
+    pipe = r.pipeline(transaction=False)
+    pipe.xrange(CHANGES_STREAM_KEY, count=1)
+    pipe.xread({CHANGES_STREAM_KEY: since_id}, count=limit)
+    oldest, replies = await pipe.execute()
+    if not replies and block_ms:
+        replies = await r.xread({CHANGES_STREAM_KEY: since_id}, count=limit, block=block_ms)
+    
+    entries = replies[0][1] if replies else []
+    events = [change_event_result(entry_id, fields) for entry_id, fields in entries]
+    # since_id itself was trimmed, so events after it may have been too
+    reset = bool(oldest) and since != (0, 0) and parse_stream_id(oldest[0][0]) > since
+    return {
+        "success": True,
+        "data": events,
+        "last_id": events[-1]["id"] if events else since_id,
+        "reset": reset
+    }
+
+async def get_statistics() -> Dict[str, Any]:
+    """Get statistics about dating history from the maintained counters (archived people included)."""
+    r = get_redis_client()
+    pipe = r.pipeline(transaction=False)
+    pipe.scard("dating:people:all")
+    pipe.zcard(ARCHIVE_INDEX_KEY)
+    pipe.hgetall(STATS_STATUS_KEY)
+    pipe.hgetall(STATS_HOW_WE_MET_KEY)
+    hot, archived, raw_status_counts, raw_how_we_met = await pipe.execute()
+    return statistics_result(hot, archived, raw_status_counts, raw_how_we_met)
+
+def statistics_result(hot: int, archived: int, raw_status_counts: Dict[str, Any],
+                      raw_how_we_met: Dict[str, Any]) -> Dict[str, Any]:
+    """get_statistics' result from the people counts and the status and how-we-met counters."""
+    status_counts = {
+        status: int(raw_status_counts.get(status, 0))
+        for status in ["active", "paused", "exploring", "not_pursuing"]
+    }
+    # Counters are left at zero rather than deleted when the last person moves away
+    meeting_places = {place: int(count) for place, count in raw_how_we_met.items() if int(count) > 0}
+    
+    return {
+        "success": True,
+        "data": {
+            "total_people": hot + archived,
+            "archived_count": archived,
+            "active_count": status_counts["active"],
+            "paused_count": status_counts["paused"],
+            "exploring_count": status_counts["exploring"],
+            "not_pursuing_count": status_counts["not_pursuing"],
+            "past_count": status_counts["not_pursuing"],  # Backwards compatibility
+            "status_distribution": status_counts,
+            "common_meeting_places": meeting_places,
+            "common_how_we_met": meeting_places
+        }
+    }
+
+async def backfill_date_ids(normalized_name: str, person_data: Dict[str, str]) -> Dict[str, str]:
+    """Give legacy date entries without an id a stable one so they can be indexed."""
+    entries = parse_dates_field(person_data.get("dates"))
+    if all(entry.get("id") for entry in entries):
+        return person_data
     
-    # Update Redis
-    r.hset(key, mapping=update_data)
+    key = f"dating:person:{normalized_name}"
     
-    # Get updated record
-    person_data = r.hgetall(key)
+    def write(pipe, old_data):
+        if old_data is None:
+            return person_data
+        update_data = {"dates": serialize_dates_field(parse_dates_field(old_data.get("dates")))}
+        new_data = {**old_data, **to_stored(update_data)}
+        pipe.multi()
+        queue_person_write(pipe, key, update_data)
+        queue_index_updates(pipe, normalized_name, old_data, new_data)
+        return new_data
     
-    return {"success": True, "data": person_data}
+    return await run_person_transaction(key, write)
 
-async def get_person(name: str) -> Dict[str, Any]:
-    """Get a person's record by name."""
-    if not name:
-        return {"success": False, "error": "Name is required"}
-    
+def counts_by_field(raw: Dict[str, str]) -> Dict[str, int]:
+    """Parse a counter hash, dropping fields that have fallen to zero."""
+    counts = {field: int(value) for field, value in raw.items()}
+    return {field: count for field, count in counts.items() if count > 0}
+
+async def get_analytics(top: int = 10) -> Dict[str, Any]:
+    """
+    Dashboard analytics from the incrementally maintained rollups.
+
+    Everything except ongoing relationship durations is precomputed; those
+    depend on the current time, so only their start times are read.
+    Archived people are included.
+    """
+    top = max(1, min(int(top), 100))
+    now = time.time()
     r = get_redis_client()
-    key = get_person_key(name)
+    pipe = r.pipeline(transaction=True)
+    pipe.scard("dating:people:all")
+    pipe.zcard(ARCHIVE_INDEX_KEY)
+    pipe.hgetall(ANALYTICS_TOTALS_KEY)
+    pipe.hgetall(ANALYTICS_START_MONTH_KEY)
+    pipe.hgetall(ANALYTICS_DATE_MONTH_KEY)
+    pipe.hgetall(ANALYTICS_FREQUENCY_KEY)
+    pipe.zrevrange(ANALYTICS_LOCATIONS_KEY, 0, top - 1, withscores=True)
+    pipe.zrevrange(ANALYTICS_DATES_PER_PERSON_KEY, 0, top - 1, withscores=True)
+    pipe.zrevrange(ANALYTICS_ENDED_DAYS_KEY, 0, top - 1, withscores=True)
+    # Ongoing relationships at least a day old, i.e. with a positive duration
+    pipe.zrangebyscore(ANALYTICS_ONGOING_START_KEY, "-inf", now - 86400, withscores=True)
+    (hot_people, archived_people, totals, start_months, date_months, frequency,
+     top_locations, top_dates_per_person, top_ended, ongoing) = await pipe.execute()
+    total_people = hot_people + archived_people
     
-    if not r.exists(key):
-        return {"success": False, "error": f"Person '{name}' not found"}
+    totals = {field: int(value) for field, value in totals.items()}
+    durations = analytics_durations(top_ended, ongoing, now, top)
     
-    person_data = r.hgetall(key)
-    return {"success": True, "data": person_data}
+    # Rollups are keyed by normalized name; look up display names for the top lists only
+    shown = list(dict.fromkeys([member for member, _ in top_dates_per_person] + [member for member, _ in durations]))
+    display_names = {}
+    if shown:
+        name_pipe = r.pipeline(transaction=False)
+        for member in shown:
+            person_read_command(name_pipe, f"dating:person:{member}", ["name"])
+        display_names = {
+            member: (decode_person(reply, ["name"]) or {}).get("name")
+            for member, reply in zip(shown, await name_pipe.execute())
+        }
+        for member, person_data in await fetch_archived([member for member in shown if not display_names[member]]):
+            display_names[member] = person_data.get("name")
+    
+    return analytics_result(
+        total_people, totals, start_months, date_months, frequency,
+        top_locations, top_dates_per_person, durations, ongoing, now, display_names
+    )
 
-async def list_people(status: Optional[str] = None, active_only: bool = False,
-                     include_details: bool = True) -> Dict[str, Any]:
-    """List all people with optional filtering."""
+def analytics_durations(top_ended: List[Tuple[str, float]], ongoing: List[Tuple[str, float]],
+                        now: float, top: int) -> List[Tuple[str, int]]:
+    """The longest relationships in days, from the top ended ones and the ongoing ones' start epochs."""
+    ongoing_days = [(member, int((now - start) // 86400)) for member, start in ongoing]
+    return sorted(
+        [(member, int(days)) for member, days in top_ended] + ongoing_days,
+        key=lambda item: item[1],
+        reverse=True
+    )[:top]
+
+def analytics_result(total_people: int, totals: Dict[str, int], start_months: Dict[str, Any],
+                     date_months: Dict[str, Any], frequency: Dict[str, Any],
+                     top_locations: List[Tuple[str, float]], top_dates_per_person: List[Tuple[str, float]],
+                     durations: List[Tuple[str, int]], ongoing: List[Tuple[str, float]], now: float,
+                     display_names: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """get_analytics' result from the rollup values; ongoing are (person, start epoch) pairs at least a day old."""
+    duration_count = totals.get("ended_count", 0) + len(ongoing)
+    duration_sum = totals.get("ended_days_sum", 0) + sum(int((now - start) // 86400) for _, start in ongoing)
+    relationship_durations = [
+        {"name": display_names.get(member) or member, "days": days} for member, days in durations
+    ]
+    total_dates = totals.get("total_dates", 0)
+    return {
+        "success": True,
+        "data": {
+            "total_people": total_people,
+            "total_dates": total_dates,
+            "avg_dates_per_person": round(total_dates / total_people, 1) if total_people else 0,
+            "avg_relationship_duration_days": round(duration_sum / duration_count, 1) if duration_count else 0,
+            "longest_relationship": relationship_durations[0] if relationship_durations else None,
+            "dating_history": [
+                {"month": month, "count": count} for month, count in sorted(counts_by_field(start_months).items())
+            ],
+            "dates_per_person": [
+                {"name": display_names.get(member) or member, "count": int(count)}
+                for member, count in top_dates_per_person
+            ],
+            "date_locations": [{"location": location, "count": int(count)} for location, count in top_locations],
+            "dates_by_month": [
+                {"month": month, "count": count} for month, count in sorted(counts_by_field(date_months).items())
+            ],
+            "relationship_durations": relationship_durations,
+            "date_frequency_distribution": [
+                {"dates": int(dates), "people": people}
+                for dates, people in sorted(counts_by_field(frequency).items(), key=lambda item: int(item[0]))
+            ]
+        }
+    }
+
+async def rebuild_indexes() -> Dict[str, Any]:
+    """
+    Recompute all derived keys (statistics counters, status, dates, date owner and search indexes, analytics rollups) from the person records.
+
+    Archived records count towards the statistics counters and analytics
+    rollups only; archive index entries whose archive key is gone are dropped.
+    """
     r = get_redis_client()
+    people = [
+        (normalized_name, await backfill_date_ids(normalized_name, person_data))
+        for normalized_name, person_data in await fetch_all_people()
+    ]
+    archived_names = await r.zrange(ARCHIVE_INDEX_KEY, 0, -1)
+    archived = await fetch_archived(archived_names)
+    dangling = set(archived_names) - {normalized_name for normalized_name, _ in archived}
     
-    # Get all normalized names from index
-    normalized_names = r.smembers("dating:people:all")
+    status_counts: Dict[str, int] = {}
+    status_members: Dict[str, List[str]] = {}
+    how_we_met_counts: Dict[str, int] = {}
+    date_members: Dict[str, float] = {}
+    analytics_counters: Dict[Tuple[str, str], int] = {}
+    analytics_members: Dict[str, Dict[str, float]] = {}
+    for normalized_name, person_data in people:
+        status_members.setdefault(canonical_status(person_data.get("status")), []).append(normalized_name)
+        date_members.update(indexed_dates(normalized_name, person_data))
+    for normalized_name, person_data in people + archived:
+        status = canonical_status(person_data.get("status"))
+        status_counts[status] = status_counts.get(status, 0) + 1
+        how_we_met = effective_how_we_met(person_data)
+        if how_we_met:
+            how_we_met_counts[how_we_met] = how_we_met_counts.get(how_we_met, 0) + 1
+        counters, members = analytics_contribution(normalized_name, person_data)
+        for counter, amount in counters.items():
+            analytics_counters[counter] = analytics_counters.get(counter, 0) + amount
+        for (key, member), score in members.items():
+            analytics_members.setdefault(key, {})[member] = score
     
-    if not normalized_names:
-        return {"success": True, "data": []}
+    stale_keys = [key async for key in r.scan_iter(match=get_status_index_key("*"))]
+    stale_keys += [key async for key in r.scan_iter(match=SEARCH_KEY_PATTERN)]
+    search_postings: Dict[str, List[str]] = {}
+    for normalized_name, _ in people:
+        for posting_key in get_search_postings(normalized_name):
+            search_postings.setdefault(posting_key, []).append(normalized_name)
     
-    people = []
-    for normalized_name in normalized_names:
-        key = f"dating:person:{normalized_name}"
-        if not r.exists(key):
-            continue
-        
-        person_data = r.hgetall(key)
-        
-        # Apply filters
-        person_status = person_data.get("status", "active")
-        
-        if active_only and person_status != "active":
-            continue
-        
-        if status and person_status != status:
-            continue
-        
-        # Optionally exclude details
-        if not include_details:
-            person_data = {k: v for k, v in person_data.items() 
-                          if k not in ["details", "memory_tags"]}
-        
-        people.append(person_data)
+    pipe = r.pipeline(transaction=True)
+    pipe.delete(STATS_STATUS_KEY, STATS_HOW_WE_MET_KEY, DATES_INDEX_KEY, DATE_OWNER_KEY, *ANALYTICS_KEYS, *stale_keys)
+    if status_counts:
+        pipe.hset(STATS_STATUS_KEY, mapping=status_counts)
+    for status, members in status_members.items():
+        pipe.sadd(get_status_index_key(status), *members)
+    for posting_key, members in search_postings.items():
+        pipe.sadd(posting_key, *members)
+    if date_members:
+        pipe.zadd(DATES_INDEX_KEY, date_members)
+        date_owners = {}
+        for member in date_members:
+            normalized_name, date_id = json.loads(member)
+            date_owners[date_id] = normalized_name
+        pipe.hset(DATE_OWNER_KEY, mapping=date_owners)
+    if how_we_met_counts:
+        pipe.hset(STATS_HOW_WE_MET_KEY, mapping=how_we_met_counts)
+    for (key, field), amount in analytics_counters.items():
+        if key in ANALYTICS_ZSET_COUNTERS:
+            pipe.zadd(key, {field: amount})
+        else:
+            pipe.hset(key, field, amount)
+    for key, members in analytics_members.items():
+        pipe.zadd(key, members)
+    if dangling:
+        pipe.zrem(ARCHIVE_INDEX_KEY, *dangling)
+    pipe.set(INDEX_VERSION_KEY, INDEX_VERSION)
+    await pipe.execute()
     
-    return {"success": True, "data": people}
+    logger.info(f"Rebuilt derived indexes for {len(people)} people ({len(archived)} archived)")
+    return {
+        "success": True,
+        "data": {
+            "people_indexed": len(people),
+            "people_archived": len(archived),
+            "dates_indexed": len(date_members),
+            "status_distribution": status_counts,
+            "common_how_we_met": how_we_met_counts
+        }
+    }
 
-async def delete_person(name: str) -> Dict[str, Any]:
-    """Delete a person record."""
-    if not name:
-        return {"success": False, "error": "Name is required"}
-    
+async def ensure_indexes_built():
+    """Rebuild derived keys on startup if they are missing or outdated."""
+    r = get_redis_client()
+    if await r.get(INDEX_VERSION_KEY) != INDEX_VERSION:
+        logger.info("Derived indexes missing or outdated - rebuilding")
+        await rebuild_indexes()
+
+async def json_module_available() -> bool:
+    """Whether the RedisJSON module is loaded."""
+    try:
+        await get_redis_client().execute_command("JSON.GET", JSON_PROBE_KEY, "$")
+    except redis.exceptions.ResponseError:
+        return False
+    return True
+
+async def convert_person_records(keys: List[str], target: str) -> int:
+    """Rewrite the given person keys in the target layout in one WATCHed MULTI; returns how many changed."""
     r = get_redis_client()
-    normalized_name = normalize_name(name)
-    key = get_person_key(name)
-    
-    if not r.exists(key):
-        return {"success": False, "error": f"Person '{name}' not found"}
-    
-    # Delete record
-    r.delete(key)
     
-    # Remove from index
-    remove_from_index(normalized_name)
+    async def transaction(pipe):
+        # Keys are already WATCHed, so reading them over a separate pipeline is safe.
+        # HGETALL fails with WRONGTYPE on JSON documents, which tells the layouts apart.
+        probe = r.pipeline(transaction=False)
+        for key in keys:
+            probe.hgetall(key)
+        replies = dict(zip(keys, await probe.execute(raise_on_error=False)))
+        records = {}
+        for key, reply in replies.items():
+            if not reply or not isinstance(reply, dict):
+                continue
+            # Hashes may be plain or compact; expanding short names leaves plain ones as they are
+            fields = from_compact_fields(reply)
+            if target == "json" or (to_compact_fields(fields) if target == "compact" else fields) != reply:
+                records[key] = fields
+        if target != "json":
+            json_keys = [key for key, reply in replies.items() if isinstance(reply, redis.exceptions.ResponseError)]
+            reader = r.pipeline(transaction=False)
+            for key in json_keys:
+                reader.execute_command("JSON.GET", key, "$")
+            for key, document in zip(json_keys, map(decode_document, await reader.execute())):
+                if document:
+                    records[key] = document
+        if records:
+            pipe.multi()
+            for key, record in records.items():
+                pipe.delete(key)
+                queue_person_write(pipe, key, record, create=True, mode=target)
+        return len(records)
     
-    return {"success": True, "message": f"Person '{name}' deleted"}
+    return await r.transaction(transaction, *keys, value_from_callable=True)
 
-async def search_people(query: str, status: Optional[str] = None) -> Dict[str, Any]:
-    """Search people by name (fuzzy matching)."""
-    if not query:
-        return {"success": False, "error": "Query is required"}
+async def migrate_storage(target: str) -> Dict[str, Any]:
+    """
+    Convert every person record to the target storage layout ("hash", "compact" or "json").
+
+    Records move in WATCHed chunks, so a concurrent write to a chunk retries
+    it rather than being lost, and records already in the target layout are
+    skipped, so an interrupted migration can simply be rerun. Versions and
+    derived keys are untouched since the records' contents don't change.
+    Other servers still using the old layout get WRONGTYPE errors for moved
+    records, so migrate while they are stopped.
+    """
+    global storage_mode
+    if target not in STORAGE_MODES:
+        return {"success": False, "error": f"target must be one of: {', '.join(STORAGE_MODES)}"}
+    if target == "json" and not await json_module_available():
+        return {"success": False, "error": "The RedisJSON module is not loaded on this Redis server"}
     
     r = get_redis_client()
-    normalized_names = r.smembers("dating:people:all")
-    
-    query_lower = query.lower()
-    matches = []
+    keys = [key async for key in r.scan_iter(match="dating:person:*", count=SCAN_MAX_COUNT)]
+    converted = 0
+    for start in range(0, len(keys), BULK_READ_CHUNK_SIZE):
+        converted += await convert_person_records(keys[start:start + BULK_READ_CHUNK_SIZE], target)
+    await r.set(STORAGE_MODE_KEY, target)
+    storage_mode = target
+    cache_invalidate()
     
-    for normalized_name in normalized_names:
-        key = f"dating:person:{normalized_name}"
-        if not r.exists(key):
-            continue
-        
-        person_data = r.hgetall(key)
-        person_name = person_data.get("name", "")
-        
-        # Check if query matches name (case-insensitive)
-        if query_lower in person_name.lower() or query_lower in normalized_name:
-            person_status = person_data.get("status", "active")
-            
-            if status and person_status != status:
-                continue
-            
-            matches.append(person_data)
-    
-    return {"success": True, "data": matches}
+    logger.info(f"Migrated {converted} of {len(keys)} person records to {target} storage")
+    return {"success": True, "data": {"storage": target, "people": len(keys), "converted": converted}}
 
-async def get_statistics() -> Dict[str, Any]:
-    """Get statistics about dating history."""
+async def ensure_storage_mode():
+    """Settle the storage layout on startup, migrating person records when REDIS_DATING_STORAGE changed."""
+    global storage_mode
     r = get_redis_client()
-    normalized_names = r.smembers("dating:people:all")
+    requested = REQUESTED_STORAGE_MODE
+    if requested not in STORAGE_MODES:
+        logger.warning(f"Unknown REDIS_DATING_STORAGE '{requested}' - using hash storage")
+        requested = "hash"
+    json_available = await json_module_available()
+    if requested == "json" and not json_available:
+        logger.warning("REDIS_DATING_STORAGE=json but the RedisJSON module is not loaded - using hash storage")
+        requested = "hash"
+    
+    current = await r.get(STORAGE_MODE_KEY) or "hash"
+    if current == requested:
+        storage_mode = requested
+    elif current == "json" and not json_available:
+        logger.error("Person records are stored as RedisJSON documents but the module is not loaded - load it to read them")
+        storage_mode = current
+    else:
+        logger.info(f"Storage layout changed from {current} to {requested} - migrating person records")
+        await migrate_storage(requested)
+
+async def redis_stats(reset: bool = False) -> Dict[str, Any]:
+    """Client-side Redis metrics: pool usage, retries, person cache and per-command latency/sizes."""
+    global metrics_started_at
+    pool = getattr(get_redis_client(), "connection_pool", None)
+    in_use = getattr(pool, "_in_use_connections", None)
+    available = getattr(pool, "_available_connections", None)
+    commands = {}
+    for name, metrics in sorted(command_metrics.items(), key=lambda item: item[1]["total_ms"], reverse=True):
+        commands[name] = {
+            "calls": metrics["calls"],
+            "errors": metrics["errors"],
+            "avg_ms": round(metrics["total_ms"] / metrics["calls"], 3),
+            "p50_ms": latency_percentile(metrics["buckets"], 0.50),
+            "p95_ms": latency_percentile(metrics["buckets"], 0.95),
+            "p99_ms": latency_percentile(metrics["buckets"], 0.99),
+            "max_ms": round(metrics["max_ms"], 3),
+            "total_ms": round(metrics["total_ms"], 3),
+            "bytes_sent": metrics["bytes_sent"],
+            "bytes_received": metrics["bytes_received"]
+        }
+    lookups = cache_metrics["hits"] + cache_metrics["misses"]
+    data = {
+        "since": datetime.fromtimestamp(metrics_started_at).isoformat(),
+        "pool": {
+            "max_connections": getattr(pool, "max_connections", None),
+            "in_use": len(in_use) if in_use is not None else None,
+            "idle": len(available) if available is not None else None
+        },
+        "retries": retry_metrics["retries"],
+        "person_cache": {
+            "enabled": PERSON_CACHE_SIZE > 0,
+            "size": len(person_cache),
+            "max_size": PERSON_CACHE_SIZE,
+            "ttl_seconds": PERSON_CACHE_TTL_SECONDS,
+            "notifications": cache_notifications,
+            **cache_metrics,
+            "hit_rate": round(cache_metrics["hits"] / lookups, 3) if lookups else None
+        },
+        "commands": commands
+    }
+    if reset:
+        command_metrics.clear()
+        retry_metrics["retries"] = 0
+        for counter in cache_metrics:
+            cache_metrics[counter] = 0
+        metrics_started_at = time.time()
+    return {"success": True, "data": data}
+
+MEMORY_REPORT_MAX_SAMPLE = 1000
+
+async def memory_report(sample: int = 100) -> Dict[str, Any]:
+    """
+    Estimate person-record memory from a random sample of person keys.
+
+    MEMORY USAGE (SAMPLES 0, so every field is counted) gives each key's
+    footprint and OBJECT ENCODING whether its hash is still a listpack. The
+    stored field names and values (serialized, for JSON documents) give the
+    bytes per field. Commands the server doesn't allow are reported as null.
+    """
+    try:
+        sample = max(1, min(int(sample), MEMORY_REPORT_MAX_SAMPLE))
+    except (TypeError, ValueError):
+        return {"success": False, "error": "sample must be an integer"}
     
-    total = len(normalized_names)
-    status_counts = {"active": 0, "paused": 0, "exploring": 0, "not_pursuing": 0}
-    legacy_status_map = {"past": "not_pursuing"}
-    meeting_places = {}
+    r = get_redis_client()
+    total_people = await r.scard("dating:people:all")
+    keys = [f"dating:person:{normalized_name}" for normalized_name in await r.srandmember("dating:people:all", sample)]
+    pipe = r.pipeline(transaction=False)
+    for key in keys:
+        pipe.memory_usage(key, samples=0)
+        pipe.object("encoding", key)
+        if storage_mode == "json":
+            pipe.execute_command("JSON.GET", key, "$")
+        else:
+            pipe.hgetall(key)
+    replies = await pipe.execute(raise_on_error=False)
     
-    for normalized_name in normalized_names:
-        key = f"dating:person:{normalized_name}"
-        if not r.exists(key):
+    usages = []
+    encodings: Dict[str, int] = {}
+    fields: Dict[str, Dict[str, Any]] = {}
+    sampled = 0
+    for i in range(len(keys)):
+        usage, encoding, record = replies[3 * i:3 * i + 3]
+        if storage_mode == "json":
+            record = decode_document(record) if isinstance(record, str) else None
+            stored = {json.dumps(field): json.dumps(value) for field, value in (record or {}).items()}
+        else:
+            stored = record if isinstance(record, dict) else None
+        if not stored:
             continue
-        
-        person_data = r.hgetall(key)
-        status = person_data.get("status", "active").lower()
-        if status in status_counts:
-            status_counts[status] += 1
-        elif status in legacy_status_map:
-            mapped_status = legacy_status_map[status]
-            status_counts[mapped_status] += 1
-        
-        how_we_met = person_data.get("how_we_met") or person_data.get("meeting_place")
-        if how_we_met:
-            meeting_places[how_we_met] = meeting_places.get(how_we_met, 0) + 1
+        sampled += 1
+        if isinstance(usage, int):
+            usages.append(usage)
+        if isinstance(encoding, str):
+            encodings[encoding] = encodings.get(encoding, 0) + 1
+        for stored_name, value in stored.items():
+            name = json.loads(stored_name) if storage_mode == "json" else stored_name
+            if storage_mode == "compact":
+                name = EXPANDED_FIELD_NAMES.get(name, name)
+            value_bytes = len(value.encode())
+            stats = fields.setdefault(name, {"stored_as": stored_name, "present": 0, "bytes": 0, "max_value_bytes": 0})
+            stats["present"] += 1
+            stats["bytes"] += len(stored_name.encode()) + value_bytes
+            stats["max_value_bytes"] = max(stats["max_value_bytes"], value_bytes)
+            if storage_mode == "compact" and name == "dates" and value.startswith(COMPRESSED_PREFIX):
+                stats["compressed"] = stats.get("compressed", 0) + 1
+    
+    payload_bytes = sum(stats["bytes"] for stats in fields.values())
+    for stats in fields.values():
+        stats["avg_bytes"] = round(stats["bytes"] / sampled, 1)
+        stats["share"] = round(stats["bytes"] / payload_bytes, 3) if payload_bytes else 0
+    avg_usage = sum(usages) / len(usages) if usages else None
+    try:
+        listpack_limits = await r.config_get("hash-max-*")
+    except redis.exceptions.ResponseError:
+        listpack_limits = None
     
     return {
         "success": True,
         "data": {
-            "total_people": total,
-            "active_count": status_counts["active"],
-            "paused_count": status_counts["paused"],
-            "exploring_count": status_counts["exploring"],
-            "not_pursuing_count": status_counts["not_pursuing"],
-            "past_count": status_counts["not_pursuing"],  # Backwards compatibility
-            "status_distribution": status_counts,
-            "common_meeting_places": meeting_places,
-            "common_how_we_met": meeting_places
+            "storage": storage_mode,
+            "people": total_people,
+            "sampled": sampled,
+            "memory_usage": {
+                "sampled_bytes": sum(usages) if usages else None,
+                "avg_bytes_per_person": round(avg_usage, 1) if avg_usage is not None else None,
+                "estimated_total_bytes": round(avg_usage * total_people) if avg_usage is not None else None
+            },
+            "encodings": encodings,
+            "listpack_limits": listpack_limits,
+            "payload_bytes": payload_bytes,
+            "fields": dict(sorted(fields.items(), key=lambda item: item[1]["bytes"], reverse=True))
         }
     }
 
@@ -366,35 +2415,122 @@ async def get_statistics() -> Dict[str, Any]:
 
 async def hset(key: str, field: str, value: str) -> Dict[str, Any]:
     """Direct Redis HSET operation."""
-    r = get_redis_client()
-    r.hset(key, field, value)
-    return {"success": True, "message": f"Set {field} on {key}"}
+    if not key.startswith("dating:person:"):
+        r = get_redis_client()
+        await r.hset(key, field, value)
+        return {"success": True, "message": f"Set {field} on {key}"}
+    
+    # Raw writes to person records, including ones that create the record, still keep derived keys in sync
+    normalized_name = key[len("dating:person:"):]
+    if field == "dates":
+        # Entries need an id to be in the dates index
+        value = serialize_dates_field(value)
+    
+    def write(pipe, old_data):
+        pipe.multi()
+        queue_person_write(pipe, key, {field: value}, create=old_data is None)
+        if old_data is None:
+            ensure_index(normalized_name, pipe)
+        queue_index_updates(pipe, normalized_name, old_data, {**(old_data or {}), **to_stored({field: value})})
+        return {"success": True, "message": f"Set {field} on {key}"}
+    
+    return await run_person_transaction(key, write, restore=True)
 
 async def hgetall(key: str) -> Dict[str, Any]:
-    """Direct Redis HGETALL operation."""
+    """Direct Redis HGETALL operation (person records are read in either storage mode)."""
     r = get_redis_client()
-    if not r.exists(key):
+    data = await read_person(r, key) if key.startswith("dating:person:") else await r.hgetall(key)
+    if not data:
         return {"success": False, "error": f"Key '{key}' not found"}
-    
-    data = r.hgetall(key)
+
     return {"success": True, "data": data}
 
-async def keys(pattern: str) -> Dict[str, Any]:
-    """Direct Redis KEYS operation."""
+# Bounds for SCAN (and KEYS, which pages through SCAN) so a tool call can't stall Redis
+SCAN_MAX_COUNT = 1000
+SCAN_DEFAULT_MAX_RESULTS = 1000
+SCAN_MAX_RESULTS_LIMIT = int(os.getenv("REDIS_DATING_SCAN_MAX_RESULTS", "10000"))
+SCAN_TIME_BUDGET_MS = float(os.getenv("REDIS_DATING_SCAN_TIME_BUDGET_MS", "250"))
+SCAN_KEY_TYPES = ("string", "list", "set", "zset", "hash", "stream", "ReJSON-RL")
+
+async def scan(pattern: Optional[str] = None, cursor: Any = 0, count: int = 100,
+               max_results: int = SCAN_DEFAULT_MAX_RESULTS, key_type: Optional[str] = None,
+               time_budget_ms: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Direct Redis SCAN operation, paging until max_results or the time budget.
+
+    Whole SCAN batches are kept so no key is skipped on resume; a page can
+    therefore exceed max_results by up to `count` - 1 keys. next_cursor is 0
+    once the keyspace has been fully iterated.
+    """
+    try:
+        cursor = int(cursor or 0)
+        count = max(1, min(int(count), SCAN_MAX_COUNT))
+        max_results = max(1, min(int(max_results), SCAN_MAX_RESULTS_LIMIT))
+        budget_ms = SCAN_TIME_BUDGET_MS if time_budget_ms is None else min(float(time_budget_ms), SCAN_TIME_BUDGET_MS)
+    except (TypeError, ValueError):
+        return {"success": False, "error": "cursor, count, max_results and time_budget_ms must be numbers"}
+    if key_type and key_type not in SCAN_KEY_TYPES:
+        return {"success": False, "error": f"Invalid type. Must be one of: {', '.join(SCAN_KEY_TYPES)}"}
+    
     r = get_redis_client()
-    matching_keys = r.keys(pattern)
-    return {"success": True, "data": matching_keys}
+    deadline = time.monotonic() + budget_ms / 1000
+    matched: Dict[str, None] = {}
+    while True:
+        cursor, batch = await r.scan(cursor=cursor, match=pattern or None, count=count, _type=key_type or None)
+        # SCAN may return a key more than once across batches
+        matched.update(dict.fromkeys(batch))
+        if cursor == 0 or len(matched) >= max_results or time.monotonic() >= deadline:
+            break
+    
+    return {"success": True, "data": list(matched), "next_cursor": cursor, "complete": cursor == 0}
+
+async def keys(pattern: str) -> Dict[str, Any]:
+    """KEYS compatibility alias: one bounded SCAN pass from the start of the keyspace."""
+    return await scan(pattern=pattern)
+
+# Storage backends
+
+# Operations behind the tools; every backend provides them with the same arguments and results
+STORE_OPERATIONS = (
+    "create_person", "update_person", "get_person", "get_people", "update_people", "list_people",
+    "delete_person", "search_people", "archive_people", "restore_person", "get_analytics", "read_changes",
+    "get_statistics", "query_dates", "get_date_by_id", "append_date", "patch_date", "remove_date",
+    "rebuild_indexes", "hset", "hgetall"
+)
+# Tools about Redis itself, only offered with the redis backend
+REDIS_ONLY_TOOLS = ("migrate_storage", "redis_stats", "memory_report", "SCAN", "KEYS")
+# Tools a client may safely repeat, e.g. after losing the connection mid-call (get_person's restore from the archive included)
+IDEMPOTENT_TOOLS = (
+    "get_person", "get_people", "list_people", "search_people", "get_analytics", "read_changes", "get_statistics",
+    "query_dates", "get_date_by_id", "memory_report", "HGETALL", "SCAN", "KEYS"
+)
+store = None
+
+def get_store():
+    """Get the selected storage backend: the Redis functions of this module, or a SqliteStore."""
+    global store
+    if store is None:
+        if STORAGE_BACKEND == "sqlite":
+            server_dir = os.path.dirname(os.path.abspath(__file__))
+            if server_dir not in sys.path:
+                sys.path.insert(0, server_dir)
+            from sqlite_store import SqliteStore
+            # The store looks this module's helpers and settings up as it runs, so rebinding them takes effect
+            store = SqliteStore(SQLITE_PATH, sys.modules[__name__])
+        else:
+            store = SimpleNamespace(**{operation: globals()[operation] for operation in STORE_OPERATIONS})
+    return store
 
 # Tool Definitions
 
 @server.list_tools()
 async def list_tools() -> List[Tool]:
     """List available tools."""
-    if not REDIS_AVAILABLE:
+    if STORAGE_BACKEND != "sqlite" and not REDIS_AVAILABLE:
         logger.warning("Redis not available - tools will not work")
         return []
     
-    return [
+    tools = [
         # High-level operations
         Tool(
             name="create_person",
@@ -485,15 +2621,71 @@ async def list_tools() -> List[Tool]:
                 "required": ["name"]
             }
         ),
+        Tool(
+            name="get_people",
+            description="Get many people by name in one call. Returns one result per name, in order, each with success and data or error",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "names": {"type": "array", "items": {"type": "string"}, "description": f"Names to fetch (required, up to {BATCH_MAX_ITEMS})"},
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return these fields (optional; name is always included)"
+                    }
+                },
+                "required": ["names"]
+            }
+        ),
+        Tool(
+            name="update_people",
+            description=(
+                "Update many existing people in one atomic call. Each item takes the same fields as update_person. "
+                "Returns one result per item, in order; invalid or missing people fail without blocking the others"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "updates": {
+                        "type": "array",
+                        "description": f"Partial updates (required, up to {BATCH_MAX_ITEMS})",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "name": {"type": "string", "description": "Person's name (required)"},
+                                "start_date": {"type": "string"},
+                                "end_date": {"type": "string"},
+                                "how_we_met": {"type": "string"},
+                                "details": {"type": "string"},
+                                "status": {"type": "string", "description": "Status: active, paused, exploring, not_pursuing"},
+                                "memory_tags": {"type": "string"},
+                                "next_date": {"type": "string"},
+                                "photo_url": {"type": "string"},
+                                "dates": {"type": "array", "items": {"type": "object"}, "description": "Replaces the whole dates list (prefer append_date/patch_date)"}
+                            },
+                            "required": ["name"]
+                        }
+                    }
+                },
+                "required": ["updates"]
+            }
+        ),
         Tool(
             name="list_people",
-            description="List all people with optional filtering",
+            description="List all people with optional filtering, ordered by name. Use fields to fetch only what you need and limit/cursor to page",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "status": {"type": "string", "description": "Filter by status: active, paused, exploring, not_pursuing (optional)"},
                     "active_only": {"type": "boolean", "description": "If true, only return active people (optional, default: false)"},
-                    "include_details": {"type": "boolean", "description": "Include full details in response (optional, default: true)"}
+                    "include_details": {"type": "boolean", "description": "Include full details in response (optional, default: true)"},
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only return these fields, e.g. [\"name\", \"status\"] (optional; name is always included)"
+                    },
+                    "limit": {"type": "integer", "description": "Maximum people per page, up to 1000 (optional, default: all)"},
+                    "cursor": {"type": "string", "description": "next_cursor from the previous page (optional)"}
                 }
             }
         ),
@@ -510,16 +2702,73 @@ async def list_tools() -> List[Tool]:
         ),
         Tool(
             name="search_people",
-            description="Search people by name (fuzzy matching)",
+            description="Search people by name (fuzzy matching). Results are ranked best match first: exact, prefix, substring, then misspelled or similar-sounding names",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "query": {"type": "string", "description": "Search query (required)"},
-                    "status": {"type": "string", "description": "Filter by status (optional)"}
+                    "status": {"type": "string", "description": "Filter by status (optional)"},
+                    "limit": {"type": "integer", "description": "Maximum results to return (default: 20)"},
+                    "phonetic": {"type": "boolean", "description": "Also match names that sound alike, e.g. Cristina/Christina (default: true)"},
+                    "include_archived": {"type": "boolean", "description": "Also match archived people, restoring the ones returned (default: false)"}
                 },
                 "required": ["query"]
             }
         ),
+        Tool(
+            name="archive_people",
+            description=(
+                "Move not_pursuing people with no activity (updates, dates, start/end/next date) since older_than "
+                "to compressed archive keys outside the hot index. They still count in statistics and analytics, "
+                "and tools addressing them by name restore them"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "older_than": {"type": "string", "description": "Age in days like '180d', or an ISO date (default: REDIS_DATING_ARCHIVE_AFTER_DAYS)"},
+                    "dry_run": {"type": "boolean", "description": "Only report who would be archived (default: false)"}
+                }
+            }
+        ),
+        Tool(
+            name="restore_person",
+            description="Restore an archived person to the hot index",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Person's name (required)"}
+                },
+                "required": ["name"]
+            }
+        ),
+        Tool(
+            name="get_analytics",
+            description=(
+                "Get precomputed dating analytics: totals and averages, dating history by month, top people by dates, "
+                "top date locations, dates by month, longest relationships and the dates-per-person distribution"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "top": {"type": "integer", "description": "Entries in each top list (default: 10, max: 100)"}
+                }
+            }
+        ),
+        Tool(
+            name="read_changes",
+            description=(
+                "Read person change events (create/update/delete/archive/restore, changed fields, per-person version) after since_id. "
+                "Pass back last_id to continue; if reset is true, events were trimmed and you should re-list"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "since_id": {"type": "string", "description": "Stream id to read after (default: 0-0, the oldest retained event; \"$\" returns only the current last_id)"},
+                    "limit": {"type": "integer", "description": "Maximum events to return (default: 100, max: 1000)"},
+                    "block_ms": {"type": "integer", "description": "Wait up to this long for new events when there are none (optional, max: 10000)"}
+                }
+            }
+        ),
         Tool(
             name="get_statistics",
             description="Get statistics about dating history",
@@ -528,7 +2777,139 @@ async def list_tools() -> List[Tool]:
                 "properties": {}
             }
         ),
+        Tool(
+            name="query_dates",
+            description="Query date entries across all people in chronological order, optionally within a time window",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "from": {"type": "string", "description": "Only dates at or after this ISO date/datetime (optional)"},
+                    "to": {"type": "string", "description": "Only dates at or before this ISO date/datetime (optional)"},
+                    "person": {"type": "string", "description": "Only dates with this person (optional)"},
+                    "completed": {"type": "boolean", "description": "Filter by completed flag (optional)"},
+                    "active_only": {"type": "boolean", "description": "Only dates with active people (optional, default: false)"},
+                    "limit": {"type": "integer", "description": "Maximum entries to return, 1-1000 (optional, default: 100)"},
+                    "cursor": {"type": "string", "description": "next_cursor from a previous call to continue paging (optional)"}
+                }
+            }
+        ),
+        Tool(
+            name="get_date_by_id",
+            description="Get a single date entry by its id, including the person it belongs to",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "date_id": {"type": "string", "description": "Date entry id (required)"}
+                },
+                "required": ["date_id"]
+            }
+        ),
+        Tool(
+            name="append_date",
+            description="Atomically add one date entry to a person's dates and return it (preferred over rewriting dates with update_person)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string", "description": "Person's name (required)"},
+                    "date": {
+                        "type": "object",
+                        "description": "Date entry; an id is generated if omitted (required)",
+                        "properties": {
+                            "id": {"type": "string", "description": "Date entry id (optional)"},
+                            "where": {"type": "string", "description": "Where the date happened"},
+                            "when": {"type": "string", "description": "Date/time in ISO format"},
+                            "notes": {"type": "string", "description": "Notes about the date"},
+                            "learnings": {"type": "string", "description": "What you learned"},
+                            "completed": {"type": "boolean", "description": "Whether the date has happened"}
+                        }
+                    }
+                },
+                "required": ["name", "date"]
+            }
+        ),
+        Tool(
+            name="patch_date",
+            description="Atomically update fields of one date entry by id and return it",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "date_id": {"type": "string", "description": "Date entry id (required)"},
+                    "changes": {
+                        "type": "object",
+                        "description": "Fields to set on the entry (required)",
+                        "properties": {
+                            "where": {"type": "string", "description": "Where the date happened"},
+                            "when": {"type": "string", "description": "Date/time in ISO format"},
+                            "notes": {"type": "string", "description": "Notes about the date"},
+                            "learnings": {"type": "string", "description": "What you learned"},
+                            "completed": {"type": "boolean", "description": "Whether the date has happened"}
+                        }
+                    }
+                },
+                "required": ["date_id", "changes"]
+            }
+        ),
+        Tool(
+            name="remove_date",
+            description="Atomically remove one date entry by id and return the removed entry",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "date_id": {"type": "string", "description": "Date entry id (required)"}
+                },
+                "required": ["date_id"]
+            }
+        ),
+        Tool(
+            name="rebuild_indexes",
+            description="Recompute statistics counters, status index sets and the date indexes from all person records (repairs drift after manual edits)",
+            inputSchema={
+                "type": "object",
+                "properties": {}
+            }
+        ),
+        Tool(
+            name="migrate_storage",
+            description=(
+                "Convert every person record to another storage layout: 'hash' (one field per attribute), "
+                "'compact' (short field names, large dates compressed) or 'json' (RedisJSON documents, "
+                "requires the module). Run while other servers are stopped"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "target": {"type": "string", "enum": list(STORAGE_MODES), "description": "Layout to convert to (required)"}
+                },
+                "required": ["target"]
+            }
+        ),
         # Low-level operations
+        Tool(
+            name="redis_stats",
+            description=(
+                "Report Redis client metrics for this server: connection pool usage, retries, person cache "
+                "hits/misses, and per-command calls, errors, latency (avg/p50/p95/p99/max ms) and bytes sent/received"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "reset": {"type": "boolean", "description": "Clear the counters after reporting (default: false)"}
+                }
+            }
+        ),
+        Tool(
+            name="memory_report",
+            description=(
+                "Sample person keys and report their memory: MEMORY USAGE per person with an estimated total, "
+                "hash encodings (listpack vs hashtable) and stored bytes per field"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "sample": {"type": "integer", "description": "Number of random person keys to sample (default: 100, max: 1000)"}
+                }
+            }
+        ),
         Tool(
             name="HSET",
             description="Direct Redis HSET operation (for advanced use cases)",
@@ -553,9 +2934,30 @@ async def list_tools() -> List[Tool]:
                 "required": ["key"]
             }
         ),
+        Tool(
+            name="SCAN",
+            description=(
+                "Direct Redis SCAN operation. Returns one bounded page of matching keys and a next_cursor; "
+                "call again with that cursor until it is 0 (complete: true)"
+            ),
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "pattern": {"type": "string", "description": "Key pattern (e.g., 'dating:person:*'; default: all keys)"},
+                    "cursor": {"type": "integer", "description": "Cursor from the previous page's next_cursor (default: 0, the start)"},
+                    "count": {"type": "integer", "description": f"Keys Redis examines per SCAN call (default: 100, max: {SCAN_MAX_COUNT})"},
+                    "max_results": {"type": "integer", "description": f"Stop once this many keys have matched (default: {SCAN_DEFAULT_MAX_RESULTS}, max: {SCAN_MAX_RESULTS_LIMIT})"},
+                    "type": {"type": "string", "enum": list(SCAN_KEY_TYPES), "description": "Only return keys of this Redis type (optional)"},
+                    "time_budget_ms": {"type": "number", "description": f"Stop paging after this long (default and max: {SCAN_TIME_BUDGET_MS:g})"}
+                }
+            }
+        ),
         Tool(
             name="KEYS",
-            description="Direct Redis KEYS operation (use with caution on large datasets)",
+            description=(
+                f"Find keys matching a pattern. Alias for one SCAN page from cursor 0: at most about {SCAN_DEFAULT_MAX_RESULTS} keys "
+                "within the time budget; if complete is false, continue with SCAN from next_cursor"
+            ),
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -565,22 +2967,31 @@ async def list_tools() -> List[Tool]:
             }
         )
     ]
+    for tool in tools:
+        if tool.name in IDEMPOTENT_TOOLS:
+            tool.annotations = ToolAnnotations(idempotentHint=True)
+    if STORAGE_BACKEND == "sqlite":
+        return [tool for tool in tools if tool.name not in REDIS_ONLY_TOOLS]
+    return tools
 
 @server.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle tool calls."""
     logger.info(f"Tool called: {name} with arguments: {arguments}")
     
-    if not REDIS_AVAILABLE:
+    if STORAGE_BACKEND != "sqlite" and not REDIS_AVAILABLE:
         error_msg = json.dumps({"success": False, "error": "Redis not available. Install redis package."})
         return [TextContent(type="text", text=error_msg)]
     
     try:
         result = None
+        store = get_store()
         
+        if STORAGE_BACKEND == "sqlite" and name in REDIS_ONLY_TOOLS:
+            result = {"success": False, "error": f"{name} is only available with the redis backend"}
         # High-level operations
-        if name == "create_person":
-            result = await create_person(
+        elif name == "create_person":
+            result = await store.create_person(
                 name=arguments.get("name"),
                 start_date=arguments.get("start_date"),
                 end_date=arguments.get("end_date"),
@@ -594,7 +3005,7 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
                 photo_url=arguments.get("photo_url")
             )
         elif name == "update_person":
-            result = await update_person(
+            result = await store.update_person(
                 name=arguments.get("name"),
                 start_date=arguments.get("start_date"),
                 end_date=arguments.get("end_date"),
@@ -608,31 +3019,91 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
                 photo_url=arguments.get("photo_url")
             )
         elif name == "get_person":
-            result = await get_person(name=arguments.get("name"))
+            result = await store.get_person(name=arguments.get("name"))
+        elif name == "get_people":
+            result = await store.get_people(names=arguments.get("names"), fields=arguments.get("fields"))
+        elif name == "update_people":
+            result = await store.update_people(updates=arguments.get("updates"))
         elif name == "list_people":
-            result = await list_people(
+            result = await store.list_people(
                 status=arguments.get("status"),
                 active_only=arguments.get("active_only", False),
-                include_details=arguments.get("include_details", True)
+                include_details=arguments.get("include_details", True),
+                fields=arguments.get("fields"),
+                limit=arguments.get("limit"),
+                cursor=arguments.get("cursor")
             )
         elif name == "delete_person":
-            result = await delete_person(name=arguments.get("name"))
+            result = await store.delete_person(name=arguments.get("name"))
         elif name == "search_people":
-            result = await search_people(
+            result = await store.search_people(
                 query=arguments.get("query"),
-                status=arguments.get("status")
+                status=arguments.get("status"),
+                limit=arguments.get("limit", 20),
+                phonetic=arguments.get("phonetic", True),
+                include_archived=arguments.get("include_archived", False)
+            )
+        elif name == "archive_people":
+            result = await store.archive_people(
+                older_than=arguments.get("older_than"),
+                dry_run=arguments.get("dry_run", False)
+            )
+        elif name == "restore_person":
+            result = await store.restore_person(name=arguments.get("name"))
+        elif name == "get_analytics":
+            result = await store.get_analytics(top=arguments.get("top", 10))
+        elif name == "read_changes":
+            result = await store.read_changes(
+                since_id=arguments.get("since_id"),
+                limit=arguments.get("limit", 100),
+                block_ms=arguments.get("block_ms")
             )
         elif name == "get_statistics":
-            result = await get_statistics()
+            result = await store.get_statistics()
+        elif name == "query_dates":
+            result = await store.query_dates(
+                from_date=arguments.get("from"),
+                to_date=arguments.get("to"),
+                person=arguments.get("person"),
+                completed=arguments.get("completed"),
+                active_only=arguments.get("active_only", False),
+                limit=arguments.get("limit", 100),
+                cursor=arguments.get("cursor")
+            )
+        elif name == "get_date_by_id":
+            result = await store.get_date_by_id(date_id=arguments.get("date_id"))
+        elif name == "append_date":
+            result = await store.append_date(name=arguments.get("name"), date=arguments.get("date"))
+        elif name == "patch_date":
+            result = await store.patch_date(date_id=arguments.get("date_id"), changes=arguments.get("changes"))
+        elif name == "remove_date":
+            result = await store.remove_date(date_id=arguments.get("date_id"))
+        elif name == "rebuild_indexes":
+            result = await store.rebuild_indexes()
+        elif name == "migrate_storage":
+            result = await migrate_storage(target=arguments.get("target"))
         # Low-level operations
         elif name == "HSET":
-            result = await hset(
+            result = await store.hset(
                 key=arguments.get("key"),
                 field=arguments.get("field"),
                 value=arguments.get("value")
             )
         elif name == "HGETALL":
-            result = await hgetall(key=arguments.get("key"))
+            result = await store.hgetall(key=arguments.get("key"))
+        elif name == "redis_stats":
+            result = await redis_stats(reset=arguments.get("reset", False))
+        elif name == "memory_report":
+            result = await memory_report(sample=arguments.get("sample", 100))
+        elif name == "SCAN":
+            result = await scan(
+                pattern=arguments.get("pattern"),
+                cursor=arguments.get("cursor", 0),
+                count=arguments.get("count", 100),
+                max_results=arguments.get("max_results", SCAN_DEFAULT_MAX_RESULTS),
+                key_type=arguments.get("type"),
+                time_budget_ms=arguments.get("time_budget_ms")
+            )
         elif name == "KEYS":
             result = await keys(pattern=arguments.get("pattern"))
         else:
@@ -648,18 +3119,40 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         logger.error(error_msg)
         return [TextContent(type="text", text=error_msg)]
 
+# Tasks running alongside the server, referenced here so they aren't garbage collected mid-run
+BACKGROUND_TASKS = set()
+
+def start_background_task(coro):
+    """Run a coroutine alongside the server for as long as it runs."""
+    task = asyncio.create_task(coro)
+    BACKGROUND_TASKS.add(task)
+    task.add_done_callback(BACKGROUND_TASKS.discard)
+    return task
+
 async def main():
     """Run the MCP server."""
     logger.info("Starting Redis Dating MCP Server...")
     
-    # Test Redis connection
-    try:
-        r = get_redis_client()
-        r.ping()
-        logger.info("✅ Redis connection successful")
-    except Exception as e:
-        logger.error(f"❌ Redis connection failed: {e}")
-        logger.error("Make sure Redis is running and REDIS_HOST, REDIS_PORT, REDIS_DB are set correctly")
+    if STORAGE_BACKEND == "sqlite":
+        get_store()
+        logger.info(f"✅ Using SQLite storage at {SQLITE_PATH}")
+    else:
+        # Test Redis connection
+        try:
+            r = get_redis_client()
+            await r.ping()
+            logger.info("✅ Redis connection successful")
+            await ensure_storage_mode()
+            await ensure_indexes_built()
+        except Exception as e:
+            logger.error(f"❌ Redis connection failed: {e}")
+            logger.error("Make sure Redis is running and REDIS_HOST, REDIS_PORT, REDIS_DB are set correctly")
+    
+    if PERSON_CACHE_SIZE and STORAGE_BACKEND != "sqlite":
+        # Keeps retrying on its own, so it also recovers if Redis wasn't reachable yet
+        start_background_task(watch_person_invalidations())
+    if ARCHIVE_AFTER_DAYS > 0:
+        start_background_task(run_archive_policy())
     
     # Run the server with stdio transport
     async with stdio_server() as (read_stream, write_stream):
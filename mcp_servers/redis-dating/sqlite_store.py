@@ -0,0 +1,818 @@
+"""
+Embedded SQLite storage backend for the redis-dating server.
+
+For single-node installs that don't want to run a Redis server. SqliteStore
+provides the storage operations listed in mcp_server.STORE_OPERATIONS with
+the same arguments and result dicts as the Redis implementations. Validation,
+record building, search ranking and result formatting come from the server
+module, so both backends answer alike.
+
+Person records are kept as JSON objects of their hash fields. Everything the
+Redis backend keeps in derived keys lives in indexed columns and tables,
+written in the same transaction as the record:
+- people: status, how we met and the analytics inputs, with archived people
+  kept in place but flagged (queries on the hot set skip them)
+- dates: one row per date entry, indexed by time
+- postings: name search postings
+- changes: the change log read by read_changes
+
+The database runs in WAL mode, so readers never block the writer, and
+writes use BEGIN IMMEDIATE so concurrent processes serialize their
+read-modify-write cycles instead of losing updates.
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS people (
+    name TEXT PRIMARY KEY,       -- normalized name
+    record TEXT NOT NULL,        -- JSON object of the person's hash fields
+    display_name TEXT,
+    status TEXT NOT NULL,        -- canonical status
+    how_we_met TEXT,             -- how_we_met, falling back to meeting_place
+    start_month TEXT,            -- YYYY-MM of start_date
+    date_count INTEGER NOT NULL,
+    ended_days INTEGER,          -- end_date - start_date in days, when positive
+    ongoing_start REAL,          -- start_date epoch when there is no end_date
+    archived_at REAL             -- epoch the person was archived, NULL while hot
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS people_hot_status ON people (status, name) WHERE archived_at IS NULL;
+CREATE INDEX IF NOT EXISTS people_archived ON people (archived_at) WHERE archived_at IS NOT NULL;
+
+CREATE TABLE IF NOT EXISTS dates (
+    person TEXT NOT NULL,
+    position INTEGER NOT NULL,   -- index in the person's dates array
+    id TEXT,                     -- NULL for legacy entries without one
+    member TEXT,                 -- the Redis dates index member, which breaks ties in `when` order
+    when_epoch REAL NOT NULL,    -- `when` (or `date`) as epoch seconds, 0 if it doesn't parse
+    month TEXT,                  -- YYYY-MM of `when`
+    location TEXT,
+    entry TEXT NOT NULL,         -- the entry as JSON
+    PRIMARY KEY (person, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS dates_when ON dates (when_epoch, member) WHERE id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS dates_id ON dates (id);
+
+CREATE TABLE IF NOT EXISTS postings (
+    posting TEXT NOT NULL,
+    person TEXT NOT NULL,
+    PRIMARY KEY (posting, person)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS changes (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    ms INTEGER NOT NULL,         -- ids are "<ms>-<n>" like Redis stream ids
+    n INTEGER NOT NULL,
+    person TEXT NOT NULL,
+    op TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    version INTEGER NOT NULL
+);
+"""
+
+# read_changes polls this often while blocking for new events
+CHANGES_POLL_SECONDS = 0.05
+
+
+class SqliteStore:
+    """Person storage in an embedded SQLite database (one connection, serialized by a lock)."""
+
+    def __init__(self, path: str, core):
+        """
+        Open (creating if needed) the database at path.
+
+        core is the server module, whose helpers and settings are shared.
+        """
+        self.core = core
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+    async def run(self, func, *args, write: bool = False):
+        """Run func(*args) in one transaction on a worker thread."""
+        return await asyncio.to_thread(self.transaction, func, args, write)
+
+    def transaction(self, func, args, write: bool):
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE" if write else "BEGIN")
+            try:
+                result = func(*args)
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+            self.db.execute("COMMIT")
+            return result
+
+    # Records and derived rows
+
+    def load(self, normalized_name: str, restore: bool = False) -> Optional[Dict[str, str]]:
+        """A person's record; archived people count as missing unless restore brings them back."""
+        row = self.db.execute(
+            "SELECT record, archived_at FROM people WHERE name = ?", (normalized_name,)
+        ).fetchone()
+        if row is None:
+            return None
+        record = json.loads(row[0])
+        if row[1] is not None:
+            if not restore:
+                return None
+            if record.get("dates"):
+                # Records archived before date ids existed get them now, so their dates are indexed
+                record["dates"] = self.core.serialize_dates_field(record["dates"])
+                self.write_dates(normalized_name, record)
+            self.move(normalized_name, record, None, "restore")
+        return record
+
+    async def read_restoring(self, normalized_names: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Records of the given people, restoring archived ones.
+
+        The records are read without taking the write lock; only people found
+        archived are restored, in a write transaction of their own.
+        """
+        def read():
+            found, archived = {}, []
+            for normalized_name in normalized_names:
+                row = self.db.execute(
+                    "SELECT record, archived_at FROM people WHERE name = ?", (normalized_name,)
+                ).fetchone()
+                if row is None:
+                    continue
+                if row[1] is None:
+                    found[normalized_name] = json.loads(row[0])
+                else:
+                    archived.append(normalized_name)
+            return found, archived
+
+        def restore(archived):
+            restored = {}
+            for normalized_name in archived:
+                person_data = self.load(normalized_name, restore=True)
+                if person_data is not None:
+                    restored[normalized_name] = person_data
+            return restored
+
+        found, archived = await self.run(read)
+        if archived:
+            found.update(await self.run(restore, archived, write=True))
+        return found
+
+    def load_many(self, normalized_names: List[str]) -> Dict[str, Dict[str, str]]:
+        """Records of the hot people among normalized_names."""
+        found = {}
+        names = list(normalized_names)
+        # Stay well below SQLite's bound parameter limit
+        for start in range(0, len(names), 500):
+            chunk = names[start:start + 500]
+            rows = self.db.execute(
+                f"SELECT name, record FROM people WHERE archived_at IS NULL AND name IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            found.update((name, json.loads(record)) for name, record in rows)
+        return found
+
+    def save(self, normalized_name: str, old: Optional[Dict[str, str]], new: Optional[Dict[str, str]]):
+        """Write a person going from old to new (either may be None) with their derived rows and change event."""
+        core = self.core
+        op, changed, version = core.describe_change(old, new, None)
+        if new is None:
+            self.db.execute("DELETE FROM people WHERE name = ?", (normalized_name,))
+            self.db.execute("DELETE FROM dates WHERE person = ?", (normalized_name,))
+            self.db.execute("DELETE FROM postings WHERE person = ?", (normalized_name,))
+        else:
+            new["version"] = str(version)
+            self.db.execute(
+                "INSERT OR REPLACE INTO people (name, record, display_name, status, how_we_met, start_month, "
+                "date_count, ended_days, ongoing_start, archived_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL)",
+                (normalized_name, json.dumps(new), *self.person_columns(new))
+            )
+            if old is None or old.get("dates") != new.get("dates"):
+                self.write_dates(normalized_name, new)
+            if old is None:
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO postings (posting, person) VALUES (?, ?)",
+                    [(posting, normalized_name) for posting in core.get_search_postings(normalized_name)]
+                )
+        self.log_change(normalized_name, op, changed, version)
+
+    def move(self, normalized_name: str, record: Dict[str, str], archived_at: Optional[float], op: str):
+        """Archive or restore a person in place, bumping their version."""
+        _, _, version = self.core.describe_change(record, record, op)
+        record["version"] = str(version)
+        self.db.execute(
+            "UPDATE people SET record = ?, archived_at = ? WHERE name = ?",
+            (json.dumps(record), archived_at, normalized_name)
+        )
+        self.log_change(normalized_name, op, [], version)
+
+    def person_columns(self, record: Dict[str, str]) -> Tuple[Any, ...]:
+        """The derived people columns after record, in table order."""
+        core = self.core
+        start = core.parse_when(record.get("start_date"))
+        end = core.parse_when(record.get("end_date"))
+        days = int((end - start) // 86400) if start is not None and end is not None else 0
+        return (
+            record.get("name"),
+            core.canonical_status(record.get("status")),
+            core.effective_how_we_met(record),
+            core.iso_month(record.get("start_date")),
+            len(core.parse_dates_field(record.get("dates"))),
+            days if days > 0 else None,
+            start if start is not None and end is None else None
+        )
+
+    def write_dates(self, normalized_name: str, record: Dict[str, str]):
+        """Replace a person's date rows."""
+        core = self.core
+        rows = []
+        for position, entry in enumerate(core.parse_dates_field(record.get("dates"))):
+            date_id = str(entry["id"]) if entry.get("id") else None
+            when = core.parse_when(entry.get("when") or entry.get("date"))
+            location = entry.get("where", "Unknown")
+            rows.append((
+                normalized_name, position, date_id,
+                core.get_date_index_member(normalized_name, date_id) if date_id else None,
+                when if when is not None else 0,
+                core.iso_month(entry.get("when")),
+                str(location) if location else None,
+                json.dumps(entry)
+            ))
+        self.db.execute("DELETE FROM dates WHERE person = ?", (normalized_name,))
+        self.db.executemany("INSERT INTO dates VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def log_change(self, normalized_name: str, op: str, changed: List[str], version: int):
+        """Append a change event, trimming the log to REDIS_DATING_CHANGES_MAXLEN."""
+        ms = int(time.time() * 1000)
+        n = 0
+        last = self.db.execute("SELECT ms, n FROM changes ORDER BY seq DESC LIMIT 1").fetchone()
+        if last and ms <= last[0]:
+            ms, n = last[0], last[1] + 1
+        cursor = self.db.execute(
+            "INSERT INTO changes (ms, n, person, op, fields, version) VALUES (?, ?, ?, ?, ?, ?)",
+            (ms, n, normalized_name, op, ",".join(changed), version)
+        )
+        self.db.execute("DELETE FROM changes WHERE seq <= ?", (cursor.lastrowid - self.core.CHANGES_STREAM_MAXLEN,))
+
+    # People
+
+    async def create_person(self, name: str, **fields) -> Dict[str, Any]:
+        """Create a new person record."""
+        try:
+            person_data = self.core.build_person_record(name, **fields)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        normalized_name = self.core.normalize_name(name)
+
+        def write():
+            if self.load(normalized_name, restore=True) is not None:
+                return {"success": False, "error": f"Person '{name}' already exists. Use update_person to modify."}
+            self.save(normalized_name, None, person_data)
+            return {"success": True, "data": person_data}
+
+        return await self.run(write, write=True)
+
+    async def update_person(self, name: str, **fields) -> Dict[str, Any]:
+        """Update an existing person record."""
+        if not name:
+            return {"success": False, "error": "Name is required"}
+        try:
+            update_data = self.core.build_update_data(**fields)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        normalized_name = self.core.normalize_name(name)
+
+        def write():
+            old_data = self.load(normalized_name, restore=True)
+            if old_data is None:
+                return {"success": False, "error": f"Person '{name}' not found. Use create_person to create a new record."}
+            person_data = {**old_data, **update_data}
+            self.save(normalized_name, old_data, person_data)
+            return {"success": True, "data": person_data}
+
+        return await self.run(write, write=True)
+
+    async def update_people(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Apply many partial updates in one transaction."""
+        try:
+            results, prepared = self.core.prepare_updates(updates)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+
+        def write():
+            current = {}
+            for _, _, normalized_name, _ in prepared:
+                if normalized_name not in current:
+                    current[normalized_name] = self.load(normalized_name, restore=True)
+            for i, name, normalized_name, update_data in prepared:
+                old_data = current[normalized_name]
+                if old_data is None:
+                    results[i] = {"name": name, "success": False, "error": f"Person '{name}' not found"}
+                    continue
+                person_data = {**old_data, **update_data}
+                self.save(normalized_name, old_data, person_data)
+                current[normalized_name] = person_data
+                results[i] = {"name": name, "success": True, "data": person_data}
+
+        if prepared:
+            await self.run(write, write=True)
+        succeeded = sum(1 for result in results if result["success"])
+        return {"success": True, "data": results, "updated": succeeded, "failed": len(results) - succeeded}
+
+    async def get_person(self, name: str) -> Dict[str, Any]:
+        """Get a person's record by name."""
+        if not name:
+            return {"success": False, "error": "Name is required"}
+        normalized_name = self.core.normalize_name(name)
+        person_data = (await self.read_restoring([normalized_name])).get(normalized_name)
+        if not person_data:
+            return {"success": False, "error": f"Person '{name}' not found"}
+        return {"success": True, "data": person_data}
+
+    async def get_people(self, names: List[str], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Fetch many people in one transaction, with a result per requested name."""
+        core = self.core
+        if not isinstance(names, list) or not names:
+            return {"success": False, "error": "names must be a non-empty array"}
+        if len(names) > core.BATCH_MAX_ITEMS:
+            return {"success": False, "error": f"At most {core.BATCH_MAX_ITEMS} names per call"}
+        try:
+            fields = core.projection_fields(fields)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        valid_names = [name for name in names if isinstance(name, str) and core.normalize_name(name)]
+
+        records = await self.read_restoring(list(dict.fromkeys(map(core.normalize_name, valid_names))))
+        found = {normalized_name: core.project(person_data, fields) for normalized_name, person_data in records.items()}
+        results = []
+        for name in names:
+            if not isinstance(name, str) or not core.normalize_name(name):
+                results.append({"name": name, "success": False, "error": "Name is required"})
+            elif core.normalize_name(name) in found:
+                results.append({"name": name, "success": True, "data": found[core.normalize_name(name)]})
+            else:
+                results.append({"name": name, "success": False, "error": f"Person '{name}' not found"})
+        return {"success": True, "data": results, "found": sum(1 for result in results if result["success"])}
+
+    async def list_people(self, status: Optional[str] = None, active_only: bool = False,
+                          include_details: bool = True, fields: Optional[List[str]] = None,
+                          limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """List hot people in normalized name order, with optional filtering, projection and paging."""
+        core = self.core
+        try:
+            fields = core.projection_fields(fields)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        if limit is not None:
+            try:
+                limit = max(1, min(int(limit), 1000))
+            except (TypeError, ValueError):
+                return {"success": False, "error": "limit must be an integer"}
+
+        wanted_statuses = set()
+        if active_only:
+            wanted_statuses.add("active")
+        if status:
+            wanted_statuses.add(core.canonical_status(status))
+        if len(wanted_statuses) > 1:
+            # active_only combined with a different status can never match
+            return {"success": True, "data": [], "next_cursor": None}
+
+        query = "SELECT name, record FROM people WHERE archived_at IS NULL"
+        params: List[Any] = []
+        if wanted_statuses:
+            query += " AND status = ?"
+            params.append(wanted_statuses.pop())
+        if cursor is not None:
+            query += " AND name > ?"
+            params.append(cursor)
+        query += " ORDER BY name"
+        if limit is not None:
+            # One extra row tells whether there is another page
+            query += " LIMIT ?"
+            params.append(limit + 1)
+        rows = await self.run(lambda: self.db.execute(query, params).fetchall())
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1][0]
+        people = []
+        for _, record in rows:
+            person_data = core.project(json.loads(record), fields)
+            if not include_details:
+                person_data = {k: v for k, v in person_data.items() if k not in ["details", "memory_tags"]}
+            people.append(person_data)
+        return {"success": True, "data": people, "next_cursor": next_cursor}
+
+    async def delete_person(self, name: str) -> Dict[str, Any]:
+        """Delete a person record."""
+        if not name:
+            return {"success": False, "error": "Name is required"}
+        normalized_name = self.core.normalize_name(name)
+
+        def write():
+            old_data = self.load(normalized_name, restore=True)
+            if old_data is None:
+                return {"success": False, "error": f"Person '{name}' not found"}
+            self.save(normalized_name, old_data, None)
+            return {"success": True, "message": f"Person '{name}' deleted"}
+
+        return await self.run(write, write=True)
+
+    async def search_people(self, query: str, status: Optional[str] = None, limit: int = 20,
+                            phonetic: bool = True, include_archived: bool = False) -> Dict[str, Any]:
+        """Search people by name (fuzzy matching) using the postings table."""
+        core = self.core
+        try:
+            normalized_query, limit, query_postings, phonetic_postings = core.plan_search(query, limit, phonetic)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+        postings = query_postings + phonetic_postings
+        sql = (
+            "SELECT postings.posting, postings.person FROM postings JOIN people ON people.name = postings.person "
+            f"WHERE postings.posting IN ({','.join('?' * len(postings))})"
+        )
+        params: List[Any] = list(postings)
+        if not include_archived:
+            sql += " AND people.archived_at IS NULL"
+        if status:
+            sql += " AND people.status = ?"
+            params.append(core.canonical_status(status))
+
+        def read():
+            trigram_hits: Dict[str, int] = {}
+            phonetic_hits: Dict[str, int] = {}
+            for posting, normalized_name in self.db.execute(sql, params):
+                hits = phonetic_hits if posting in phonetic_postings else trigram_hits
+                hits[normalized_name] = hits.get(normalized_name, 0) + 1
+            ranked = core.rank_search_matches(
+                normalized_query, trigram_hits, phonetic_hits, len(query_postings), len(phonetic_postings)
+            )
+            # Archived people among the returned matches are restored
+            matches = [self.load(normalized_name, restore=True) for normalized_name in ranked[:limit]]
+            return [person_data for person_data in matches if person_data], len(ranked)
+
+        matches, total = await self.run(read, write=include_archived)
+        return {"success": True, "data": matches, "total_matches": total}
+
+    # Archive
+
+    async def archive_people(self, older_than: Any = None, dry_run: bool = False) -> Dict[str, Any]:
+        """Flag not_pursuing people with no activity since older_than as archived."""
+        core = self.core
+        if older_than is None and core.ARCHIVE_AFTER_DAYS > 0:
+            older_than = core.ARCHIVE_AFTER_DAYS
+        cutoff = core.parse_cutoff(older_than)
+        if cutoff is None:
+            return {"success": False, "error": "older_than must be an age in days like '180d' or an ISO date"}
+
+        def write():
+            rows = self.db.execute(
+                "SELECT name, record FROM people WHERE archived_at IS NULL AND status = 'not_pursuing' ORDER BY name"
+            ).fetchall()
+            eligible = [(name, json.loads(record)) for name, record in rows]
+            eligible = [(name, record) for name, record in eligible if core.is_archivable(record, cutoff)]
+            if not dry_run:
+                archived_at = time.time()
+                for normalized_name, record in eligible:
+                    self.move(normalized_name, record, archived_at, "archive")
+            return [normalized_name for normalized_name, _ in eligible]
+
+        people = await self.run(write, write=not dry_run)
+        return {
+            "success": True,
+            "data": {"archived": 0 if dry_run else len(people), "eligible": len(people), "people": people}
+        }
+
+    async def restore_person(self, name: str) -> Dict[str, Any]:
+        """Restore an archived person to the hot set."""
+        if not name:
+            return {"success": False, "error": "Name is required"}
+        normalized_name = self.core.normalize_name(name)
+
+        def write():
+            row = self.db.execute(
+                "SELECT record FROM people WHERE name = ? AND archived_at IS NOT NULL", (normalized_name,)
+            ).fetchone()
+            if row is None:
+                return None
+            record = json.loads(row[0])
+            self.move(normalized_name, record, None, "restore")
+            return record
+
+        person_data = await self.run(write, write=True)
+        if person_data is None:
+            return {"success": False, "error": f"Person '{name}' is not archived"}
+        return {"success": True, "data": person_data}
+
+    # Statistics and analytics
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get statistics about dating history (archived people included)."""
+        def read():
+            hot, archived = self.db.execute(
+                "SELECT COUNT(*) - COUNT(archived_at), COUNT(archived_at) FROM people"
+            ).fetchone()
+            status_counts = dict(self.db.execute("SELECT status, COUNT(*) FROM people GROUP BY status"))
+            how_we_met = dict(self.db.execute(
+                "SELECT how_we_met, COUNT(*) FROM people WHERE how_we_met IS NOT NULL GROUP BY how_we_met"
+            ))
+            return hot, archived, status_counts, how_we_met
+
+        return self.core.statistics_result(*await self.run(read))
+
+    async def get_analytics(self, top: int = 10) -> Dict[str, Any]:
+        """Dashboard analytics from aggregate queries (archived people included)."""
+        core = self.core
+        top = max(1, min(int(top), 100))
+        now = time.time()
+
+        def read():
+            db = self.db
+            total_people, ended_days_sum, ended_count = db.execute(
+                "SELECT COUNT(*), SUM(ended_days), COUNT(ended_days) FROM people"
+            ).fetchone()
+            totals = {
+                "total_dates": db.execute("SELECT COUNT(*) FROM dates").fetchone()[0],
+                "ended_days_sum": ended_days_sum or 0,
+                "ended_count": ended_count
+            }
+            start_months = dict(db.execute(
+                "SELECT start_month, COUNT(*) FROM people WHERE start_month IS NOT NULL GROUP BY start_month"
+            ))
+            date_months = dict(db.execute("SELECT month, COUNT(*) FROM dates WHERE month IS NOT NULL GROUP BY month"))
+            frequency = {
+                str(count): people for count, people in db.execute("SELECT date_count, COUNT(*) FROM people GROUP BY date_count")
+            }
+            # Ties are broken like ZREVRANGE, by member descending
+            top_locations = db.execute(
+                "SELECT location, COUNT(*) AS count FROM dates WHERE location IS NOT NULL "
+                "GROUP BY location ORDER BY count DESC, location DESC LIMIT ?", (top,)
+            ).fetchall()
+            top_dates_per_person = db.execute(
+                "SELECT name, date_count FROM people WHERE date_count > 0 ORDER BY date_count DESC, name DESC LIMIT ?",
+                (top,)
+            ).fetchall()
+            top_ended = db.execute(
+                "SELECT name, ended_days FROM people WHERE ended_days IS NOT NULL "
+                "ORDER BY ended_days DESC, name DESC LIMIT ?", (top,)
+            ).fetchall()
+            # Ongoing relationships at least a day old, i.e. with a positive duration
+            ongoing = db.execute(
+                "SELECT name, ongoing_start FROM people WHERE ongoing_start <= ? ORDER BY ongoing_start, name",
+                (now - 86400,)
+            ).fetchall()
+            durations = core.analytics_durations(top_ended, ongoing, now, top)
+            shown = list(dict.fromkeys([member for member, _ in top_dates_per_person] + [member for member, _ in durations]))
+            display_names = {}
+            for start in range(0, len(shown), 500):
+                chunk = shown[start:start + 500]
+                display_names.update(db.execute(
+                    f"SELECT name, display_name FROM people WHERE name IN ({','.join('?' * len(chunk))})", chunk
+                ))
+            return core.analytics_result(
+                total_people, totals, start_months, date_months, frequency,
+                top_locations, top_dates_per_person, durations, ongoing, now, display_names
+            )
+
+        return await self.run(read)
+
+    async def read_changes(self, since_id: Optional[str] = None, limit: int = 100,
+                           block_ms: Optional[int] = None) -> Dict[str, Any]:
+        """Read change events after since_id from the change log."""
+        core = self.core
+        since_id = str(since_id or "0-0")
+        if since_id == "$":
+            last = await self.run(lambda: self.db.execute("SELECT ms, n FROM changes ORDER BY seq DESC LIMIT 1").fetchone())
+            return {"success": True, "data": [], "last_id": f"{last[0]}-{last[1]}" if last else "0-0", "reset": False}
+        try:
+            since = core.parse_stream_id(since_id)
+            limit = max(1, min(int(limit), 1000))
+            block_ms = min(int(block_ms), 10000) if block_ms else None
+        except (TypeError, ValueError):
+            return {"success": False, "error": "since_id must be a stream id like 1700000000000-0"}
+
+        def read():
+            oldest = self.db.execute("SELECT ms, n FROM changes ORDER BY seq LIMIT 1").fetchone()
+            rows = self.db.execute(
+                "SELECT ms, n, person, op, fields, version FROM changes WHERE ms > ? OR (ms = ? AND n > ?) "
+                "ORDER BY seq LIMIT ?", (since[0], since[0], since[1], limit)
+            ).fetchall()
+            return oldest, rows
+
+        oldest, rows = await self.run(read)
+        deadline = time.monotonic() + (block_ms or 0) / 1000
+        while not rows and time.monotonic() < deadline:
+            await asyncio.sleep(CHANGES_POLL_SECONDS)
+            oldest, rows = await self.run(read)
+
+        events = [
+            core.change_event_result(f"{ms}-{n}", {"person": person, "op": op, "fields": fields, "version": version})
+            for ms, n, person, op, fields, version in rows
+        ]
+        # since_id itself was trimmed, so events after it may have been too
+        reset = bool(oldest) and since != (0, 0) and tuple(oldest) > since
+        return {"success": True, "data": events, "last_id": events[-1]["id"] if events else since_id, "reset": reset}
+
+    # Dates
+
+    async def query_dates(self, from_date: Optional[str] = None, to_date: Optional[str] = None,
+                          person: Optional[str] = None, completed: Optional[bool] = None,
+                          active_only: bool = False, limit: int = 100,
+                          cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Query date entries in `when` order using the dates table."""
+        core = self.core
+        try:
+            min_score, max_score, limit, offset = core.parse_dates_query(from_date, to_date, limit, cursor)
+        except ValueError as e:
+            return {"success": False, "error": str(e)}
+
+        if person:
+            normalized_name = core.normalize_name(person)
+            person_data = await self.run(self.load, normalized_name) or {}
+            if active_only and core.canonical_status(person_data.get("status")) != "active":
+                return {"success": True, "data": [], "next_cursor": None}
+            return core.person_dates_page(normalized_name, person_data, min_score, max_score, completed, limit, offset)
+
+        sql = (
+            "SELECT people.display_name, people.name, people.status, dates.entry FROM dates "
+            "JOIN people ON people.name = dates.person WHERE dates.id IS NOT NULL AND people.archived_at IS NULL"
+        )
+        params: List[Any] = []
+        if min_score != "-inf":
+            sql += " AND dates.when_epoch >= ?"
+            params.append(min_score)
+        if max_score != "+inf":
+            sql += " AND dates.when_epoch <= ?"
+            params.append(max_score)
+        # The cursor is an offset into this ordering, as it is into the Redis dates index
+        sql += " ORDER BY dates.when_epoch, dates.member LIMIT -1 OFFSET ?"
+        params.append(offset)
+
+        def read():
+            results = []
+            for position, (display_name, normalized_name, status, entry) in enumerate(self.db.execute(sql, params)):
+                if active_only and status != "active":
+                    continue
+                entry = core.date_result(json.loads(entry), display_name or normalized_name)
+                if completed is not None and entry["completed"] != completed:
+                    continue
+                results.append(entry)
+                if len(results) == limit:
+                    return results, str(offset + position + 1)
+            return results, None
+
+        results, next_cursor = await self.run(read)
+        return {"success": True, "data": results, "next_cursor": next_cursor}
+
+    def date_owner(self, date_id: str) -> Optional[str]:
+        """The hot person a date id belongs to."""
+        row = self.db.execute(
+            "SELECT dates.person FROM dates JOIN people ON people.name = dates.person "
+            "WHERE dates.id = ? AND people.archived_at IS NULL ORDER BY dates.position DESC LIMIT 1", (date_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    async def get_date_by_id(self, date_id: str) -> Dict[str, Any]:
+        """Look up a single date entry by id."""
+        if not date_id:
+            return {"success": False, "error": "Date id is required"}
+
+        def read():
+            normalized_name = self.date_owner(date_id)
+            person_data = self.load(normalized_name) if normalized_name else None
+            for entry in self.core.parse_dates_field((person_data or {}).get("dates")):
+                if str(entry.get("id")) == date_id:
+                    return {"success": True, "data": self.core.date_result(entry, person_data.get("name") or normalized_name)}
+            return {"success": False, "error": f"Date '{date_id}' not found"}
+
+        return await self.run(read)
+
+    def mutate_dates(self, normalized_name: str, mutate) -> Dict[str, Any]:
+        """Apply a dates mutation from the server module to one person (inside a write transaction)."""
+        old_data = self.load(normalized_name, restore=True)
+        if old_data is None:
+            return {"success": False, "error": f"Person '{normalized_name}' not found", "code": "not_found"}
+        outcome = mutate(self.core.parse_dates_field(old_data.get("dates")))
+        if isinstance(outcome, dict):
+            return outcome
+        entries, affected_entry, _ = outcome
+        new_data = {**old_data, "dates": json.dumps(entries), "last_updated": self.core.get_timestamp()}
+        self.save(normalized_name, old_data, new_data)
+        return {"success": True, "data": self.core.date_result(affected_entry, old_data.get("name") or normalized_name)}
+
+    async def append_date(self, name: str, date: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Append a date entry to a person's dates."""
+        if not name:
+            return {"success": False, "error": "Name is required"}
+        if not isinstance(date, dict):
+            return {"success": False, "error": "Date must be an object"}
+        mutate = self.core.append_mutation(date)
+        return await self.run(self.mutate_dates, self.core.normalize_name(name), mutate, write=True)
+
+    async def patch_date(self, date_id: str, changes: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Update fields of a single date entry in place."""
+        if not date_id:
+            return {"success": False, "error": "Date id is required"}
+        if not isinstance(changes, dict):
+            return {"success": False, "error": "Changes must be an object"}
+        return await self.run(self.mutate_owner_dates, date_id, self.core.patch_mutation(date_id, changes), write=True)
+
+    async def remove_date(self, date_id: str) -> Dict[str, Any]:
+        """Remove a single date entry and return it."""
+        if not date_id:
+            return {"success": False, "error": "Date id is required"}
+        return await self.run(self.mutate_owner_dates, date_id, self.core.remove_mutation(date_id), write=True)
+
+    def mutate_owner_dates(self, date_id: str, mutate) -> Dict[str, Any]:
+        normalized_name = self.date_owner(date_id)
+        if normalized_name is None:
+            return {"success": False, "error": f"Date '{date_id}' not found", "code": "not_found"}
+        return self.mutate_dates(normalized_name, mutate)
+
+    # Maintenance and raw access
+
+    async def rebuild_indexes(self) -> Dict[str, Any]:
+        """Recompute the derived columns, date rows and postings from the person records."""
+        core = self.core
+
+        def write():
+            rows = self.db.execute("SELECT name, record, archived_at FROM people").fetchall()
+            self.db.execute("DELETE FROM dates")
+            self.db.execute("DELETE FROM postings")
+            hot = archived = dates_indexed = 0
+            status_counts: Dict[str, int] = {}
+            how_we_met_counts: Dict[str, int] = {}
+            for normalized_name, record, archived_at in rows:
+                person_data = json.loads(record)
+                if archived_at is None:
+                    hot += 1
+                    entries = core.parse_dates_field(person_data.get("dates"))
+                    if not all(entry.get("id") for entry in entries):
+                        # Legacy entries without an id get one, as with Redis
+                        new_data = {**person_data, "dates": core.serialize_dates_field(entries)}
+                        self.save(normalized_name, person_data, new_data)
+                        person_data = new_data
+                    dates_indexed += sum(1 for entry in core.parse_dates_field(person_data.get("dates")) if entry.get("id"))
+                else:
+                    archived += 1
+                self.db.execute(
+                    "UPDATE people SET display_name = ?, status = ?, how_we_met = ?, start_month = ?, date_count = ?, "
+                    "ended_days = ?, ongoing_start = ? WHERE name = ?",
+                    (*self.person_columns(person_data), normalized_name)
+                )
+                self.write_dates(normalized_name, person_data)
+                self.db.executemany(
+                    "INSERT OR IGNORE INTO postings (posting, person) VALUES (?, ?)",
+                    [(posting, normalized_name) for posting in core.get_search_postings(normalized_name)]
+                )
+                status = core.canonical_status(person_data.get("status"))
+                status_counts[status] = status_counts.get(status, 0) + 1
+                how_we_met = core.effective_how_we_met(person_data)
+                if how_we_met:
+                    how_we_met_counts[how_we_met] = how_we_met_counts.get(how_we_met, 0) + 1
+            return {
+                "people_indexed": hot,
+                "people_archived": archived,
+                "dates_indexed": dates_indexed,
+                "status_distribution": status_counts,
+                "common_how_we_met": how_we_met_counts
+            }
+
+        return {"success": True, "data": await self.run(write, write=True)}
+
+    async def hset(self, key: str, field: str, value: str) -> Dict[str, Any]:
+        """Set one field of an existing person record."""
+        if not key.startswith("dating:person:"):
+            return {"success": False, "error": "Only person keys (dating:person:<name>) exist with the sqlite backend"}
+        normalized_name = key[len("dating:person:"):]
+
+        def write():
+            old_data = self.load(normalized_name, restore=True)
+            if old_data is None:
+                return {"success": False, "error": f"Key '{key}' not found"}
+            stored = value
+            if field == "dates":
+                # Entries need an id to be in the dates table's time index
+                stored = self.core.serialize_dates_field(value)
+            self.save(normalized_name, old_data, {**old_data, field: stored})
+            return {"success": True, "message": f"Set {field} on {key}"}
+
+        return await self.run(write, write=True)
+
+    async def hgetall(self, key: str) -> Dict[str, Any]:
+        """Read a person record by key."""
+        person_data = await self.run(self.load, key[len("dating:person:"):]) if key.startswith("dating:person:") else None
+        if not person_data:
+            return {"success": False, "error": f"Key '{key}' not found"}
+        return {"success": True, "data": person_data}
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Parity test for the storage backends.
+
+Random sequences of tool calls (including invalid ones) run against the
+Redis backend on fakeredis and the SQLite backend on a temporary file, and
+every result must match apart from timestamps and change event ids. A
+second test checks that writers on separate SQLite connections, as from
+separate server processes, don't lose updates, and a third that reads
+don't wait for another connection's write transaction. The SQLite store
+must also see server settings rebound after it was built, and on both
+backends legacy dates without an id must get one and be indexed.
+"""
+import asyncio
+import importlib.util
+import json
+import os
+import random
+import sqlite3
+import sys
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_server.py")
+NAMES = ["Ann Lee", "Anna", "Bea", "Beatrice", "Cy", "Dee Dee", "Cristina", "Christina", "Zoë"]
+STATUSES = ["active", "paused", "exploring", "not_pursuing", "past", None]
+PLACES = ["Hinge", "bar", "work", "", None]
+# Values that legitimately differ between backends
+VOLATILE_FIELDS = {"created_at", "last_updated", "last_id"}
+# Date entries as records from before date ids hold them
+LEGACY_DATES = [{"when": "2024-05-03T19:00", "where": "bar"}, {"when": "sometime in spring", "where": "park"}]
+
+
+def load_server(backend, tmp_path, label):
+    spec = importlib.util.spec_from_file_location(f"redis_dating_server_{label}", SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered like an import, as the SQLite store gets the server module from sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    module.redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    module.STORAGE_BACKEND = backend
+    module.SQLITE_PATH = str(tmp_path / "dating.sqlite3")
+    return module
+
+
+def random_calls(seed, count=200):
+    """A random tool call sequence over a small set of overlapping names."""
+    rnd = random.Random(seed)
+    date_ids = ["missing"]
+    calls = []
+    for i in range(count):
+        name = rnd.choice(NAMES)
+        when = f"20{rnd.randint(19, 25)}-0{rnd.randint(1, 9)}-{rnd.randint(10, 28)}"
+        tool = rnd.choice([
+            "create_person", "create_person", "create_person", "update_person", "get_person", "get_people",
+            "update_people", "list_people", "delete_person", "search_people", "get_statistics", "get_analytics",
+            "read_changes", "query_dates", "get_date_by_id", "append_date", "append_date", "patch_date",
+            "remove_date", "HSET", "HGETALL", "archive_people"
+        ])
+        if tool == "create_person":
+            args = {"name": name, "status": rnd.choice(STATUSES), "how_we_met": rnd.choice(PLACES),
+                    "start_date": rnd.choice([None, "2020-01-05", when]), "end_date": rnd.choice([None, "2024-02-01"]),
+                    "dates": rnd.choice([None, [{"id": f"c{i}", "when": when, "where": rnd.choice(PLACES)}]])}
+            args = {key: value for key, value in args.items() if value is not None}
+            date_ids.append(f"c{i}")
+        elif tool == "update_person":
+            args = {"name": name, "status": rnd.choice(STATUSES[:-1]), "details": f"d{i}"}
+        elif tool == "get_person":
+            args = {"name": name.upper()}
+        elif tool == "get_people":
+            args = {"names": rnd.sample(NAMES, 3) + [""], "fields": rnd.choice([None, ["status", "dates"]])}
+        elif tool == "update_people":
+            args = {"updates": [{"name": name, "how_we_met": rnd.choice(["app", "gym"])}, {"name": name, "status": "zzz"}]}
+        elif tool == "list_people":
+            args = {"status": rnd.choice([None, "active", "past"]), "include_details": rnd.random() < 0.5,
+                    "limit": rnd.choice([None, 2]), "cursor": rnd.choice([None, "b"])}
+        elif tool == "delete_person":
+            args = {"name": name}
+        elif tool == "search_people":
+            args = {"query": rnd.choice(["ann", "an", "kristina", "bea", "zz", "zoe"]),
+                    "status": rnd.choice([None, "active", "not_pursuing"]), "limit": rnd.choice([1, 20]),
+                    "include_archived": rnd.random() < 0.3}
+        elif tool == "get_analytics":
+            args = {"top": rnd.choice([1, 10])}
+        elif tool == "read_changes":
+            args = {"since_id": "0-0", "limit": 1000}
+        elif tool == "query_dates":
+            args = {"from": rnd.choice([None, "2021-01-01"]), "to": rnd.choice([None, "2024-06-01", "nonsense"]),
+                    "completed": rnd.choice([None, True]), "active_only": rnd.random() < 0.3,
+                    "limit": rnd.choice([2, 100]), "cursor": rnd.choice([None, "1"]),
+                    "person": rnd.choice([None, None, name])}
+        elif tool == "append_date":
+            args = {"name": name, "date": {"id": f"a{i}", "when": when, "where": rnd.choice(PLACES)}}
+            date_ids.append(f"a{i}")
+        elif tool in ("get_date_by_id", "remove_date"):
+            args = {"date_id": rnd.choice(date_ids)}
+        elif tool == "patch_date":
+            args = {"date_id": rnd.choice(date_ids), "changes": {"completed": True, "when": when}}
+        elif tool in ("HSET", "HGETALL"):
+            args = {"key": f"dating:person:{name.lower()}", "field": "status", "value": rnd.choice(["active", "not_pursuing"])}
+        elif tool == "archive_people":
+            args = {"older_than": rnd.choice(["0d", "2099-01-01", "30d"])}
+        else:
+            args = {}
+        calls.append((tool, args))
+    return calls + [("get_statistics", {}), ("rebuild_indexes", {}), ("get_analytics", {"top": 20}),
+                    ("list_people", {}), ("query_dates", {"limit": 1000}), ("read_changes", {"limit": 1000})]
+
+
+def comparable(value):
+    """Drop timestamps and change event ids."""
+    if isinstance(value, dict):
+        is_event = "op" in value and "version" in value
+        return {
+            key: comparable(item) for key, item in value.items()
+            if key not in VOLATILE_FIELDS and not (is_event and key == "id")
+        }
+    if isinstance(value, list):
+        return [comparable(item) for item in value]
+    return value
+
+
+async def call(server, tool, args):
+    return json.loads((await server.call_tool(tool, args))[0].text)
+
+
+async def compare_backends(seed, tmp_path):
+    redis_server = load_server("redis", tmp_path, f"redis_{seed}")
+    sqlite_server = load_server("sqlite", tmp_path, f"sqlite_{seed}")
+    for tool, args in random_calls(seed):
+        if tool == "HSET":
+            # HSET on a missing key creates a bare Redis hash, which the SQLite backend refuses
+            person = args["key"].split(":", 2)[2]
+            if not (await call(redis_server, "get_person", {"name": person}))["success"]:
+                continue
+            await call(sqlite_server, "get_person", {"name": person})
+        expected = await call(redis_server, tool, args)
+        actual = await call(sqlite_server, tool, args)
+        assert comparable(actual) == comparable(expected), (seed, tool, args)
+    sqlite_server.get_store().close()
+
+
+async def concurrent_appends(tmp_path):
+    servers = [load_server("sqlite", tmp_path, f"writer_{i}") for i in range(2)]
+    stores = [server.get_store() for server in servers]
+    await stores[0].create_person("Alice")
+
+    async def writer(i):
+        for n in range(25):
+            result = await stores[i % 2].append_date("Alice", {"where": f"w{i}-{n}", "when": "2024-05-01"})
+            assert result["success"], result
+
+    await asyncio.gather(*(writer(i) for i in range(8)))
+    person = (await stores[1].get_person("Alice"))["data"]
+    assert len(json.loads(person["dates"])) == 200
+    assert person["version"] == "201"
+    for store in stores:
+        store.close()
+
+
+async def reads_beside_a_writer(tmp_path):
+    server = load_server("sqlite", tmp_path, "reader")
+    store = server.get_store()
+    await store.create_person("Alice")
+    # Another process in the middle of a write transaction
+    writer = sqlite3.connect(server.SQLITE_PATH, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        assert (await store.get_person("Alice"))["success"]
+        assert (await store.get_people(["Alice", "Bob"]))["found"] == 1
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+    store.close()
+
+
+async def settings_rebound_after_start(tmp_path):
+    server = load_server("sqlite", tmp_path, "rebound")
+    store = server.get_store()
+    server.CHANGES_STREAM_MAXLEN = 2
+    for name in ("Ann", "Bea", "Cy"):
+        await store.create_person(name)
+    changes = await store.read_changes(limit=10)
+    assert [event["person"] for event in changes["data"]] == ["bea", "cy"]
+    store.close()
+
+
+async def write_legacy_dates(server, normalized_name):
+    """Replace a person's dates with LEGACY_DATES without touching the dates index."""
+    if server.STORAGE_BACKEND == "redis":
+        await server.get_redis_client().hset(f"dating:person:{normalized_name}", "dates", json.dumps(LEGACY_DATES))
+        return
+    store = server.get_store()
+    record = {**store.load(normalized_name), "dates": json.dumps(LEGACY_DATES)}
+    store.db.execute("UPDATE people SET record = ? WHERE name = ?", (json.dumps(record), normalized_name))
+    store.write_dates(normalized_name, record)
+
+
+async def legacy_dates_without_ids(tmp_path):
+    may = {"from": "2024-05-01", "to": "2024-05-31T23:59:59"}
+    # Where query_dates files dates whose `when` doesn't parse
+    epoch = {"from": "1970-01-01T00:00:00Z", "to": "1970-01-01T00:00:00Z"}
+    for backend in ("redis", "sqlite"):
+        server = load_server(backend, tmp_path, f"legacy_{backend}")
+        for name in ("Ann", "Bea"):
+            assert (await call(server, "create_person", {"name": name}))["success"]
+        await write_legacy_dates(server, "ann")
+        assert (await call(server, "query_dates", may))["data"] == [], backend
+
+        assert (await call(server, "rebuild_indexes", {}))["success"]
+        # Raw writes of id-less dates are indexed straight away
+        hset = {"key": "dating:person:bea", "field": "dates", "value": json.dumps(LEGACY_DATES)}
+        assert (await call(server, "HSET", hset))["success"]
+
+        for window, where in ((may, "bar"), (epoch, "park")):
+            entries = (await call(server, "query_dates", window))["data"]
+            assert sorted(entry["person_name"] for entry in entries) == ["Ann", "Bea"], (backend, entries)
+            assert all(entry["id"] and entry["where"] == where for entry in entries), (backend, entries)
+
+        # So are those of a legacy record restored from the archive
+        assert (await call(server, "create_person", {"name": "Cy", "status": "past", "end_date": "2020-01-01"}))["success"]
+        await write_legacy_dates(server, "cy")
+        assert (await call(server, "archive_people", {"older_than": "2099-01-01"}))["data"]["people"] == ["cy"]
+        assert (await call(server, "get_person", {"name": "Cy"}))["success"]
+        entries = (await call(server, "query_dates", may))["data"]
+        assert sorted(entry["person_name"] for entry in entries) == ["Ann", "Bea", "Cy"], (backend, entries)
+        if backend == "sqlite":
+            server.get_store().close()
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_sqlite_backend_matches_redis(seed, tmp_path):
+    asyncio.run(compare_backends(seed, tmp_path))
+
+
+def test_sqlite_writers_on_separate_connections_are_not_lost(tmp_path):
+    asyncio.run(concurrent_appends(tmp_path))
+
+
+def test_sqlite_reads_dont_wait_for_writers(tmp_path):
+    asyncio.run(reads_beside_a_writer(tmp_path))
+
+
+def test_sqlite_store_sees_rebound_settings(tmp_path):
+    asyncio.run(settings_rebound_after_start(tmp_path))
+
+
+def test_legacy_dates_without_ids_are_indexed(tmp_path):
+    asyncio.run(legacy_dates_without_ids(tmp_path))
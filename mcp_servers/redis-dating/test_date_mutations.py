@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Concurrency stress test for the atomic date tools (append_date, patch_date, remove_date).
+
+Many writers hammer the same person at once; every append, patch and removal
+must survive. Writers are asyncio tasks sharing one client, as in the
+server. A person record created by a raw HSET must land in the date and
+lookup indexes too. Runs against fakeredis by default, or a real Redis when
+REDIS_TEST_HOST is set (the test database is flushed).
+"""
+import asyncio
+import importlib.util
+import json
+import os
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_server.py")
+WRITERS = 8
+APPENDS_PER_WRITER = 25
+
+
+def load_server():
+    spec = importlib.util.spec_from_file_location("redis_dating_server", SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if os.getenv("REDIS_TEST_HOST"):
+        from redis import asyncio as aioredis
+        module.redis_client = aioredis.Redis(
+            host=os.getenv("REDIS_TEST_HOST"),
+            port=int(os.getenv("REDIS_TEST_PORT", "6379")),
+            db=int(os.getenv("REDIS_TEST_DB", "15")),
+            decode_responses=True
+        )
+    else:
+        module.redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return module
+
+
+async def run_concurrently(worker, count):
+    """Run worker(i) as `count` tasks on the event loop at once."""
+    await asyncio.gather(*(worker(i) for i in range(count)))
+
+
+async def stored_dates(server, name):
+    raw = await server.get_redis_client().hget(server.get_person_key(name), "dates")
+    return json.loads(raw) if raw else []
+
+
+async def concurrent_appends():
+    server = load_server()
+    r = server.get_redis_client()
+    await r.flushdb()
+    await server.create_person("Alice")
+
+    async def writer(i):
+        for n in range(APPENDS_PER_WRITER):
+            result = await server.append_date("Alice", {"where": f"w{i}-{n}", "when": "2024-05-01"})
+            assert result["success"], result
+
+    await run_concurrently(writer, WRITERS)
+
+    dates = await stored_dates(server, "Alice")
+    assert len(dates) == WRITERS * APPENDS_PER_WRITER
+    assert len({entry["id"] for entry in dates}) == len(dates)
+    assert await r.zcard(server.DATES_INDEX_KEY) == len(dates)
+    assert await r.hlen(server.DATE_OWNER_KEY) == len(dates)
+
+
+async def concurrent_patches_and_removals():
+    server = load_server()
+    r = server.get_redis_client()
+    await r.flushdb()
+    await server.create_person("Bea")
+    ids = [
+        (await server.append_date("Bea", {"where": "start", "when": "2024-06-01", "completed": False}))["data"]["id"]
+        for _ in range(WRITERS * 2)
+    ]
+    to_patch, to_remove = ids[:WRITERS], ids[WRITERS:]
+
+    async def writer(i):
+        patched = await server.patch_date(to_patch[i], {"where": f"patched-{i}", "completed": True})
+        assert patched["success"], patched
+        removed = await server.remove_date(to_remove[i])
+        assert removed["success"], removed
+        appended = await server.append_date("Bea", {"where": f"new-{i}", "when": "2024-07-01"})
+        assert appended["success"], appended
+
+    await run_concurrently(writer, WRITERS)
+
+    dates = {entry["id"]: entry for entry in await stored_dates(server, "Bea")}
+    assert len(dates) == WRITERS * 2
+    for i, date_id in enumerate(to_patch):
+        assert dates[date_id]["where"] == f"patched-{i}"
+        assert dates[date_id]["completed"] is True
+    assert not set(to_remove) & set(dates)
+    assert await r.zcard(server.DATES_INDEX_KEY) == len(dates)
+    for missing in (await server.remove_date(to_remove[0]), await server.patch_date(to_remove[0], {"where": "x"}),
+                    await server.append_date("Nobody", {"where": "x", "when": "2024-07-01"})):
+        assert missing["code"] == "not_found", missing
+
+
+async def raw_hset_creating_a_person():
+    server = load_server()
+    r = server.get_redis_client()
+    await r.flushdb()
+    dates = json.dumps([{"id": "d1", "when": "2024-05-01T19:00", "where": "bar"}])
+    assert (await server.hset("dating:person:zed", "dates", dates))["success"]
+
+    changes = (await server.read_changes())["data"]
+    assert [(event["person"], event["op"]) for event in changes] == [("zed", "create")]
+    assert (await server.get_date_by_id("d1"))["success"]
+    assert [entry["id"] for entry in (await server.query_dates())["data"]] == ["d1"]
+    assert (await server.get_statistics())["data"]["total_people"] == 1
+    assert await r.sismember(server.get_status_index_key("active"), "zed")
+    assert len((await server.search_people("zed"))["data"]) == 1
+
+
+def test_concurrent_appends_are_not_lost():
+    asyncio.run(concurrent_appends())
+
+
+def test_concurrent_patches_and_removals_are_not_lost():
+    asyncio.run(concurrent_patches_and_removals())
+
+
+def test_raw_hset_creating_a_person_updates_the_indexes():
+    asyncio.run(raw_hset_creating_a_person())
+
+
+if __name__ == "__main__":
+    test_concurrent_appends_are_not_lost()
+    test_concurrent_patches_and_removals_are_not_lost()
+    test_raw_hset_creating_a_person_updates_the_indexes()
+    print("✅ No lost date updates under concurrency")
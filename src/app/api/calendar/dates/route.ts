@@ -9,11 +9,19 @@ export async function GET(request: Request) {
         const personName = searchParams.get("person_name");
         const activeOnly = searchParams.get("active_only") === "true";
         const completed = searchParams.get("completed");
+        const from = searchParams.get("from");
+        const to = searchParams.get("to");
+        const limit = searchParams.get("limit");
+        const cursor = searchParams.get("cursor");
 
         const params = new URLSearchParams();
         if (personName) params.append("person_name", personName);
         if (activeOnly) params.append("active_only", "true");
         if (completed !== null) params.append("completed", completed);
+        if (from) params.append("from", from);
+        if (to) params.append("to", to);
+        if (limit) params.append("limit", limit);
+        if (cursor) params.append("cursor", cursor);
 
         const response = await fetch(
             `${PYTHON_BACKEND_URL}/calendar/dates?${params.toString()}`,
@@ -20,6 +20,7 @@ interface CalendarDate extends DateLogEntry {
 
 export function CalendarPage() {
     const [viewMode, setViewMode] = useState<ViewMode>("calendar");
+    const [currentMonth, setCurrentMonth] = useState(new Date());
     const [filterMode, setFilterMode] = useState<FilterMode>("all");
     const [dates, setDates] = useState<CalendarDate[]>([]);
     const [people, setPeople] = useState<Person[]>([]);
@@ -39,6 +40,15 @@ export function CalendarPage() {
             } else if (filterMode !== "all") {
                 params.append("person_name", filterMode);
             }
+            if (viewMode === "calendar") {
+                // Only pull the visible month; the list view still loads everything.
+                // The server reads a `when` without a zone as UTC but we show it as local
+                // time, so pad the window by a day; DatingCalendar keeps the local month only.
+                const monthStart = new Date(currentMonth.getFullYear(), currentMonth.getMonth(), 0);
+                const monthEnd = new Date(currentMonth.getFullYear(), currentMonth.getMonth() + 1, 2);
+                params.append("from", monthStart.toISOString());
+                params.append("to", new Date(monthEnd.getTime() - 1).toISOString());
+            }
 
             const response = await fetch(`/api/calendar/dates?${params.toString()}`);
             const data = await response.json();
@@ -59,7 +69,7 @@ export function CalendarPage() {
         } finally {
             setIsLoading(false);
         }
-    }, [filterMode]);
+    }, [filterMode, viewMode, currentMonth]);
 
     const fetchPeople = useCallback(async () => {
         try {
@@ -160,6 +170,8 @@ export function CalendarPage() {
                         <DatingCalendar
                             dates={dates || []}
                             people={people || []}
+                            currentMonth={currentMonth}
+                            onMonthChange={setCurrentMonth}
                             onDateClick={handleDateClick}
                             onDateUpdated={handleDateUpdated}
                         />
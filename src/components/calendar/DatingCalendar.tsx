@@ -26,6 +26,8 @@ interface CalendarDate extends DateLogEntry {
 interface DatingCalendarProps {
     dates: CalendarDate[];
     people: Person[];
+    currentMonth: Date;
+    onMonthChange: (month: Date) => void;
     onDateClick: (date: CalendarDate) => void;
     onDateUpdated: () => void;
 }
@@ -33,10 +35,11 @@ interface DatingCalendarProps {
 export function DatingCalendar({
     dates,
     people,
+    currentMonth,
+    onMonthChange,
     onDateClick,
     onDateUpdated,
 }: DatingCalendarProps) {
-    const [currentMonth, setCurrentMonth] = useState(new Date());
     const [activeId, setActiveId] = useState<string | null>(null);
 
     const sensors = useSensors(
@@ -85,15 +88,13 @@ export function DatingCalendar({
     }, [dates, currentMonth]);
 
     const navigateMonth = (direction: "prev" | "next") => {
-        setCurrentMonth((prev) => {
-            const newDate = new Date(prev);
-            if (direction === "prev") {
-                newDate.setMonth(prev.getMonth() - 1);
-            } else {
-                newDate.setMonth(prev.getMonth() + 1);
-            }
-            return newDate;
-        });
+        const newDate = new Date(currentMonth.getFullYear(), currentMonth.getMonth(), 1);
+        if (direction === "prev") {
+            newDate.setMonth(newDate.getMonth() - 1);
+        } else {
+            newDate.setMonth(newDate.getMonth() + 1);
+        }
+        onMonthChange(newDate);
     };
 
     const weekDays = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"];